@@ -0,0 +1,279 @@
+"""
+Benchmark cases.
+
+A case is a setup function registered with `@case`. It receives the
+benchmark environment plus one combination of its sweep parameters and
+returns the zero-argument callable to time; all setup happens outside
+the timed region.
+"""
+
+from __future__ import annotations
+
+import itertools
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Sequence
+
+from benchmarks.corpus import Corpus
+from core.audit.emitter import AuditEventEmitter
+from core.audit.sinks import (
+    AuditSink,
+    GroupCommitJsonFileSink,
+    JsonFileSink,
+    StdoutSink,
+)
+from core.decision import Decision
+from core.enforcement.data import detect_pii
+from core.enforcement.cache import DecisionCache
+from core.enforcement.keywords import compile_keyword_rules
+from core.enforcement.model import enforce_model_policy
+from core.enforcement.orchestrator import EnforcementOrchestrator
+from core.enforcement.region import enforce_region_policy
+from core.enforcement.tools import enforce_tool_policy
+from core.pii.parallel import ParallelScanner
+from core.pii.scanner import scan_pii
+from core.policy.compiled import compile_policy
+from core.redaction.engine import RedactionEngine
+from core.telemetry.instrumentation import Instrumentation
+
+TEXT_SIZES = (256, 4096, 65536)
+PATTERN_COUNTS = (1, 10, 100, 1000)
+SINKS = ("null", "stdout", "file", "file_fsync", "group_commit", "stdout+file")
+
+
+@dataclass(frozen=True)
+class BenchEnv:
+    corpus: Corpus
+    # Scratch directory for file sinks, removed after the run
+    tmpdir: Path
+    cleanups: List[Callable[[], None]] = field(default_factory=list)
+
+    def close(self) -> None:
+        while self.cleanups:
+            self.cleanups.pop()()
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    group: str
+    setup: Callable[..., Callable[[], Any]]
+    sweep: Dict[str, Sequence[Any]]
+
+    def variants(self) -> Iterator[Dict[str, Any]]:
+        keys = list(self.sweep)
+        for values in itertools.product(*(self.sweep[key] for key in keys)):
+            yield dict(zip(keys, values))
+
+
+CASES: List[Case] = []
+
+
+def case(name: str, *, group: str, **sweep: Sequence[Any]):
+    """Register a benchmark case, swept over every parameter combination."""
+
+    def register(setup: Callable[..., Callable[[], Any]]):
+        CASES.append(Case(name=name, group=group, setup=setup, sweep=sweep))
+        return setup
+
+    return register
+
+
+class NullSink(AuditSink):
+    """Discards events: isolates pipeline cost from audit I/O."""
+
+    def write(self, event: Dict[str, Any]) -> None:
+        pass
+
+    def write_encoded(self, data: bytes, event: Dict[str, Any]) -> None:
+        pass
+
+
+def make_sinks(name: str, env: BenchEnv) -> List[AuditSink]:
+    """
+    Build the sinks for a sink configuration.
+    Stdout is redirected to /dev/null by the runner.
+    """
+
+    path = str(env.tmpdir / f"{name}.jsonl")
+
+    if name == "null":
+        return [NullSink()]
+    if name == "stdout":
+        return [StdoutSink()]
+    if name == "file":
+        return [JsonFileSink(path)]
+    if name == "file_fsync":
+        return [JsonFileSink(path, fsync=True)]
+    if name == "group_commit":
+        sink = GroupCommitJsonFileSink(path, fsync=False)
+        env.cleanups.append(sink.close)
+        return [sink]
+    if name == "stdout+file":
+        return [StdoutSink(), JsonFileSink(path)]
+
+    raise ValueError(f"Unknown sink configuration '{name}'")
+
+
+# ----------------------------------------------------------------------
+# Stages
+# ----------------------------------------------------------------------
+
+
+@case("stage.model", group="stages", patterns=PATTERN_COUNTS)
+def _model(env: BenchEnv, *, patterns: int):
+    policy = env.corpus.policy(model_patterns=patterns)
+    # Last allow entry: the worst case for a sequential scan
+    requested = policy["model"]["allow"][-1]
+    return lambda: enforce_model_policy(policy, requested)
+
+
+@case("stage.region", group="stages")
+def _region(env: BenchEnv):
+    policy = env.corpus.policy()
+    return lambda: enforce_region_policy(policy, "US")
+
+
+@case("stage.tools", group="stages", tools=(10, 1000))
+def _tools(env: BenchEnv, *, tools: int):
+    policy = env.corpus.policy(tools=tools)
+    name = env.corpus.tool_names(tools)[-1]
+    return lambda: enforce_tool_policy(policy, tool_name=name)
+
+
+@case("stage.detect_pii", group="stages", text_size=TEXT_SIZES, pii_per_kb=(0, 4))
+def _detect_pii(env: BenchEnv, *, text_size: int, pii_per_kb: int):
+    text = env.corpus.text(text_size, pii_per_kb=pii_per_kb)
+    return lambda: detect_pii(text)
+
+
+@case("stage.scan_pii_large", group="stages", mode=("serial", "parallel"))
+def _scan_pii_large(env: BenchEnv, *, mode: str):
+    text = env.corpus.text(4 * 1024 * 1024)
+    if mode == "serial":
+        return lambda: scan_pii(text)
+
+    scanner = ParallelScanner(threshold=0, chunk_size=512 * 1024)
+    env.cleanups.append(scanner.close)
+    return lambda: scanner.scan(text)
+
+
+@case("stage.keywords", group="stages", terms=(100, 10_000, 100_000), text_size=TEXT_SIZES)
+def _keywords(env: BenchEnv, *, terms: int, text_size: int):
+    rules = compile_keyword_rules(
+        {"data": {"keywords": {"terms": env.corpus.keywords(terms), "action": "redact"}}}
+    )
+    text = env.corpus.text(text_size)
+    return lambda: rules.find(text)
+
+
+@case("stage.redact", group="stages", text_size=TEXT_SIZES, pii_per_kb=(0, 4))
+def _redact(env: BenchEnv, *, text_size: int, pii_per_kb: int):
+    engine = RedactionEngine()
+    text = env.corpus.text(text_size, pii_per_kb=pii_per_kb)
+    return lambda: engine.redact(text)
+
+
+# ----------------------------------------------------------------------
+# Sinks
+# ----------------------------------------------------------------------
+
+
+@case("sink.emit", group="sinks", sink=SINKS)
+def _sink(env: BenchEnv, *, sink: str):
+    sinks = make_sinks(sink, env)
+    emitter = AuditEventEmitter(sinks)
+    decision = Decision.allow(
+        reason="Model is permitted by policy",
+        policy_section="model",
+        metadata={"model": "gpt-4.1"},
+    )
+    context = {"request_id": "bench", "tenant": "acme"}
+    return lambda: emitter.emit(decision, context)
+
+
+# ----------------------------------------------------------------------
+# Full pipeline
+# ----------------------------------------------------------------------
+
+
+@case(
+    "pipeline.enforce",
+    group="pipeline",
+    text_size=(0, 1024, 16384),
+    sink=("null", "file"),
+    audit_mode=("per_stage", "aggregate"),
+)
+def _enforce(env: BenchEnv, *, text_size: int, sink: str, audit_mode: str):
+    sinks = make_sinks(sink, env)
+    orchestrator = EnforcementOrchestrator(
+        audit_emitter=AuditEventEmitter(sinks),
+        audit_mode=audit_mode,
+    )
+    policy = env.corpus.policy()
+    text = env.corpus.text(text_size) if text_size else None
+
+    return lambda: orchestrator.enforce(
+        policy,
+        requested_model="gpt-4.1",
+        region="EU",
+        tool_name="tool_0001",
+        text=text,
+    )
+
+
+@case("pipeline.enforce_compiled", group="pipeline", text_size=(0, 1024))
+def _enforce_compiled(env: BenchEnv, *, text_size: int):
+    orchestrator = EnforcementOrchestrator(audit_emitter=AuditEventEmitter([NullSink()]))
+    compiled = compile_policy(env.corpus.policy())
+    text = env.corpus.text(text_size) if text_size else None
+
+    return lambda: orchestrator.enforce(
+        compiled,
+        requested_model="gpt-4.1",
+        region="EU",
+        tool_name="tool_0001",
+        text=text,
+    )
+
+
+@case("pipeline.enforce_decision_cache", group="pipeline", cache=("off", "on"))
+def _enforce_decision_cache(env: BenchEnv, *, cache: str):
+    orchestrator = EnforcementOrchestrator(
+        audit_emitter=AuditEventEmitter([NullSink()]),
+        decision_cache=DecisionCache() if cache == "on" else None,
+    )
+    compiled = compile_policy(env.corpus.policy(model_patterns=1000, tools=1000))
+
+    return lambda: orchestrator.enforce(
+        compiled,
+        requested_model="gpt-4.1",
+        region="EU",
+        tool_name="tool_0999",
+    )
+
+
+@case("pipeline.enforce_batch", group="pipeline", batch=(100,))
+def _enforce_batch(env: BenchEnv, *, batch: int):
+    orchestrator = EnforcementOrchestrator(audit_emitter=AuditEventEmitter([NullSink()]))
+    compiled = compile_policy(env.corpus.policy())
+    requests = env.corpus.requests(batch)
+    return lambda: orchestrator.enforce_batch(compiled, requests)
+
+
+@case("pipeline.enforce_instrumented", group="pipeline", instrumentation=("off", "on"))
+def _enforce_instrumented(env: BenchEnv, *, instrumentation: str):
+    instr = Instrumentation() if instrumentation == "on" else None
+    orchestrator = EnforcementOrchestrator(
+        audit_emitter=AuditEventEmitter([NullSink()], instrumentation=instr),
+        instrumentation=instr,
+    )
+    compiled = compile_policy(env.corpus.policy())
+
+    return lambda: orchestrator.enforce(
+        compiled,
+        requested_model="gpt-4.1",
+        region="EU",
+        tool_name="tool_0001",
+        text="Hello there",
+    )
@@ -0,0 +1,147 @@
+"""
+Reproducible synthetic corpus for benchmarks.
+
+Every generator derives its own random stream from the corpus seed and
+its arguments, so a given (seed, arguments) pair always produces the
+same data, independent of which other benchmarks ran before it.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Dict, List
+
+DEFAULT_SEED = 20240601
+
+_WORDS = (
+    "the model request policy governance audit region tenant response "
+    "summary invoice customer account support ticket deployment service "
+    "latency budget review approval workflow document report quarterly"
+).split()
+
+_REGIONS = ["IN", "EU", "US", "UK", "SG", "JP", "BR", "AU"]
+
+
+class Corpus:
+    def __init__(self, seed: int = DEFAULT_SEED):
+        self.seed = seed
+
+    def _rng(self, *key: Any) -> random.Random:
+        return random.Random(":".join(str(part) for part in (self.seed,) + key))
+
+    # ------------------------------------------------------------------
+    # Text
+    # ------------------------------------------------------------------
+
+    def text(self, size: int, *, pii_per_kb: float = 2.0) -> str:
+        """
+        Return prose of exactly `size` characters, with about
+        `pii_per_kb` emails, phone numbers and card numbers per 1024
+        characters.
+        """
+        rng = self._rng("text", size, pii_per_kb)
+        pii_probability = pii_per_kb / 1024 * 6  # ~6 chars per token
+
+        parts: List[str] = []
+        length = 0
+        while length < size:
+            if rng.random() < pii_probability:
+                token = self._pii(rng)
+            else:
+                token = rng.choice(_WORDS)
+                if rng.random() < 0.08:
+                    token += rng.choice(".,;:")
+            parts.append(token)
+            length += len(token) + 1
+
+        return " ".join(parts)[:size]
+
+    @staticmethod
+    def _pii(rng: random.Random) -> str:
+        kind = rng.randrange(3)
+        if kind == 0:
+            user = "".join(rng.choice("abcdefghijklmnop.") for _ in range(8)).strip(".")
+            return f"{user or 'user'}@example{rng.randrange(100)}.com"
+        if kind == 1:
+            return "".join(rng.choice("0123456789") for _ in range(10))
+        return "".join(rng.choice("0123456789") for _ in range(16))
+
+    # ------------------------------------------------------------------
+    # Policies and requests
+    # ------------------------------------------------------------------
+
+    def model_patterns(self, count: int) -> List[str]:
+        """
+        Return `count` model patterns: three quarters literal names, one
+        quarter globs.
+        """
+        rng = self._rng("model_patterns", count)
+        patterns = []
+        for i in range(count):
+            family = rng.choice(["gpt", "llama", "claude", "mistral", "gemini"])
+            if i % 4 == 3:
+                patterns.append(f"{family}-{i}-*")
+            else:
+                patterns.append(f"{family}-{i}.{rng.randrange(10)}")
+        return patterns
+
+    def keywords(self, count: int) -> List[str]:
+        """
+        Return `count` distinct restricted terms, one or two words each.
+        A few corpus words are included so that prose text has matches.
+        """
+        rng = self._rng("keywords", count)
+        terms = _WORDS[: min(count, 4)]
+        while len(terms) < count:
+            stem = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(7))
+            if rng.random() < 0.25:
+                stem += " " + rng.choice(_WORDS)
+            terms.append(f"{stem}{len(terms)}")
+        return terms
+
+    def tool_names(self, count: int) -> List[str]:
+        return [f"tool_{i:04d}" for i in range(count)]
+
+    def policy(
+        self,
+        *,
+        model_patterns: int = 10,
+        tools: int = 10,
+        pii_action: str = "redact",
+    ) -> Dict[str, Any]:
+        allow = self.model_patterns(model_patterns)
+        return {
+            "version": "0.1",
+            "model": {
+                "allow": allow + ["gpt-4.1"],
+                "deny": ["*-preview", "*-beta"],
+                "max_tokens": 4096,
+            },
+            "data": {
+                "regions": {"allowed": _REGIONS[:4]},
+                "pii": {"action": pii_action},
+            },
+            "tools": {
+                "allow": self.tool_names(tools),
+                "deny": ["shell_exec"],
+            },
+        }
+
+    def requests(self, count: int, *, text_size: int = 256) -> List[Dict[str, Any]]:
+        """
+        Return `count` enforce_batch requests mixing ALLOW, MODIFY and
+        BLOCK outcomes.
+        """
+        rng = self._rng("requests", count, text_size)
+        requests = []
+        for i in range(count):
+            requests.append(
+                {
+                    "requested_model": rng.choice(["gpt-4.1", "gpt-4.1", "x-preview"]),
+                    "region": rng.choice(_REGIONS[:5]),
+                    "tool_name": rng.choice(["tool_0001", None]),
+                    "text": self.text(text_size, pii_per_kb=rng.choice([0, 4])),
+                    "context": {"request_id": str(i)},
+                }
+            )
+        return requests
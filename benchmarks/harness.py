@@ -0,0 +1,181 @@
+"""
+Timing harness: calibrated sampling, percentile statistics and
+baseline comparison.
+"""
+
+from __future__ import annotations
+
+import gc
+import math
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+DEFAULT_MIN_TIME = 0.3
+DEFAULT_SAMPLES = 60
+DEFAULT_THRESHOLD = 0.10
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    samples: int = 0
+    iterations: int = 0
+    p50_ns: float = 0.0
+    p99_ns: float = 0.0
+    mean_ns: float = 0.0
+    ops_per_sec: float = 0.0
+
+    @property
+    def key(self) -> str:
+        return result_key(self.name, self.params)
+
+    def to_dict(self) -> Dict[str, Any]:
+        payload = asdict(self)
+        payload["key"] = self.key
+        return payload
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> "BenchmarkResult":
+        return cls(
+            name=payload["name"],
+            params=dict(payload.get("params", {})),
+            samples=payload.get("samples", 0),
+            iterations=payload.get("iterations", 0),
+            p50_ns=payload["p50_ns"],
+            p99_ns=payload["p99_ns"],
+            mean_ns=payload.get("mean_ns", 0.0),
+            ops_per_sec=payload.get("ops_per_sec", 0.0),
+        )
+
+
+def result_key(name: str, params: Mapping[str, Any]) -> str:
+    if not params:
+        return name
+    args = ",".join(f"{key}={params[key]}" for key in sorted(params))
+    return f"{name}[{args}]"
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of already-sorted values."""
+
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(len(sorted_values) * fraction))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def measure(
+    fn: Callable[[], Any],
+    *,
+    name: str,
+    params: Optional[Dict[str, Any]] = None,
+    min_time: float = DEFAULT_MIN_TIME,
+    samples: int = DEFAULT_SAMPLES,
+) -> BenchmarkResult:
+    """
+    Time `fn` and return per-call statistics.
+
+    Calls are grouped so that each sample lasts about
+    `min_time / samples` seconds, which keeps timer overhead out of the
+    numbers for fast functions. Per-call times are sample time divided
+    by the group size.
+    """
+
+    fn()  # warm-up: caches, lazy compilation, file creation
+
+    target_ns = min_time * 1e9 / samples
+    iterations = 1
+    while True:
+        elapsed = _time_group(fn, iterations)
+        if elapsed >= target_ns or iterations >= 1 << 20:
+            break
+        iterations *= 2
+
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        timings = sorted(
+            _time_group(fn, iterations) / iterations for _ in range(samples)
+        )
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    mean = sum(timings) / len(timings)
+
+    return BenchmarkResult(
+        name=name,
+        params=dict(params or {}),
+        samples=samples,
+        iterations=iterations,
+        p50_ns=percentile(timings, 0.50),
+        p99_ns=percentile(timings, 0.99),
+        mean_ns=mean,
+        ops_per_sec=1e9 / mean if mean else 0.0,
+    )
+
+
+def _time_group(fn: Callable[[], Any], iterations: int) -> int:
+    clock = time.perf_counter_ns
+    loop = range(iterations)
+    start = clock()
+    for _ in loop:
+        fn()
+    return clock() - start
+
+
+# ----------------------------------------------------------------------
+# Baseline comparison
+# ----------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class Comparison:
+    key: str
+    baseline_p50_ns: Optional[float]
+    current_p50_ns: Optional[float]
+
+    @property
+    def change(self) -> Optional[float]:
+        """Relative p50 change; positive means slower."""
+        if not self.baseline_p50_ns or self.current_p50_ns is None:
+            return None
+        return self.current_p50_ns / self.baseline_p50_ns - 1.0
+
+
+def compare(
+    baseline: Sequence[BenchmarkResult],
+    current: Sequence[BenchmarkResult],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> Tuple[List[Comparison], List[Comparison]]:
+    """
+    Compare p50 latencies by benchmark key.
+
+    Returns (all comparisons, regressions), where a regression is a
+    benchmark whose p50 grew by more than `threshold` (0.10 = 10%).
+    Benchmarks present on only one side are reported but never count
+    as regressions.
+    """
+
+    base = {result.key: result for result in baseline}
+    cur = {result.key: result for result in current}
+
+    comparisons = [
+        Comparison(
+            key=key,
+            baseline_p50_ns=base[key].p50_ns if key in base else None,
+            current_p50_ns=cur[key].p50_ns if key in cur else None,
+        )
+        for key in list(base) + [key for key in cur if key not in base]
+    ]
+
+    regressions = [
+        comparison
+        for comparison in comparisons
+        if comparison.change is not None and comparison.change > threshold
+    ]
+
+    return comparisons, regressions
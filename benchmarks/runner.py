@@ -0,0 +1,243 @@
+"""
+Command-line runner.
+
+    python -m benchmarks run [--filter REGEX] [--quick] [--output FILE]
+                             [--baseline FILE] [--threshold 0.10]
+    python -m benchmarks compare BASELINE CURRENT [--threshold 0.10]
+    python -m benchmarks startup [--repeat 5] [--budget-scale 1.0]
+
+Results are JSON. `--baseline` (run) and `compare` exit with status 1
+when any benchmark's p50 regressed by more than the threshold; `startup`
+does when a CLI module exceeds its import budget.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import re
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from benchmarks import cases
+from benchmarks.corpus import DEFAULT_SEED, Corpus
+from benchmarks import startup
+from benchmarks.harness import (
+    DEFAULT_MIN_TIME,
+    DEFAULT_SAMPLES,
+    DEFAULT_THRESHOLD,
+    BenchmarkResult,
+    Comparison,
+    compare,
+    measure,
+    result_key,
+)
+
+QUICK_MIN_TIME = 0.05
+QUICK_SAMPLES = 20
+
+
+def run_benchmarks(
+    *,
+    pattern: Optional[str] = None,
+    seed: int = DEFAULT_SEED,
+    min_time: float = DEFAULT_MIN_TIME,
+    samples: int = DEFAULT_SAMPLES,
+    progress: Any = None,
+) -> List[BenchmarkResult]:
+    """
+    Run every registered case (or those whose key matches `pattern`).
+    """
+
+    selector = re.compile(pattern) if pattern else None
+    results: List[BenchmarkResult] = []
+
+    with tempfile.TemporaryDirectory(prefix="ai-governor-bench-") as tmp:
+        env = cases.BenchEnv(corpus=Corpus(seed), tmpdir=Path(tmp))
+
+        try:
+            for bench in cases.CASES:
+                for params in bench.variants():
+                    key = result_key(bench.name, params)
+                    if selector is not None and not selector.search(key):
+                        continue
+
+                    with open(os.devnull, "w") as devnull:
+                        # Stdout sinks (and the default emitter) write here
+                        with contextlib.redirect_stdout(devnull):
+                            fn = bench.setup(env, **params)
+                            result = measure(
+                                fn,
+                                name=bench.name,
+                                params=params,
+                                min_time=min_time,
+                                samples=samples,
+                            )
+
+                    results.append(result)
+                    if progress is not None:
+                        print(_format_result(result), file=progress, flush=True)
+        finally:
+            env.close()
+
+    return results
+
+
+def results_document(results: Sequence[BenchmarkResult], seed: int) -> Dict[str, Any]:
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "seed": seed,
+        },
+        "results": [result.to_dict() for result in results],
+    }
+
+
+def load_results(path: str) -> List[BenchmarkResult]:
+    with open(path, "r", encoding="utf-8") as f:
+        document = json.load(f)
+    return [BenchmarkResult.from_dict(entry) for entry in document["results"]]
+
+
+def format_comparison(comparisons: Sequence[Comparison], threshold: float) -> str:
+    lines = []
+    for comparison in comparisons:
+        change = comparison.change
+        if change is None:
+            status = "new" if comparison.baseline_p50_ns is None else "missing"
+            lines.append(f"  {status:<10} {comparison.key}")
+            continue
+
+        status = "REGRESSED" if change > threshold else "ok"
+        lines.append(
+            f"  {status:<10} {comparison.key}: "
+            f"{_ns(comparison.baseline_p50_ns)} -> {_ns(comparison.current_p50_ns)} "
+            f"({change:+.1%})"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="ai-governor enforcement pipeline benchmarks",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="Run benchmarks")
+    run.add_argument("--filter", help="Only run benchmarks whose key matches this regex")
+    run.add_argument("--quick", action="store_true", help="Short timing budget (smoke runs)")
+    run.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    run.add_argument("--output", help="Write JSON results to this file (default: stdout)")
+    run.add_argument("--baseline", help="Compare against a stored results file")
+    run.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    run.add_argument("--list", action="store_true", help="List benchmark keys and exit")
+
+    cmp = sub.add_parser("compare", help="Compare two results files")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current")
+    cmp.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    boot = sub.add_parser("startup", help="Check CLI import time against budgets")
+    boot.add_argument("--repeat", type=int, default=startup.DEFAULT_REPEAT)
+    boot.add_argument(
+        "--budget-scale",
+        type=float,
+        default=1.0,
+        help="Multiply time budgets (e.g. 2.0 on slow CI machines)",
+    )
+    boot.add_argument("--output", help="Write JSON results to this file")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        return _compare(load_results(args.baseline), load_results(args.current), args.threshold)
+
+    if args.command == "startup":
+        return _startup(args)
+
+    if args.list:
+        for bench in cases.CASES:
+            for params in bench.variants():
+                print(result_key(bench.name, params))
+        return 0
+
+    results = run_benchmarks(
+        pattern=args.filter,
+        seed=args.seed,
+        min_time=QUICK_MIN_TIME if args.quick else DEFAULT_MIN_TIME,
+        samples=QUICK_SAMPLES if args.quick else DEFAULT_SAMPLES,
+        progress=sys.stderr,
+    )
+
+    document = json.dumps(results_document(results, args.seed), indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(document + "\n")
+    else:
+        print(document)
+
+    if args.baseline:
+        return _compare(load_results(args.baseline), results, args.threshold)
+
+    return 0
+
+
+def _compare(
+    baseline: Sequence[BenchmarkResult],
+    current: Sequence[BenchmarkResult],
+    threshold: float,
+) -> int:
+    comparisons, regressions = compare(baseline, current, threshold=threshold)
+
+    print(f"p50 comparison (threshold {threshold:.0%}):", file=sys.stderr)
+    print(format_comparison(comparisons, threshold), file=sys.stderr)
+
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+def _startup(args: argparse.Namespace) -> int:
+    results, violations = startup.run_startup(
+        repeat=args.repeat,
+        scale=args.budget_scale,
+        progress=sys.stderr,
+    )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump([result.to_dict() for result in results], f, indent=2)
+            f.write("\n")
+
+    for violation in violations:
+        print(f"  OVER BUDGET {violation}", file=sys.stderr)
+
+    return 1 if violations else 0
+
+
+def _format_result(result: BenchmarkResult) -> str:
+    return (
+        f"{result.key:<70} p50 {_ns(result.p50_ns):>10}  "
+        f"p99 {_ns(result.p99_ns):>10}  {result.ops_per_sec:>12,.0f} ops/s"
+    )
+
+
+def _ns(value: Optional[float]) -> str:
+    if value is None:
+        return "-"
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if value >= scale:
+            return f"{value / scale:.2f}{unit}"
+    return f"{value:.0f}ns"
@@ -0,0 +1,173 @@
+"""
+CLI startup benchmark.
+
+Each CLI entry module is imported in a fresh interpreter under
+`python -X importtime`, and its cumulative import time is checked
+against a budget. The same run records every module that was imported,
+so heavy dependencies leaking into a command's import path fail the
+check deterministically, whatever the machine's speed.
+"""
+
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+DEFAULT_REPEAT = 5
+
+
+@dataclass(frozen=True)
+class StartupBudget:
+    module: str
+    # Cumulative import time of `module`, in milliseconds
+    max_ms: float
+    # Modules (and their submodules) that `module` must not import
+    forbidden: Tuple[str, ...] = ()
+
+
+STARTUP_BUDGETS: Tuple[StartupBudget, ...] = (
+    # `ai-governor --help` and argument parsing
+    StartupBudget(
+        "cli.main",
+        max_ms=25,
+        forbidden=("yaml", "core", "asyncio", "concurrent", "socket", "json"),
+    ),
+    StartupBudget(
+        "cli.validate",
+        max_ms=120,
+        forbidden=(
+            "asyncio",
+            "core.enforcement",
+            "core.audit",
+            "core.pii",
+            "core.redaction",
+        ),
+    ),
+    StartupBudget(
+        "cli.enforce",
+        max_ms=200,
+        forbidden=("asyncio", "concurrent", "socketserver", "core.audit.async_sinks"),
+    ),
+)
+
+
+@dataclass(frozen=True)
+class StartupResult:
+    module: str
+    # Cumulative import time over the runs, in microseconds
+    min_us: int
+    median_us: int
+    modules: FrozenSet[str]
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "module": self.module,
+            "min_us": self.min_us,
+            "median_us": self.median_us,
+            "modules": len(self.modules),
+        }
+
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(\S+)\s*$")
+
+
+def parse_importtime(output: str) -> Dict[str, int]:
+    """
+    Map each module in `python -X importtime` output to its cumulative
+    import time in microseconds.
+    """
+    cumulative: Dict[str, int] = {}
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is not None:
+            cumulative.setdefault(match.group(3), int(match.group(2)))
+    return cumulative
+
+
+def measure_startup(module: str, repeat: int = DEFAULT_REPEAT) -> StartupResult:
+    """
+    Import `module` in `repeat` fresh interpreters and time it.
+    """
+    timings: List[int] = []
+    modules: FrozenSet[str] = frozenset()
+
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        cumulative = parse_importtime(completed.stderr)
+        timings.append(cumulative[module])
+        modules = frozenset(cumulative)
+
+    timings.sort()
+    return StartupResult(
+        module=module,
+        min_us=timings[0],
+        median_us=timings[len(timings) // 2],
+        modules=modules,
+    )
+
+
+def check_budget(
+    result: StartupResult,
+    budget: StartupBudget,
+    *,
+    scale: float = 1.0,
+) -> List[str]:
+    """
+    Return the budget violations of a result (empty if within budget).
+
+    The fastest run is compared with the budget, which keeps the check
+    stable on noisy machines. `scale` multiplies the time budget for
+    slower hardware; forbidden imports are never scaled away.
+    """
+    violations = []
+
+    limit_us = budget.max_ms * 1000 * scale
+    if result.min_us > limit_us:
+        violations.append(
+            f"{budget.module}: imports in {result.min_us / 1000:.1f}ms, "
+            f"budget {limit_us / 1000:.1f}ms"
+        )
+
+    for name in sorted(result.modules):
+        for prefix in budget.forbidden:
+            if name == prefix or name.startswith(prefix + "."):
+                violations.append(f"{budget.module}: imports {name}")
+                break
+
+    return violations
+
+
+def run_startup(
+    budgets: Sequence[StartupBudget] = STARTUP_BUDGETS,
+    *,
+    repeat: int = DEFAULT_REPEAT,
+    scale: float = 1.0,
+    progress: Optional[object] = None,
+) -> Tuple[List[StartupResult], List[str]]:
+    results: List[StartupResult] = []
+    violations: List[str] = []
+
+    for budget in budgets:
+        result = measure_startup(budget.module, repeat)
+        results.append(result)
+        violations.extend(check_budget(result, budget, scale=scale))
+
+        if progress is not None:
+            print(
+                f"{budget.module:<20} min {result.min_us / 1000:>7.1f}ms  "
+                f"median {result.median_us / 1000:>7.1f}ms  "
+                f"budget {budget.max_ms * scale:>6.1f}ms  "
+                f"{len(result.modules)} modules",
+                file=progress,
+                flush=True,
+            )
+
+    return results, violations
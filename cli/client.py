@@ -0,0 +1,84 @@
+"""
+Thin client for `ai-governor serve`.
+
+Kept free of core and YAML imports: forwarding a command to a running
+server should cost little more than interpreter startup.
+"""
+
+import json
+import os
+import socket
+import sys
+
+# Arguments holding paths, resolved against the client's working
+# directory before they are sent.
+_PATH_ARGS = ("policy", "context", "output_text")
+
+
+def request(socket_path, command, args):
+    """
+    Send one command to the server and return its response.
+
+    The response has the command's `stdout`, `stderr` and `exit_code`.
+
+    Raises:
+        FileNotFoundError or ConnectionRefusedError if no server is
+        listening on `socket_path`; another OSError if the exchange
+        fails once connected, including a reply that is not valid JSON.
+    """
+    payload = json.dumps({"command": command, "args": args}).encode("utf-8")
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(payload + b"\n")
+
+        with sock.makefile("rb") as f:
+            line = f.readline()
+
+    if not line:
+        raise ConnectionError("server closed the connection")
+
+    try:
+        return json.loads(line)
+    except ValueError as e:
+        raise ConnectionError(f"invalid server response: {e}")
+
+
+def run_remote(args):
+    """
+    Run a CLI command on the server at `args.socket`.
+
+    Returns the command's exit code, or None if no server is listening;
+    the caller then runs the command in-process. A request that fails
+    once connected is not run again locally: the server may already have
+    enforced it and emitted its audit events.
+    """
+    forwarded = {
+        key: value
+        for key, value in vars(args).items()
+        if key not in ("command", "socket")
+    }
+
+    for key in _PATH_ARGS:
+        if forwarded.get(key):
+            forwarded[key] = os.path.abspath(forwarded[key])
+
+    text = forwarded.get("text")
+    if text and text.startswith("@"):
+        forwarded["text"] = "@" + os.path.abspath(text[1:])
+
+    try:
+        response = request(args.socket, args.command, forwarded)
+    except (FileNotFoundError, ConnectionRefusedError):
+        # No server listening: nothing was sent
+        return None
+    except OSError as e:
+        print(f"Server request failed: {e}", file=sys.stderr)
+        return 2
+
+    sys.stdout.write(response["stdout"])
+    sys.stdout.flush()
+    sys.stderr.write(response["stderr"])
+    sys.stderr.flush()
+
+    return response["exit_code"]
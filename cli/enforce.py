@@ -1,9 +1,13 @@
 import json
 import sys
-import yaml
 
+from cli.validate import load_policy_file
+from core.audit.emitter import AuditEventEmitter
+from core.audit.sinks import StdoutSink
 from core.enforcement.orchestrator import EnforcementOrchestrator
 from core.decision import DecisionType
+from core.policy.compiled import CompiledPolicy
+from core.redaction.mapped import MappedText
 
 
 def _load_text(text_arg):
@@ -13,6 +17,37 @@ def _load_text(text_arg):
     return text_arg
 
 
+def _map_text(text_arg, policy):
+    """
+    Map an `@file` text argument, or return None to load it in memory.
+
+    Keyword rules need the text as a str, so policies with keywords keep
+    reading the file.
+    """
+    if not text_arg or not text_arg.startswith("@"):
+        return None
+
+    if isinstance(policy, CompiledPolicy):
+        uses_keywords = policy.keywords is not None
+    elif isinstance(policy, dict):
+        data = policy.get("data")
+        uses_keywords = isinstance(data, dict) and bool(data.get("keywords"))
+    else:
+        # Not a policy: leave the error to enforcement
+        return None
+
+    return None if uses_keywords else MappedText(text_arg[1:])
+
+
+def _write_output_text(path, result, mapped):
+    if mapped is not None:
+        with open(path, "wb") as f:
+            mapped.write(f)
+    elif result["output_text"] is not None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(result["output_text"])
+
+
 def _load_context(path):
     if not path:
         return None
@@ -20,18 +55,41 @@ def _load_context(path):
         return json.load(f)
 
 
-def run_enforce(args) -> int:
+def run_enforce(
+    args,
+    *,
+    stdout=None,
+    stderr=None,
+    load_policy=load_policy_file,
+) -> int:
+    """
+    Run the `enforce` command.
+
+    `stdout`/`stderr` default to the process streams; `load_policy`
+    returns the policy to enforce for a path (a dict or CompiledPolicy).
+    The server passes its own, so its output matches the CLI's exactly.
+    """
+    out = stdout if stdout is not None else sys.stdout
+    err = stderr if stderr is not None else sys.stderr
+
     try:
-        with open(args.policy) as f:
-            policy = yaml.safe_load(f)
+        policy = load_policy(args.policy)
     except Exception as e:
-        print(f"Failed to load policy: {e}", file=sys.stderr)
+        print(f"Failed to load policy: {e}", file=err)
         return 2
 
-    text = _load_text(args.text) if args.text else None
+    # Large files are scanned in place rather than read into memory
+    mapped = _map_text(args.text, policy)
+    if mapped is not None:
+        text = mapped
+    else:
+        text = _load_text(args.text) if args.text else None
     context = _load_context(args.context)
 
-    orchestrator = EnforcementOrchestrator()
+    # Audit events are written to the same stream as the result
+    orchestrator = EnforcementOrchestrator(
+        audit_emitter=AuditEventEmitter([StdoutSink(out)])
+    )
 
     try:
         result = orchestrator.enforce(
@@ -42,41 +100,55 @@ def run_enforce(args) -> int:
             text=text,
             context=context,
         )
+
+        final = result["final_decision"]
+
+        # Blocked content is never written out
+        if args.output_text and final.decision != DecisionType.BLOCK:
+            _write_output_text(args.output_text, result, mapped)
     except Exception as e:
-        print(f"Enforcement failed: {e}", file=sys.stderr)
+        print(f"Enforcement failed: {e}", file=err)
         return 3
+    finally:
+        if mapped is not None:
+            mapped.close()
+
+    print(
+        json.dumps(
+            render_result(result, verbose=args.verbose),
+            indent=2 if args.verbose else None,
+        ),
+        file=out,
+    )
+
+    return exit_code(final.decision)
+
 
+def render_result(result, *, verbose=False):
+    """
+    CLI output of one enforcement result, as a JSON-serialisable dict.
+    """
     final = result["final_decision"]
 
-    if args.verbose:
-        print(
-            json.dumps(
-                {
-                    "final_decision": final.decision.value,
-                    "decisions": [
-                        d.to_dict() for d in result["decisions"]
-                    ],
-                },
-                indent=2,
-            )
-        )
-    else:
-        print(
-            json.dumps(
-                {
-                    "final_decision": final.decision.value,
-                    "reason": final.reason,
-                    "policy_section": final.policy_section,
-                }
-            )
-        )
+    if verbose:
+        return {
+            "final_decision": final.decision.value,
+            "decisions": [d.to_dict() for d in result["decisions"]],
+        }
 
-    if final.decision == DecisionType.ALLOW:
+    return {
+        "final_decision": final.decision.value,
+        "reason": final.reason,
+        "policy_section": final.policy_section,
+    }
+
+
+def exit_code(decision) -> int:
+    if decision == DecisionType.ALLOW:
         return 0
-    if final.decision == DecisionType.MODIFY:
+    if decision == DecisionType.MODIFY:
         return 10
-    if final.decision == DecisionType.BLOCK:
+    if decision == DecisionType.BLOCK:
         return 20
 
     return 3
-
@@ -0,0 +1,250 @@
+import json
+import os
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from cli.enforce import exit_code, render_result
+from cli.validate import load_policy_file
+from core.audit.emitter import AuditEventEmitter
+from core.audit.sinks import AuditSink, JsonFileSink, StdoutSink
+from core.decision import DecisionType
+from core.enforcement.orchestrator import EnforcementOrchestrator
+from core.policy.compiled import compile_policy
+
+DEFAULT_CHUNK_SIZE = 64
+
+# JSONL request key -> EnforcementOrchestrator.enforce keyword
+_REQUEST_KEYS = {
+    "model": "requested_model",
+    "max_tokens": "requested_max_tokens",
+    "region": "region",
+    "tool": "tool_name",
+    "text": "text",
+    "context": "context",
+}
+
+
+def _parse_request(line, lineno):
+    try:
+        request = json.loads(line)
+    except ValueError as e:
+        raise ValueError(f"line {lineno}: invalid JSON: {e}")
+
+    if not isinstance(request, dict):
+        raise ValueError(f"line {lineno}: request must be a JSON object")
+
+    unknown = set(request) - set(_REQUEST_KEYS)
+    if unknown:
+        raise ValueError(
+            f"line {lineno}: unknown request keys: {', '.join(sorted(unknown))}"
+        )
+
+    if not isinstance(request.get("model"), str):
+        raise ValueError(f"line {lineno}: `model` is required")
+
+    return {_REQUEST_KEYS[key]: value for key, value in request.items()}
+
+
+def _read_requests(stream):
+    for lineno, line in enumerate(stream, start=1):
+        if line.strip():
+            yield _parse_request(line, lineno)
+
+
+def _chunks(requests, size):
+    requests = iter(requests)
+    while True:
+        chunk = list(islice(requests, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# ----------------------------------------------------------------------
+# Worker side: one orchestrator and compiled policy per process
+# ----------------------------------------------------------------------
+
+
+class _EventBuffer(AuditSink):
+    """Holds a worker's audit events until the parent writes them."""
+
+    def __init__(self):
+        self.events = []
+
+    def write(self, event):
+        self.events.append(event)
+
+    def take(self):
+        events, self.events = self.events, []
+        return events
+
+
+class _Worker:
+    def __init__(self, policy, verbose):
+        # Audit events go back to the parent with the results, which
+        # writes them in input order through a single sink
+        self.buffer = _EventBuffer()
+        self.orchestrator = EnforcementOrchestrator(
+            audit_emitter=AuditEventEmitter([self.buffer])
+        )
+        self.policy = compile_policy(policy)
+        self.verbose = verbose
+
+    def run(self, requests):
+        """
+        Enforce a chunk of requests.
+
+        Returns (output line, decision) pairs, the chunk's audit events
+        and the error that stopped the chunk, if any. Events of requests
+        decided before the error are still returned.
+        """
+        try:
+            results = self.orchestrator.enforce_batch(self.policy, requests)
+        except Exception as e:
+            return [], self.buffer.take(), e
+
+        rows = [
+            (
+                json.dumps(render_result(result, verbose=self.verbose)),
+                result["final_decision"].decision.value,
+            )
+            for result in results
+        ]
+        return rows, self.buffer.take(), None
+
+
+_worker = None
+
+
+def _init_worker(policy, verbose):
+    global _worker
+    _worker = _Worker(policy, verbose)
+
+
+def _run_chunk(requests):
+    return _worker.run(requests)
+
+
+# ----------------------------------------------------------------------
+# Command
+# ----------------------------------------------------------------------
+
+
+def run_enforce_batch(args) -> int:
+    try:
+        policy = load_policy_file(args.policy)
+    except Exception as e:
+        print(f"Failed to load policy: {e}", file=sys.stderr)
+        return 2
+
+    workers = args.workers or os.cpu_count() or 1
+    chunk_size = args.chunk_size or DEFAULT_CHUNK_SIZE
+    # Chunks in flight (submitted, not yet written): bounds memory
+    window = args.window or 2 * workers
+
+    source = out = None
+    counts = Counter()
+    started = time.perf_counter()
+
+    try:
+        source = sys.stdin if args.input in (None, "-") else open(args.input)
+        out = sys.stdout if args.output in (None, "-") else open(args.output, "w")
+
+        _enforce_stream(
+            policy,
+            _chunks(_read_requests(source), chunk_size),
+            out,
+            counts,
+            workers=workers,
+            window=window,
+            audit_log=args.audit_log,
+            verbose=args.verbose,
+        )
+    except Exception as e:
+        print(f"Enforcement failed: {e}", file=sys.stderr)
+        return 3
+    finally:
+        if source not in (None, sys.stdin):
+            source.close()
+        if out not in (None, sys.stdout):
+            out.close()
+
+    _print_summary(counts, time.perf_counter() - started)
+
+    if counts[DecisionType.BLOCK.value]:
+        return exit_code(DecisionType.BLOCK)
+    if counts[DecisionType.MODIFY.value]:
+        return exit_code(DecisionType.MODIFY)
+    return exit_code(DecisionType.ALLOW)
+
+
+def _enforce_stream(
+    policy, chunks, out, counts, *, workers, window, audit_log, verbose
+):
+    """
+    Enforce every chunk and write the results and audit events in input
+    order.
+
+    Fails fast: the first invalid request or failed chunk stops the run.
+    Results of earlier chunks have already been written.
+    """
+    # stdout carries the results; audit events go elsewhere
+    sink = JsonFileSink(audit_log) if audit_log else StdoutSink(sys.stderr)
+
+    def write(chunk_result):
+        rows, events, error = chunk_result
+
+        # A chunk is audited before its results are written
+        if events:
+            sink.write_batch(events)
+        if error is not None:
+            raise error
+
+        for line, decision in rows:
+            out.write(line + "\n")
+            counts[decision] += 1
+        out.flush()
+
+    if workers <= 1:
+        worker = _Worker(policy, verbose)
+        for chunk in chunks:
+            write(worker.run(chunk))
+        return
+
+    # Invalid policies fail here, before any worker starts
+    compile_policy(policy)
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(policy, verbose),
+    )
+    pending = deque()
+
+    try:
+        for chunk in chunks:
+            pending.append(executor.submit(_run_chunk, chunk))
+            if len(pending) >= window:
+                write(pending.popleft().result())
+
+        while pending:
+            write(pending.popleft().result())
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _print_summary(counts, elapsed):
+    total = sum(counts.values())
+    rate = total / elapsed if elapsed > 0 else 0.0
+
+    print(
+        f"{total} requests: "
+        f"{counts[DecisionType.ALLOW.value]} allow, "
+        f"{counts[DecisionType.MODIFY.value]} modify, "
+        f"{counts[DecisionType.BLOCK.value]} block "
+        f"in {elapsed:.2f}s ({rate:.0f}/s)",
+        file=sys.stderr,
+    )
@@ -1,8 +1,11 @@
 import argparse
+import os
 import sys
 
-from cli.validate import run_validate
-from cli.enforce import run_enforce
+# Subcommand modules are imported only once the command is known, so
+# each command (and --help) loads just what it needs.
+
+SOCKET_ENV = "AI_GOVERNOR_SOCKET"
 
 
 def main():
@@ -22,6 +25,11 @@ def main():
     validate_parser.add_argument(
         "--strict", action="store_true", help="Treat warnings as errors"
     )
+    validate_parser.add_argument(
+        "--socket",
+        default=os.environ.get(SOCKET_ENV),
+        help=f"Run on the `serve` process at this socket (default: ${SOCKET_ENV})",
+    )
 
     # enforce
     enforce_parser = subparsers.add_parser(
@@ -44,19 +52,103 @@ def main():
         help="Optional JSON context file",
     )
     enforce_parser.add_argument(
+        "--output-text",
+        help="Write the text, redacted if required, to this file (not written when blocked)",
+    )
+    enforce_parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Show all intermediate decisions",
+    )
+    enforce_parser.add_argument(
+        "--socket",
+        default=os.environ.get(SOCKET_ENV),
+        help=f"Run on the `serve` process at this socket (default: ${SOCKET_ENV})",
+    )
+
+    # enforce-batch
+    batch_parser = subparsers.add_parser(
+        "enforce-batch",
+        help="Run governance enforcement over a JSONL stream of requests",
+    )
+    batch_parser.add_argument("--policy", required=True, help="Policy YAML file")
+    batch_parser.add_argument(
+        "--input",
+        default="-",
+        help="JSONL requests file, or - for stdin (default)",
+    )
+    batch_parser.add_argument(
+        "--output",
+        default="-",
+        help="JSONL results file, or - for stdout (default)",
+    )
+    batch_parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes (default: CPU count; 1 runs in-process)",
+    )
+    batch_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        help="Requests per worker task (default: 64)",
+    )
+    batch_parser.add_argument(
+        "--window",
+        type=int,
+        help="Maximum chunks in flight (default: 2 x workers)",
+    )
+    batch_parser.add_argument(
+        "--audit-log",
+        help="Append audit events to this JSONL file instead of stderr",
+    )
+    batch_parser.add_argument(
         "--verbose",
         action="store_true",
         help="Show all intermediate decisions",
     )
 
+    # serve
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Serve enforce/validate commands over a Unix socket",
+    )
+    serve_parser.add_argument(
+        "--socket",
+        default=os.environ.get(SOCKET_ENV),
+        required=SOCKET_ENV not in os.environ,
+        help=f"Unix socket path (default: ${SOCKET_ENV})",
+    )
+
     args = parser.parse_args()
 
+    # Forwarded to a running server if there is one, else run here
+    if args.command in ("validate", "enforce") and args.socket:
+        from cli.client import run_remote
+
+        code = run_remote(args)
+        if code is not None:
+            sys.exit(code)
+
     if args.command == "validate":
+        from cli.validate import run_validate
+
         sys.exit(run_validate(args))
 
     if args.command == "enforce":
+        from cli.enforce import run_enforce
+
         sys.exit(run_enforce(args))
 
+    if args.command == "enforce-batch":
+        from cli.enforce_batch import run_enforce_batch
+
+        sys.exit(run_enforce_batch(args))
+
+    if args.command == "serve":
+        from cli.serve import run_serve
+
+        sys.exit(run_serve(args))
+
 
 if __name__ == "__main__":
     main()
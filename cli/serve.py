@@ -0,0 +1,233 @@
+"""
+`ai-governor serve`: a long-running process that answers `enforce` and
+`validate` commands over a Unix domain socket.
+
+Commands run the same code as the CLI, with their output captured per
+request, so stdout, stderr and exit codes are identical. Parsed and
+compiled policies stay in memory and are re-read only when their file
+changes.
+
+Protocol: one JSON object per line in each direction.
+    request:  {"command": "enforce", "args": {...CLI arguments...}}
+    response: {"stdout": "...", "stderr": "...", "exit_code": 0}
+"""
+
+import copy
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import sys
+import threading
+from argparse import Namespace
+from collections import OrderedDict
+from pathlib import Path
+
+from cli.enforce import run_enforce
+from cli.validate import load_policy_file, run_validate
+from core.policy.compiled import compile_policy
+from core.policy.loader import file_stamp
+
+_CACHE_MAX_SIZE = 512
+
+
+class _PolicyCache:
+    """
+    Parsed and compiled policy files by path, revalidated by file stat.
+    """
+
+    def __init__(self, max_size=_CACHE_MAX_SIZE):
+        self.max_size = max_size
+        # path -> (stamp, parsed document, CompiledPolicy or None)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def document(self, path):
+        """The parsed policy file, as `validate` loads it."""
+        return copy.deepcopy(self._entry(path)[1])
+
+    def enforceable(self, path):
+        """
+        What `enforce` should be given for a policy file: the compiled
+        policy, or the parsed document if it does not compile, so that
+        enforcement fails with the CLI's own error.
+        """
+        _, document, compiled = self._entry(path)
+        return compiled if compiled is not None else copy.deepcopy(document)
+
+    def _entry(self, path):
+        path = Path(path)
+        # Stamped before reading, as in core.policy.loader
+        stamp = file_stamp(path)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and stamp is not None and entry[0] == stamp:
+                self._entries.move_to_end(path)
+                return entry
+
+        # Raises exactly as the CLI's policy loading does
+        document = load_policy_file(path)
+
+        compiled = None
+        if isinstance(document, dict):
+            try:
+                compiled = compile_policy(document)
+            except Exception:
+                pass
+
+        entry = (stamp, document, compiled)
+
+        if stamp is not None:
+            with self._lock:
+                self._entries[path] = entry
+                self._entries.move_to_end(path)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+
+        return entry
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            response = self.server.execute_line(line)
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class GovernorServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Serves CLI commands on a Unix socket, one thread per client.
+
+    The socket is created readable and writable by its owner only.
+
+    Usage:
+        server = GovernorServer("/run/user/1000/ai-governor.sock")
+        server.serve_forever()
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path):
+        self.socket_path = socket_path
+        self.policies = _PolicyCache()
+
+        _claim_socket_path(socket_path)
+
+        umask = os.umask(0o177)
+        try:
+            super().__init__(socket_path, _Handler)
+        finally:
+            os.umask(umask)
+
+    def execute(self, command, args):
+        """
+        Run one CLI command and return its captured output and exit code.
+        """
+        out = io.StringIO()
+        err = io.StringIO()
+
+        try:
+            namespace = Namespace(**args)
+
+            if command == "enforce":
+                code = run_enforce(
+                    namespace,
+                    stdout=out,
+                    stderr=err,
+                    load_policy=self.policies.enforceable,
+                )
+            elif command == "validate":
+                code = run_validate(
+                    namespace,
+                    stdout=out,
+                    stderr=err,
+                    load_policy=self.policies.document,
+                )
+            else:
+                print(f"Unknown command: {command}", file=err)
+                code = 2
+
+        except Exception as e:
+            # Where the CLI would exit on an uncaught exception
+            # (e.g. an unreadable --text file), with its exit status.
+            print(f"{type(e).__name__}: {e}", file=err)
+            code = 1
+
+        return {
+            "stdout": out.getvalue(),
+            "stderr": err.getvalue(),
+            "exit_code": code,
+        }
+
+    def execute_line(self, line):
+        try:
+            message = json.loads(line)
+            command = message["command"]
+            args = message["args"]
+        except (ValueError, KeyError, TypeError) as e:
+            return {
+                "stdout": "",
+                "stderr": f"Invalid request: {e}\n",
+                "exit_code": 2,
+            }
+
+        return self.execute(command, args)
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+
+
+def _claim_socket_path(socket_path):
+    """
+    Remove a stale socket left by a server that did not shut down
+    cleanly. Refuses to replace a live server or a non-socket file.
+    """
+    try:
+        mode = os.stat(socket_path).st_mode
+    except FileNotFoundError:
+        return
+
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{socket_path} exists and is not a socket")
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except ConnectionRefusedError:
+            os.unlink(socket_path)
+            return
+
+    raise OSError(f"A server is already listening on {socket_path}")
+
+
+def _interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def run_serve(args) -> int:
+    try:
+        server = GovernorServer(args.socket)
+    except OSError as e:
+        print(f"Failed to start server: {e}", file=sys.stderr)
+        return 2
+
+    signal.signal(signal.SIGTERM, _interrupt)
+    print(f"ai-governor listening on {args.socket}", file=sys.stderr)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+    return 0
@@ -5,12 +5,31 @@ import yaml
 from core.policy_validator import PolicyValidator
 
 
-def run_validate(args) -> int:
+def load_policy_file(path):
+    with open(path) as f:
+        return yaml.safe_load(f)
+
+
+def run_validate(
+    args,
+    *,
+    stdout=None,
+    stderr=None,
+    load_policy=load_policy_file,
+) -> int:
+    """
+    Run the `validate` command.
+
+    `stdout`/`stderr` default to the process streams; `load_policy`
+    returns the parsed policy document for a path.
+    """
+    out = stdout if stdout is not None else sys.stdout
+    err = stderr if stderr is not None else sys.stderr
+
     try:
-        with open(args.policy) as f:
-            policy = yaml.safe_load(f)
+        policy = load_policy(args.policy)
     except Exception as e:
-        print(f"Failed to load policy: {e}", file=sys.stderr)
+        print(f"Failed to load policy: {e}", file=err)
         return 2
 
     validator = PolicyValidator()
@@ -25,23 +44,24 @@ def run_validate(args) -> int:
                     "warnings": result.warnings,
                 },
                 indent=2,
-            )
+            ),
+            file=out,
         )
     else:
         if result.valid:
-            print("✔ Policy is valid")
+            print("✔ Policy is valid", file=out)
         else:
-            print("✖ Policy is invalid")
+            print("✖ Policy is invalid", file=out)
 
         if result.errors:
-            print("\nErrors:")
+            print("\nErrors:", file=out)
             for e in result.errors:
-                print(f"  - {e}")
+                print(f"  - {e}", file=out)
 
         if result.warnings:
-            print("\nWarnings:")
+            print("\nWarnings:", file=out)
             for w in result.warnings:
-                print(f"  - {w}")
+                print(f"  - {w}", file=out)
 
     if not result.valid:
         return 1
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+from core.audit.encoding import encode_events
+from core.audit.sinks import AuditSink, AuditSinkError, JsonFileSink
+
+
+class AsyncAuditSink(ABC):
+    """
+    Abstract base class for awaitable audit sinks.
+
+    Same contract as AuditSink: append-only, side-effect free with
+    respect to enforcement logic, and `write` only returns once the
+    event has been handed off.
+    """
+
+    @abstractmethod
+    async def write(self, event: Dict[str, Any]) -> None:
+        pass
+
+    async def write_batch(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Write several events in order.
+
+        The default writes them one by one.
+        """
+        for event in events:
+            await self.write(event)
+
+    async def write_encoded(self, data: bytes, event: Dict[str, Any]) -> None:
+        """
+        Write one event that has already been encoded.
+
+        Same contract as `AuditSink.write_encoded`; the default calls
+        `write`.
+        """
+        await self.write(event)
+
+    async def write_batch_encoded(
+        self,
+        lines: List[bytes],
+        events: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Write several already-encoded events in order.
+
+        The default calls `write_batch`.
+        """
+        await self.write_batch(events)
+
+
+class AsyncSinkAdapter(AsyncAuditSink):
+    """
+    Runs a blocking AuditSink in a worker thread.
+
+    Writes are serialised with a lock so events keep their order.
+    Exceptions from the wrapped sink propagate unchanged.
+    """
+
+    def __init__(self, sink: AuditSink):
+        self.sink = sink
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def write(self, event: Dict[str, Any]) -> None:
+        async with self._get_lock():
+            await asyncio.to_thread(self.sink.write, event)
+
+    async def write_batch(self, events: List[Dict[str, Any]]) -> None:
+        async with self._get_lock():
+            await asyncio.to_thread(self.sink.write_batch, events)
+
+    async def write_encoded(self, data: bytes, event: Dict[str, Any]) -> None:
+        async with self._get_lock():
+            await asyncio.to_thread(self.sink.write_encoded, data, event)
+
+    async def write_batch_encoded(
+        self,
+        lines: List[bytes],
+        events: List[Dict[str, Any]],
+    ) -> None:
+        async with self._get_lock():
+            await asyncio.to_thread(self.sink.write_batch_encoded, lines, events)
+
+    def _get_lock(self) -> asyncio.Lock:
+        # Created lazily so the lock binds to the running event loop.
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+
+class AsyncJsonFileSink(AsyncSinkAdapter):
+    """
+    Writes audit events as JSON Lines to a file without blocking the
+    event loop.
+
+    Guarantees and failure behavior are those of JsonFileSink.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        flush: bool = True,
+        fsync: bool = False,
+        fail_fast: bool = True,
+    ):
+        super().__init__(
+            JsonFileSink(path, flush=flush, fsync=fsync, fail_fast=fail_fast)
+        )
+        self.path = path
+
+
+class AsyncStreamSink(AsyncAuditSink):
+    """
+    Writes audit events as JSON Lines to an asyncio stream.
+
+    `writer` is an `asyncio.StreamWriter` (or anything with `write(bytes)`
+    and an awaitable `drain()`); each write waits for the transport
+    buffer to drain.
+
+    Failure behavior:
+    - By default, raises AuditSinkError
+    """
+
+    def __init__(self, writer: Any, *, fail_fast: bool = True):
+        self.writer = writer
+        self.fail_fast = fail_fast
+
+    async def write(self, event: Dict[str, Any]) -> None:
+        await self.write_batch([event])
+
+    async def write_batch(self, events: List[Dict[str, Any]]) -> None:
+        try:
+            data = encode_events(events)
+        except Exception as e:
+            self._fail(e)
+            return
+
+        await self._send(data)
+
+    async def write_encoded(self, data: bytes, event: Dict[str, Any]) -> None:
+        await self._send(data)
+
+    async def write_batch_encoded(
+        self,
+        lines: List[bytes],
+        events: List[Dict[str, Any]],
+    ) -> None:
+        await self._send(b"".join(lines))
+
+    async def _send(self, data: bytes) -> None:
+        try:
+            self.writer.write(data)
+            await self.writer.drain()
+
+        except Exception as e:
+            self._fail(e)
+
+    def _fail(self, error: Exception) -> None:
+        if self.fail_fast:
+            raise AuditSinkError(f"Failed to write audit event to stream: {error}")
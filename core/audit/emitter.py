@@ -1,12 +1,34 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from core.decision import Decision
 from core.audit.sinks import AuditSink, StdoutSink
 from core.audit.sinks import AuditSinkError
+from core.audit.encoding import encode_event
+
+if TYPE_CHECKING:
+    from core.audit.async_sinks import AsyncAuditSink
+
+
+_clock = time.perf_counter_ns
+
+# Audit emission modes
+AUDIT_MODE_PER_STAGE = "per_stage"
+AUDIT_MODE_AGGREGATE = "aggregate"
+AUDIT_MODES = (AUDIT_MODE_PER_STAGE, AUDIT_MODE_AGGREGATE)
 
 
 @dataclass
@@ -19,9 +41,11 @@ class AuditEvent:
     policy_version: str
     metadata: Dict[str, Any] = field(default_factory=dict)
     context: Dict[str, Any] = field(default_factory=dict)
+    # Aggregate events only: every stage decision, in enforcement order
+    stages: Optional[List[Dict[str, Any]]] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        payload = {
             "event_type": self.event_type,
             "timestamp": self.timestamp,
             "decision": self.decision,
@@ -32,45 +56,254 @@ class AuditEvent:
             "context": self.context,
         }
 
+        if self.stages is not None:
+            payload["stages"] = self.stages
+
+        return payload
+
 
-class AuditEventEmitter:
+class _AuditEventFactory:
     """
-    Emits audit events to one or more sinks.
+    Builds AuditEvents from Decisions; shared by sync and async emitters.
     """
 
     EVENT_TYPE = "llm_governance_decision"
+    AGGREGATE_EVENT_TYPE = "llm_governance_enforcement"
 
-    def __init__(self, sinks: Optional[List[AuditSink]] = None):
-        self.sinks = sinks or [StdoutSink()]
+    def aggregate_event(
+        self,
+        final_decision: Decision,
+        decisions: Sequence[Decision],
+        context: Optional[Dict[str, Any]] = None,
+    ) -> AuditEvent:
+        """
+        Build one consolidated event for a whole enforcement run.
 
-    def emit(
+        Top-level fields describe the final decision; `stages` holds
+        every stage decision in enforcement order.
+        """
+        return AuditEvent(
+            event_type=self.AGGREGATE_EVENT_TYPE,
+            timestamp=self._now(),
+            decision=final_decision.decision.value,
+            reason=final_decision.reason,
+            policy_section=final_decision.policy_section,
+            policy_version=final_decision.policy_version,
+            metadata=final_decision.metadata or {},
+            context=context or {},
+            stages=[decision.to_dict() for decision in decisions],
+        )
+
+    def stage_event(
         self,
         decision: Decision,
         context: Optional[Dict[str, Any]] = None,
     ) -> AuditEvent:
-        event = AuditEvent(
+        """
+        Build the event `emit` writes for one stage decision.
+        """
+        return AuditEvent(
             event_type=self.EVENT_TYPE,
             timestamp=self._now(),
             decision=decision.decision.value,
             reason=decision.reason,
             policy_section=decision.policy_section,
             policy_version=decision.policy_version,
-            metadata=decision.metadata,
+            metadata=decision.metadata or {},
             context=context or {},
         )
 
-        payload = event.to_dict()
+    @staticmethod
+    def _now() -> str:
+        return datetime.now(timezone.utc).isoformat()
+
+
+def _try_encode(payload: Dict[str, Any]) -> Optional[bytes]:
+    """
+    Encode a payload once for all sinks.
+
+    Returns None when the payload cannot be encoded; callers then fall
+    back to `write`, so each sink reports the failure as it always has.
+    """
+    try:
+        return encode_event(payload)
+    except (TypeError, ValueError):
+        return None
+
+
+class AuditEventEmitter(_AuditEventFactory):
+    """
+    Emits audit events to one or more sinks.
+
+    Each event is encoded once and the same bytes are handed to every
+    sink through `write_encoded`.
+
+    With an `instrumentation` (core.telemetry.instrumentation), every
+    sink write is timed.
+    """
+
+    def __init__(
+        self,
+        sinks: Optional[List[AuditSink]] = None,
+        *,
+        instrumentation: Any = None,
+    ):
+        self.sinks = sinks or [StdoutSink()]
+        self.instrumentation = instrumentation
+
+    def emit(
+        self,
+        decision: Decision,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> AuditEvent:
+        event = self.stage_event(decision, context)
+
+        self._write(event.to_dict())
+
+        return event
+
+    def emit_batch(
+        self,
+        items: Sequence[Tuple[Decision, Optional[Dict[str, Any]]]],
+    ) -> List[AuditEvent]:
+        """
+        Emit several events, handing them to each sink as one group write.
+
+        Events keep their input order. Fail-fast semantics are the same
+        as `emit`: a sink failure aborts the whole batch.
+        """
+        return self.emit_events(
+            [self.stage_event(decision, context) for decision, context in items]
+        )
+
+    def emit_aggregate(
+        self,
+        final_decision: Decision,
+        decisions: Sequence[Decision],
+        context: Optional[Dict[str, Any]] = None,
+    ) -> AuditEvent:
+        """
+        Emit one consolidated event for a whole enforcement run.
+        """
+        event = self.aggregate_event(final_decision, decisions, context)
+
+        self._write(event.to_dict())
+
+        return event
+
+    def emit_events(self, events: List[AuditEvent]) -> List[AuditEvent]:
+        """
+        Write prebuilt events, handing them to each sink as one group write.
+        """
+        if not events:
+            return events
+
+        if len(events) == 1:
+            self._write(events[0].to_dict())
+            return events
+
+        payloads = [event.to_dict() for event in events]
+        lines = [_try_encode(payload) for payload in payloads]
+        encoded = None not in lines
+
+        for sink in self.sinks:
+            if encoded:
+                self._call(sink, sink.write_batch_encoded, lines, payloads)
+            else:
+                self._call(sink, sink.write_batch, payloads)
+
+        return events
+
+    def _write(self, payload: Dict[str, Any]) -> None:
+        data = _try_encode(payload)
+
+        for sink in self.sinks:
+            if data is not None:
+                self._call(sink, sink.write_encoded, data, payload)
+            else:
+                self._call(sink, sink.write, payload)
+
+    def _call(self, sink: AuditSink, write: Callable[..., None], *args: Any) -> None:
+        instrumentation = self.instrumentation
+        start = _clock() if instrumentation is not None else 0
+
+        try:
+            write(*args)
+        except AuditSinkError:
+            if instrumentation is not None:
+                instrumentation.observe_sink(sink, _clock() - start, failed=True)
+            # Fail-fast: governance must not proceed silently
+            raise
+
+        if instrumentation is not None:
+            instrumentation.observe_sink(sink, _clock() - start)
+
+
+class AsyncAuditEventEmitter(_AuditEventFactory):
+    """
+    Emits audit events to one or more awaitable sinks.
+
+    Sinks are awaited one after another, so a failing sink aborts the
+    emission exactly like the synchronous emitter. Events are encoded
+    once, as in the synchronous emitter.
+    """
+
+    def __init__(
+        self,
+        sinks: Optional[List[AsyncAuditSink]] = None,
+        *,
+        instrumentation: Any = None,
+    ):
+        # Imported lazily: only async callers should pay for asyncio.
+        from core.audit.async_sinks import AsyncSinkAdapter
+
+        self.sinks = sinks or [AsyncSinkAdapter(StdoutSink())]
+        self.instrumentation = instrumentation
+
+    async def emit(
+        self,
+        decision: Decision,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> AuditEvent:
+        event = self.stage_event(decision, context)
+
+        await self._write(event.to_dict())
+
+        return event
+
+    async def emit_aggregate(
+        self,
+        final_decision: Decision,
+        decisions: Sequence[Decision],
+        context: Optional[Dict[str, Any]] = None,
+    ) -> AuditEvent:
+        """
+        Emit one consolidated event for a whole enforcement run.
+        """
+        event = self.aggregate_event(final_decision, decisions, context)
+
+        await self._write(event.to_dict())
+
+        return event
+
+    async def _write(self, payload: Dict[str, Any]) -> None:
+        data = _try_encode(payload)
+        instrumentation = self.instrumentation
 
         for sink in self.sinks:
+            start = _clock() if instrumentation is not None else 0
+
             try:
-                sink.write(payload)
+                if data is not None:
+                    await sink.write_encoded(data, payload)
+                else:
+                    await sink.write(payload)
             except AuditSinkError:
+                if instrumentation is not None:
+                    instrumentation.observe_sink(sink, _clock() - start, failed=True)
                 # Fail-fast: governance must not proceed silently
                 raise
 
-        return event
-
-    @staticmethod
-    def _now() -> str:
-        return datetime.now(timezone.utc).isoformat()
+            if instrumentation is not None:
+                instrumentation.observe_sink(sink, _clock() - start)
 
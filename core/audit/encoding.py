@@ -0,0 +1,34 @@
+"""
+Canonical audit event encoding.
+
+Every builtin sink writes the same representation of an event: one line
+of `json.dumps(event, sort_keys=True)`, UTF-8 encoded. The emitter
+encodes each event once and hands the bytes to every sink, so an event
+is never serialised more than once regardless of how many sinks exist.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Iterable
+
+# Same settings as json.dumps(..., sort_keys=True); reused so the encoder
+# is not rebuilt for every event. The output is ASCII-only
+# (ensure_ascii), so UTF-8 encoding cannot fail.
+_ENCODER = json.JSONEncoder(sort_keys=True)
+
+
+def encode_event(event: Dict[str, Any]) -> bytes:
+    """
+    Return the canonical encoded line for an event, newline included.
+    """
+    return (_ENCODER.encode(event) + "\n").encode("utf-8")
+
+
+def encode_events(events: Iterable[Dict[str, Any]]) -> bytes:
+    """
+    Return the canonical encoded lines for several events, joined.
+    """
+    return "".join(_ENCODER.encode(event) + "\n" for event in events).encode(
+        "utf-8"
+    )
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-import json
 import os
+import sys
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from core.audit.encoding import encode_event, encode_events
 
 
 class AuditSinkError(Exception):
@@ -22,17 +27,75 @@ class AuditSink(ABC):
     def write(self, event: Dict[str, Any]) -> None:
         pass
 
+    def write_batch(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Write several events in order.
+
+        Sinks that can commit a group of events in one operation should
+        override this; the default writes them one by one.
+        """
+        for event in events:
+            self.write(event)
+
+    def write_encoded(self, data: bytes, event: Dict[str, Any]) -> None:
+        """
+        Write one event that has already been encoded.
+
+        `data` is the canonical encoded line of `event` (see
+        core.audit.encoding). Sinks that write the canonical format
+        should override this and write `data` as-is; the default ignores
+        it and calls `write`.
+        """
+        self.write(event)
+
+    def write_batch_encoded(
+        self,
+        lines: List[bytes],
+        events: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Write several already-encoded events in order.
+
+        `lines[i]` is the canonical encoded line of `events[i]`. The
+        default ignores the encoded lines and calls `write_batch`.
+        """
+        self.write_batch(events)
+
 
 class StdoutSink(AuditSink):
     """
-    Writes audit events to stdout.
+    Writes audit events to stdout, or to another text stream.
+
+    `stream` defaults to whatever `sys.stdout` is at write time.
 
     Failure behavior:
     - Exceptions propagate (fail-fast)
     """
 
+    def __init__(self, stream: Optional[Any] = None):
+        self.stream = stream
+
     def write(self, event: Dict[str, Any]) -> None:
-        print(json.dumps(event, sort_keys=True), flush=True)
+        self._print(encode_event(event))
+
+    def write_batch(self, events: List[Dict[str, Any]]) -> None:
+        self._print(encode_events(events))
+
+    def write_encoded(self, data: bytes, event: Dict[str, Any]) -> None:
+        self._print(data)
+
+    def write_batch_encoded(
+        self,
+        lines: List[bytes],
+        events: List[Dict[str, Any]],
+    ) -> None:
+        self._print(b"".join(lines))
+
+    def _print(self, data: bytes) -> None:
+        # Looked up on every write so redirected stdout is honoured
+        stream = self.stream if self.stream is not None else sys.stdout
+        stream.write(data.decode("utf-8"))
+        stream.flush()
 
 
 class JsonFileSink(AuditSink):
@@ -62,11 +125,34 @@ class JsonFileSink(AuditSink):
         self.fail_fast = fail_fast
 
     def write(self, event: Dict[str, Any]) -> None:
+        self.write_batch([event])
+
+    def write_batch(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Append all events with a single open, flush and (optional) fsync.
+        """
         try:
-            line = json.dumps(event, sort_keys=True) + "\n"
+            data = encode_events(events)
+        except Exception as e:
+            self._fail(e)
+            return
+
+        self._append(data)
 
-            with open(self.path, "a", encoding="utf-8") as f:
-                f.write(line)
+    def write_encoded(self, data: bytes, event: Dict[str, Any]) -> None:
+        self._append(data)
+
+    def write_batch_encoded(
+        self,
+        lines: List[bytes],
+        events: List[Dict[str, Any]],
+    ) -> None:
+        self._append(b"".join(lines))
+
+    def _append(self, data: bytes) -> None:
+        try:
+            with open(self.path, "ab") as f:
+                f.write(data)
 
                 if self.flush:
                     f.flush()
@@ -75,8 +161,203 @@ class JsonFileSink(AuditSink):
                     os.fsync(f.fileno())
 
         except Exception as e:
-            if self.fail_fast:
-                raise AuditSinkError(
-                    f"Failed to write audit event to {self.path}: {e}"
+            self._fail(e)
+
+    def _fail(self, error: Exception) -> None:
+        if self.fail_fast:
+            raise AuditSinkError(
+                f"Failed to write audit event to {self.path}: {error}"
+            )
+
+
+class GroupCommitJsonFileSink(AuditSink):
+    """
+    Writes audit events as JSON Lines through a persistent file handle,
+    committing concurrent writes in groups.
+
+    Guarantees:
+    - One event per line, append-only (same format as JsonFileSink)
+    - `write` / `write_batch` return only after their events have been
+      written (and fsynced, if enabled): the durability acknowledgement
+      happens before enforcement proceeds
+    - Writes that arrive while a commit is in flight are coalesced into
+      the next commit: one write syscall and one fsync for the group
+
+    A group holds at most `max_batch_size` events. With `max_delay > 0`
+    the committing thread waits up to that many seconds for more events
+    before committing a group that is not full yet.
+
+    Failure behavior:
+    - By default, raises AuditSinkError in every writer of a failed group
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        fsync: bool = True,
+        max_batch_size: int = 256,
+        max_delay: float = 0.0,
+        fail_fast: bool = True,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_delay < 0:
+            raise ValueError("max_delay must not be negative")
+
+        self.path = path
+        self.fsync = fsync
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.fail_fast = fail_fast
+
+        self._fd: Optional[int] = None
+        self._cond = threading.Condition()
+        # (ticket, encoded lines, event count), in arrival order
+        self._pending: Deque[Tuple[int, bytes, int]] = deque()
+        self._pending_events = 0
+        self._next_ticket = 0
+        self._done_through = -1
+        self._failed: Dict[int, str] = {}
+        self._committing = False
+        self._closed = False
+
+    def write(self, event: Dict[str, Any]) -> None:
+        self.write_batch([event])
+
+    def write_batch(self, events: List[Dict[str, Any]]) -> None:
+        try:
+            data = encode_events(events)
+        except Exception as e:
+            self._fail(f"Failed to write audit event to {self.path}: {e}")
+            return
+
+        self._commit(data, len(events))
+
+    def write_encoded(self, data: bytes, event: Dict[str, Any]) -> None:
+        self._commit(data, 1)
+
+    def write_batch_encoded(
+        self,
+        lines: List[bytes],
+        events: List[Dict[str, Any]],
+    ) -> None:
+        self._commit(b"".join(lines), len(lines))
+
+    def close(self) -> None:
+        """
+        Wait for in-flight commits, then close the file handle.
+        """
+        with self._cond:
+            self._closed = True
+            while self._committing or self._pending:
+                self._cond.wait()
+
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+    def __enter__(self) -> "GroupCommitJsonFileSink":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+
+    def _commit(self, data: bytes, count: int) -> None:
+        with self._cond:
+            if self._closed:
+                self._fail(f"Audit sink for {self.path} is closed")
+                return
+
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            self._pending.append((ticket, data, count))
+            self._pending_events += count
+            self._cond.notify_all()
+
+            while self._done_through < ticket:
+                if self._committing:
+                    self._cond.wait()
+                    continue
+
+                self._committing = True
+                try:
+                    self._commit_group()
+                finally:
+                    self._committing = False
+                    self._cond.notify_all()
+
+            error = self._failed.pop(ticket, None)
+
+        if error is not None:
+            self._fail(error)
+
+    def _commit_group(self) -> None:
+        """
+        Commit the oldest pending group. Called with the lock held; the
+        lock is released during file I/O.
+        """
+        if self.max_delay > 0:
+            deadline = time.monotonic() + self.max_delay
+            while self._pending_events < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+        group: List[Tuple[int, bytes, int]] = []
+        count = 0
+        while self._pending and (
+            not group or count + self._pending[0][2] <= self.max_batch_size
+        ):
+            entry = self._pending.popleft()
+            group.append(entry)
+            count += entry[2]
+        self._pending_events -= count
+
+        self._cond.release()
+        try:
+            error = self._write_group(b"".join(data for _, data, _ in group))
+        finally:
+            self._cond.acquire()
+
+        if error is not None:
+            for ticket, _, _ in group:
+                self._failed[ticket] = error
+
+        self._done_through = group[-1][0]
+
+    def _write_group(self, data: bytes) -> Optional[str]:
+        try:
+            if self._fd is None:
+                self._fd = os.open(
+                    self.path,
+                    os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                    0o644,
                 )
 
+            view = memoryview(data)
+            while view:
+                written = os.write(self._fd, view)
+                view = view[written:]
+
+            if self.fsync:
+                os.fsync(self._fd)
+
+        except Exception as e:
+            # Reopen on the next commit
+            if self._fd is not None:
+                try:
+                    os.close(self._fd)
+                except OSError:
+                    pass
+                self._fd = None
+            return f"Failed to write audit event to {self.path}: {e}"
+
+        return None
+
+    def _fail(self, message: str) -> None:
+        if self.fail_fast:
+            raise AuditSinkError(message)
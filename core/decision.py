@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import FrozenInstanceError
 from enum import Enum
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 
 class DecisionType(str, Enum):
@@ -16,19 +18,101 @@ class DecisionType(str, Enum):
     MODIFY = "MODIFY"
 
 
-@dataclass(frozen=True)
+# Metadata of every metadata-free decision: read-only, so one instance
+# can be shared.
+_NO_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+# Shared metadata-free decisions, keyed by every field. Reasons may embed
+# request values (model names, regions), so the cache is bounded; past
+# the bound, decisions are built as usual.
+_SHARED: Dict[Tuple[Any, ...], "Decision"] = {}
+_SHARED_MAX = 4096
+
+_FIELDS = ("decision", "reason", "policy_section", "policy_version", "metadata")
+
+
 class Decision:
     """
     Represents the outcome of a governance policy evaluation.
 
     A Decision is immutable, auditable, and serializable.
+
+    Decisions are slotted, and the factories (`allow`, `block`,
+    `modify`) return one shared instance per distinct metadata-free
+    decision, with interned strings and a read-only empty `metadata`.
+    Enforcement therefore allocates nothing for the common "no policy" /
+    "allowed" outcomes.
     """
 
+    __slots__ = _FIELDS
+
     decision: DecisionType
     reason: str
     policy_section: str
     policy_version: str
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any]
+
+    def __init__(
+        self,
+        decision: DecisionType,
+        reason: str,
+        policy_section: str,
+        policy_version: str,
+        metadata: Optional[Mapping[str, Any]] = None,
+    ):
+        set_field = object.__setattr__
+        set_field(self, "decision", decision)
+        set_field(self, "reason", reason)
+        set_field(self, "policy_section", policy_section)
+        set_field(self, "policy_version", policy_version)
+        set_field(self, "metadata", metadata if metadata else _NO_METADATA)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def _fields(self) -> Tuple[Any, ...]:
+        return (
+            self.decision,
+            self.reason,
+            self.policy_section,
+            self.policy_version,
+            self.metadata,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self is other or self._fields() == other._fields()
+
+    def __hash__(self) -> int:
+        # Like the frozen dataclass this replaces: unhashable metadata
+        # makes the decision unhashable.
+        return hash(self._fields())
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(decision={self.decision!r}, "
+            f"reason={self.reason!r}, policy_section={self.policy_section!r}, "
+            f"policy_version={self.policy_version!r}, "
+            f"metadata={dict(self.metadata)!r})"
+        )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # The shared empty metadata cannot be pickled; it is restored by
+        # __init__.
+        return (
+            self.__class__,
+            (
+                self.decision,
+                self.reason,
+                self.policy_section,
+                self.policy_version,
+                self.metadata or None,
+            ),
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -42,6 +126,33 @@ class Decision:
             "metadata": self.metadata or {},
         }
 
+    @classmethod
+    def _build(
+        cls,
+        decision: DecisionType,
+        reason: str,
+        policy_section: str,
+        policy_version: str,
+        metadata: Optional[Dict[str, Any]],
+    ) -> "Decision":
+        if metadata:
+            return cls(decision, reason, policy_section, policy_version, metadata)
+
+        key = (cls, decision, reason, policy_section, policy_version)
+        shared = _SHARED.get(key)
+
+        if shared is None:
+            shared = cls(
+                decision,
+                sys.intern(reason),
+                sys.intern(policy_section),
+                sys.intern(policy_version),
+            )
+            if len(_SHARED) < _SHARED_MAX:
+                _SHARED[key] = shared
+
+        return shared
+
     @classmethod
     def allow(
         cls,
@@ -50,12 +161,8 @@ class Decision:
         policy_version: str = "0.1",
         metadata: Dict[str, Any] | None = None,
     ) -> "Decision":
-        return cls(
-            decision=DecisionType.ALLOW,
-            reason=reason,
-            policy_section=policy_section,
-            policy_version=policy_version,
-            metadata=metadata or {},
+        return cls._build(
+            DecisionType.ALLOW, reason, policy_section, policy_version, metadata
         )
 
     @classmethod
@@ -66,12 +173,8 @@ class Decision:
         policy_version: str = "0.1",
         metadata: Dict[str, Any] | None = None,
     ) -> "Decision":
-        return cls(
-            decision=DecisionType.BLOCK,
-            reason=reason,
-            policy_section=policy_section,
-            policy_version=policy_version,
-            metadata=metadata or {},
+        return cls._build(
+            DecisionType.BLOCK, reason, policy_section, policy_version, metadata
         )
 
     @classmethod
@@ -82,11 +185,6 @@ class Decision:
         policy_version: str = "0.1",
         metadata: Dict[str, Any] | None = None,
     ) -> "Decision":
-        return cls(
-            decision=DecisionType.MODIFY,
-            reason=reason,
-            policy_section=policy_section,
-            policy_version=policy_version,
-            metadata=metadata or {},
+        return cls._build(
+            DecisionType.MODIFY, reason, policy_section, policy_version, metadata
         )
-
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, Generator, Optional, Union
+
+from core.decision import Decision
+from core.policy_validator import PolicyValidator
+from core.policy.compiled import CompiledPolicy
+from core.audit.emitter import AUDIT_MODE_PER_STAGE, AsyncAuditEventEmitter
+from core.redaction.engine import RedactionEngine
+from core.enforcement.orchestrator import _EnforcementPipeline, _Offload
+from core.telemetry.instrumentation import (
+    STAGE_AUDIT,
+    STAGE_VALIDATE,
+    Instrumentation,
+    Trace,
+)
+
+if TYPE_CHECKING:
+    from core.enforcement.cache import DecisionCache
+    from core.pii.parallel import ParallelScanner
+    from core.redaction.mapped import MappedText
+
+
+class AsyncEnforcementOrchestrator(_EnforcementPipeline):
+    """
+    asyncio-native counterpart of EnforcementOrchestrator.
+
+    Runs the same deterministic stage order and awaits each audit write
+    before evaluating the next stage, so a failing sink still aborts
+    enforcement (fail-fast). Audit I/O never blocks the event loop.
+    """
+
+    def __init__(
+        self,
+        audit_emitter: Optional[AsyncAuditEventEmitter] = None,
+        policy_validator: Optional[PolicyValidator] = None,
+        redaction_engine: Optional[RedactionEngine] = None,
+        audit_mode: str = AUDIT_MODE_PER_STAGE,
+        instrumentation: Optional[Instrumentation] = None,
+        pii_scanner: Optional[ParallelScanner] = None,
+        decision_cache: Optional[DecisionCache] = None,
+    ):
+        super().__init__(
+            policy_validator=policy_validator,
+            redaction_engine=redaction_engine,
+            audit_mode=audit_mode,
+            instrumentation=instrumentation,
+            pii_scanner=pii_scanner,
+            decision_cache=decision_cache,
+        )
+        self.audit_emitter = audit_emitter or AsyncAuditEventEmitter(
+            instrumentation=instrumentation
+        )
+
+    async def enforce(
+        self,
+        policy: Union[Dict[str, Any], CompiledPolicy],
+        *,
+        requested_model: str,
+        requested_max_tokens: Optional[int] = None,
+        region: Optional[str] = None,
+        tool_name: Optional[str] = None,
+        text: Union[str, MappedText, None] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Execute governance enforcement and return the final result.
+
+        Parameters and result are those of `EnforcementOrchestrator.enforce`.
+        """
+
+        trace = self._trace()
+
+        try:
+            compiled = self._compile(policy)
+
+            if trace is not None:
+                trace.mark(STAGE_VALIDATE)
+
+            pipeline = self._pipeline(
+                compiled,
+                self._static_decisions(
+                    compiled,
+                    requested_model=requested_model,
+                    requested_max_tokens=requested_max_tokens,
+                    region=region,
+                    tool_name=tool_name,
+                    trace=trace,
+                    use_cache=isinstance(policy, CompiledPolicy),
+                ),
+                text=text,
+                trace=trace,
+            )
+
+            result = await self._run(pipeline, context, trace)
+
+        except Exception as e:
+            if trace is not None:
+                self.instrumentation.record(trace, error=e)
+            raise
+
+        if trace is not None:
+            self.instrumentation.record(trace, result)
+
+        return result
+
+    async def _run(
+        self,
+        pipeline: Generator[Union[Decision, _Offload], Any, Dict[str, Any]],
+        context: Optional[Dict[str, Any]],
+        trace: Optional[Trace] = None,
+    ) -> Dict[str, Any]:
+        """
+        Drive a pipeline, awaiting each audit write before resuming it.
+
+        Offloaded work (a process-pool PII scan) runs in the loop's default
+        executor, so waiting on it does not block the event loop. In
+        aggregate mode, one event is awaited after the last stage.
+        """
+        aggregate = self._aggregate_audit
+        loop = asyncio.get_running_loop()
+
+        try:
+            item = next(pipeline)
+            while True:
+                if isinstance(item, _Offload):
+                    value = await loop.run_in_executor(None, item.call)
+                    item = pipeline.send(value)
+                    continue
+
+                if not aggregate:
+                    await self.audit_emitter.emit(item, context)
+
+                    if trace is not None:
+                        trace.mark(STAGE_AUDIT)
+
+                item = next(pipeline)
+        except StopIteration as done:
+            result = done.value
+
+        if aggregate:
+            await self.audit_emitter.emit_aggregate(
+                result["final_decision"],
+                result["decisions"],
+                context,
+            )
+
+            if trace is not None:
+                trace.mark(STAGE_AUDIT)
+
+        return result
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+from core.decision import Decision
+
+DEFAULT_MAX_SIZE = 1024
+
+
+class DecisionCache:
+    """
+    Bounded LRU cache of model/region/tool stage decisions.
+
+    Those stages depend only on the policy and on the request tuple
+    (requested_model, requested_max_tokens, region, tool_name), so their
+    decisions can be reused across requests. Keys start with the policy
+    content hash: a changed policy never hits entries of the old one,
+    which age out under LRU eviction.
+
+    Only evaluation is cached. The orchestrator still audits every
+    decision of every request.
+
+    Only enforcement against a CompiledPolicy, and `enforce_batch`, use
+    the cache: hashing a raw policy dict on every call can cost more than
+    the evaluation it would save.
+
+    Thread-safe; one cache may be shared by several orchestrators.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Decision, ...]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Tuple[Decision, ...]]:
+        """
+        Return the cached decisions for `key`, or None (a miss).
+        """
+        with self._lock:
+            try:
+                decisions = self._entries[key]
+            except (KeyError, TypeError):
+                # Unhashable request values are never cached
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return decisions
+
+    def put(self, key: Hashable, decisions: Tuple[Decision, ...]) -> None:
+        with self._lock:
+            try:
+                self._entries[key] = decisions
+            except TypeError:
+                return
+
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry; counters are kept."""
+
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
@@ -1,16 +1,25 @@
 from __future__ import annotations
 
-import re
-from typing import Any, Dict, List
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
 
 from core.decision import Decision
+from core.pii import scanner as _scanner
+from core.pii.scanner import PiiSpan, entity_types, scan_pii_first
 
 
-# --- Simple deterministic PII detectors (v0.1) ---
+def __getattr__(name: str) -> Any:
+    # Re-exported detector regexes (EMAIL_REGEX, ...), compiled on first use
+    return getattr(_scanner, name)
 
-EMAIL_REGEX = re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+")
-PHONE_REGEX = re.compile(r"\b\d{10}\b")
-CREDIT_CARD_REGEX = re.compile(r"\b\d{13,19}\b")
+
+@dataclass(frozen=True)
+class PiiRules:
+    """
+    Pre-extracted `data.pii` policy section, ready for evaluation.
+    """
+
+    action: Optional[str]
 
 
 def detect_pii(text: str) -> List[str]:
@@ -19,42 +28,52 @@ def detect_pii(text: str) -> List[str]:
 
     Returns a list of detected PII entity types.
     """
-    detected = []
+    return entity_types(scan_pii_first(text))
 
-    if EMAIL_REGEX.search(text):
-        detected.append("email")
 
-    if PHONE_REGEX.search(text):
-        detected.append("phone")
+def compile_pii_rules(policy: Dict[str, Any]) -> Optional[PiiRules]:
+    """
+    Extract the `data.pii` section of a policy.
+
+    Returns None when no PII policy is defined.
+    """
+
+    data_policy = policy.get("data", {})
+    pii_policy = data_policy.get("pii")
 
-    if CREDIT_CARD_REGEX.search(text):
-        detected.append("credit_card")
+    if not pii_policy:
+        return None
 
-    return detected
+    return PiiRules(action=pii_policy.get("action"))
 
 
-def enforce_pii_policy(
-    policy: Dict[str, Any],
+def evaluate_pii_rules(
+    rules: Optional[PiiRules],
     text: str,
+    spans: Optional[Sequence[PiiSpan]] = None,
 ) -> Decision:
     """
-    Enforce PII handling rules defined in the policy.
+    Evaluate compiled PII rules against request content.
 
-    Returns a Decision indicating ALLOW, BLOCK, or MODIFY.
+    `spans` may carry the result of `scan_pii(text)` so callers that also
+    redact can reuse a single scan. Only the entity types of the spans
+    are used, so the first span of each type is enough (see
+    `scan_pii_first`).
     """
 
-    data_policy = policy.get("data", {})
-    pii_policy = data_policy.get("pii")
-
     # No PII policy → allow
-    if not pii_policy:
+    if rules is None:
         return Decision.allow(
             reason="No PII policy defined",
             policy_section="data.pii",
         )
 
-    action = pii_policy.get("action")
-    detected_entities = detect_pii(text)
+    action = rules.action
+
+    if spans is None:
+        spans = scan_pii_first(text)
+
+    detected_entities = entity_types(spans)
 
     # No PII detected → allow
     if not detected_entities:
@@ -91,3 +110,15 @@ def enforce_pii_policy(
         policy_section="data.pii",
     )
 
+
+def enforce_pii_policy(
+    policy: Dict[str, Any],
+    text: str,
+) -> Decision:
+    """
+    Enforce PII handling rules defined in the policy.
+
+    Returns a Decision indicating ALLOW, BLOCK, or MODIFY.
+    """
+
+    return evaluate_pii_rules(compile_pii_rules(policy), text)
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from core.decision import Decision
+from core.keywords.automaton import KeywordAutomaton
+from core.pii.scanner import PiiSpan
+
+
+@dataclass(frozen=True)
+class KeywordRules:
+    """
+    Pre-extracted `data.keywords` policy section, ready for evaluation.
+
+    The automaton is built once here, so scanning a request costs time
+    linear in its text, independent of the number of terms.
+    """
+
+    action: Optional[str]
+    automaton: KeywordAutomaton
+
+    def find(self, text: str) -> Sequence[PiiSpan]:
+        return self.automaton.find(text)
+
+
+@lru_cache(maxsize=32)
+def _keyword_automaton(
+    terms: Tuple[str, ...],
+    ignore_case: bool,
+    whole_word: bool,
+) -> KeywordAutomaton:
+    return KeywordAutomaton(terms, ignore_case=ignore_case, whole_word=whole_word)
+
+
+def compile_keyword_rules(policy: Dict[str, Any]) -> Optional[KeywordRules]:
+    """
+    Extract the `data.keywords` section of a policy.
+
+    Returns None when no keyword policy is defined.
+    """
+
+    data_policy = policy.get("data", {})
+    keyword_policy = data_policy.get("keywords")
+
+    if not keyword_policy:
+        return None
+
+    terms = tuple(keyword_policy.get("terms") or ())
+    ignore_case = keyword_policy.get("ignore_case", True)
+    whole_word = keyword_policy.get("whole_word", True)
+
+    # Raw policy dicts are compiled on every enforcement: reuse the
+    # automaton of identical term lists rather than rebuild it.
+    try:
+        automaton = _keyword_automaton(terms, ignore_case, whole_word)
+    except TypeError:
+        # Unhashable terms (unvalidated policy)
+        automaton = KeywordAutomaton(
+            terms, ignore_case=ignore_case, whole_word=whole_word
+        )
+
+    return KeywordRules(
+        action=keyword_policy.get("action"),
+        automaton=automaton,
+    )
+
+
+def evaluate_keyword_rules(
+    rules: Optional[KeywordRules],
+    text: str,
+    spans: Optional[Sequence[PiiSpan]] = None,
+) -> Decision:
+    """
+    Evaluate compiled keyword rules against request content.
+
+    `spans` may carry the result of `rules.find(text)` so callers that
+    also redact can reuse a single scan. Matched terms are not recorded
+    in the decision: they may be as sensitive as the content itself.
+    """
+
+    # No keyword policy → allow
+    if rules is None:
+        return Decision.allow(
+            reason="No keyword policy defined",
+            policy_section="data.keywords",
+        )
+
+    if spans is None:
+        spans = rules.find(text)
+
+    # No restricted term found → allow
+    if not spans:
+        return Decision.allow(
+            reason="No restricted keywords found in content",
+            policy_section="data.keywords",
+        )
+
+    metadata = {"keyword_matches": len(spans)}
+
+    if rules.action == "block":
+        return Decision.block(
+            reason="Restricted keywords detected and policy requires blocking",
+            policy_section="data.keywords",
+            metadata=metadata,
+        )
+
+    if rules.action == "redact":
+        return Decision.modify(
+            reason="Restricted keywords detected and policy requires redaction",
+            policy_section="data.keywords",
+            metadata=metadata,
+        )
+
+    # Defensive fallback (should not happen if validated)
+    return Decision.block(
+        reason=f"Unknown keyword action '{rules.action}'",
+        policy_section="data.keywords",
+    )
+
+
+def enforce_keyword_policy(
+    policy: Dict[str, Any],
+    text: str,
+) -> Decision:
+    """
+    Enforce restricted-keyword rules defined in the policy.
+
+    Returns a Decision indicating ALLOW, BLOCK, or MODIFY.
+    """
+
+    return evaluate_keyword_rules(compile_keyword_rules(policy), text)
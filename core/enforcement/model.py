@@ -1,59 +1,169 @@
 from __future__ import annotations
 
 import fnmatch
-from typing import Any, Dict, Optional
+import os
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 from core.decision import Decision
 
 
-def enforce_model_policy(
-    policy: Dict[str, Any],
-    requested_model: str,
-    requested_max_tokens: Optional[int] = None,
-) -> Decision:
+_GLOB_CHARS = frozenset("*?[")
+
+VERDICT_CACHE_SIZE = 1024
+
+
+class PatternSet:
     """
-    Enforce model allow/deny rules defined in the policy.
+    An ordered list of fnmatch patterns compiled for single-pass matching.
 
-    Returns a Decision indicating whether the requested model
-    may be used.
+    Literal patterns are resolved with a dict lookup; glob patterns are
+    combined into one regex. `first_match` returns the earliest pattern
+    (in policy order) that matches, exactly like looping `fnmatch.fnmatch`.
+    """
+
+    def __init__(self, patterns: Sequence[str]):
+        self.patterns = tuple(patterns)
+        self._literals: Dict[str, int] = {}
+        self._regex: Optional[re.Pattern] = None
+
+        alternatives = []
+        for index, pattern in enumerate(self.patterns):
+            normalized = os.path.normcase(pattern)
+            if _GLOB_CHARS.isdisjoint(normalized):
+                self._literals.setdefault(normalized, index)
+            else:
+                alternatives.append(
+                    f"(?P<p{index}>{fnmatch.translate(normalized)})"
+                )
+
+        if alternatives:
+            self._regex = re.compile("|".join(alternatives))
+
+    def __bool__(self) -> bool:
+        return bool(self.patterns)
+
+    def first_match(self, name: str) -> Optional[str]:
+        name = os.path.normcase(name)
+        index = self._literals.get(name)
+
+        if self._regex is not None:
+            match = self._regex.match(name)
+            if match is not None:
+                glob_index = int(match.lastgroup[1:])
+                if index is None or glob_index < index:
+                    index = glob_index
+
+        return None if index is None else self.patterns[index]
+
+
+class ModelMatcher:
+    """
+    Combined deny/allow matcher with a bounded model-name → verdict LRU.
+
+    A verdict is `(denied_by, allowed)`: the first deny pattern matching
+    the model (or None) and whether the allowlist admits it.
+    """
+
+    def __init__(
+        self,
+        allow: Sequence[str],
+        deny: Sequence[str],
+        cache_size: int = VERDICT_CACHE_SIZE,
+    ):
+        self.allow = PatternSet(allow)
+        self.deny = PatternSet(deny)
+        self.verdict = lru_cache(maxsize=cache_size)(self._verdict)
+
+    def _verdict(self, model: str) -> Tuple[Optional[str], bool]:
+        denied_by = self.deny.first_match(model)
+        if denied_by is not None:
+            return denied_by, False
+
+        if not self.allow:
+            return None, True
+
+        return None, self.allow.first_match(model) is not None
+
+
+@lru_cache(maxsize=128)
+def _model_matcher(allow: Tuple[str, ...], deny: Tuple[str, ...]) -> ModelMatcher:
+    return ModelMatcher(allow, deny)
+
+
+@dataclass(frozen=True)
+class ModelRules:
+    """
+    Pre-extracted `model` policy section, ready for evaluation.
+    """
+
+    allow: Tuple[str, ...]
+    deny: Tuple[str, ...]
+    max_tokens: Optional[int]
+    matcher: ModelMatcher = field(compare=False, repr=False)
+
+
+def compile_model_rules(policy: Dict[str, Any]) -> Optional[ModelRules]:
+    """
+    Extract the `model` section of a policy.
+
+    Returns None when no model policy is defined.
     """
 
     model_policy = policy.get("model")
 
-    # No model policy → allow by default
     if not model_policy:
+        return None
+
+    allow = tuple(model_policy.get("allow") or ())
+    deny = tuple(model_policy.get("deny") or ())
+
+    return ModelRules(
+        allow=allow,
+        deny=deny,
+        max_tokens=model_policy.get("max_tokens"),
+        matcher=_model_matcher(allow, deny),
+    )
+
+
+def evaluate_model_rules(
+    rules: Optional[ModelRules],
+    requested_model: str,
+    requested_max_tokens: Optional[int] = None,
+) -> Decision:
+    """
+    Evaluate compiled model rules against a request.
+    """
+
+    # No model policy → allow by default
+    if rules is None:
         return Decision.allow(
             reason="No model policy defined",
             policy_section="model",
         )
 
-    allow_list = model_policy.get("allow", [])
-    deny_list = model_policy.get("deny", [])
-    max_tokens = model_policy.get("max_tokens")
+    denied_by, allowed = rules.matcher.verdict(requested_model)
 
     # Deny always wins
-    for pattern in deny_list:
-        if fnmatch.fnmatch(requested_model, pattern):
-            return Decision.block(
-                reason=f"Model '{requested_model}' is explicitly denied by policy",
-                policy_section="model.deny",
-                metadata={"model": requested_model, "matched_pattern": pattern},
-            )
+    if denied_by is not None:
+        return Decision.block(
+            reason=f"Model '{requested_model}' is explicitly denied by policy",
+            policy_section="model.deny",
+            metadata={"model": requested_model, "matched_pattern": denied_by},
+        )
 
     # If allow list exists, model must match
-    if allow_list:
-        allowed = any(
-            fnmatch.fnmatch(requested_model, pattern)
-            for pattern in allow_list
+    if not allowed:
+        return Decision.block(
+            reason=f"Model '{requested_model}' is not in allowlist",
+            policy_section="model.allow",
+            metadata={"model": requested_model},
         )
-        if not allowed:
-            return Decision.block(
-                reason=f"Model '{requested_model}' is not in allowlist",
-                policy_section="model.allow",
-                metadata={"model": requested_model},
-            )
 
     # Token limit enforcement (if applicable)
+    max_tokens = rules.max_tokens
     if max_tokens is not None and requested_max_tokens is not None:
         if requested_max_tokens > max_tokens:
             return Decision.block(
@@ -74,3 +184,21 @@ def enforce_model_policy(
         metadata={"model": requested_model},
     )
 
+
+def enforce_model_policy(
+    policy: Dict[str, Any],
+    requested_model: str,
+    requested_max_tokens: Optional[int] = None,
+) -> Decision:
+    """
+    Enforce model allow/deny rules defined in the policy.
+
+    Returns a Decision indicating whether the requested model
+    may be used.
+    """
+
+    return evaluate_model_rules(
+        compile_model_rules(policy),
+        requested_model=requested_model,
+        requested_max_tokens=requested_max_tokens,
+    )
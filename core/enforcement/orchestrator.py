@@ -1,155 +1,437 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Hashable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from core.decision import Decision, DecisionType
 from core.policy_validator import PolicyValidator
-from core.audit.emitter import AuditEventEmitter
-from core.enforcement.model import enforce_model_policy
-from core.enforcement.data import enforce_pii_policy
+from core.policy.compiled import CompiledPolicy
+from core.audit.emitter import (
+    AUDIT_MODE_AGGREGATE,
+    AUDIT_MODE_PER_STAGE,
+    AUDIT_MODES,
+    AuditEvent,
+    AuditEventEmitter,
+)
+from core.enforcement.model import evaluate_model_rules
+from core.enforcement.data import evaluate_pii_rules
+from core.enforcement.keywords import evaluate_keyword_rules
+from core.pii.scanner import PiiSpan, scan_pii, scan_pii_first
 from core.redaction.engine import RedactionEngine
-from core.enforcement.region import enforce_region_policy
-from core.enforcement.tools import enforce_tool_policy
+from core.redaction.mapped import MappedText
+from core.enforcement.region import evaluate_region_rules
+from core.enforcement.tools import evaluate_tool_rules
+from core.telemetry.instrumentation import (
+    STAGE_AUDIT,
+    STAGE_KEYWORDS,
+    STAGE_MODEL,
+    STAGE_PII,
+    STAGE_PII_SCAN,
+    STAGE_REDACTION,
+    STAGE_REGION,
+    STAGE_TOOLS,
+    STAGE_VALIDATE,
+    Instrumentation,
+    Trace,
+)
+
+if TYPE_CHECKING:
+    from core.enforcement.cache import DecisionCache
+    from core.pii.parallel import ParallelScanner
+
+# Stages evaluated by `_static_decisions`, in order
+_STATIC_STAGES = (STAGE_MODEL, STAGE_REGION, STAGE_TOOLS)
+
+
+class _Offload(NamedTuple):
+    """
+    Blocking work a pipeline hands to its driver, which sends the result
+    back into the generator. The async driver runs it off the event loop.
+    """
 
+    call: Callable[[], Any]
 
-class EnforcementOrchestrator:
-    """
-    Orchestrates governance enforcement in a deterministic order.
 
-    This is the primary runtime entry point for ai-governor.
+class _EnforcementPipeline:
+    """
+    Shared, I/O-free core of the sync and async orchestrators.
+
+    `_pipeline` is a generator that yields every decision that must be
+    audited, in enforcement order, and returns the final result. Drivers
+    emit each yielded decision before resuming the generator, which keeps
+    the fail-fast audit semantics identical across drivers. A pool scan
+    is yielded as an `_Offload`, whose result the driver sends back.
+
+    `audit_mode` selects how decisions are audited:
+    - "per_stage" (default): one event per stage decision, emitted as
+      soon as the stage is decided
+    - "aggregate": one event per enforcement run, carrying every stage
+      decision and the final decision, emitted before the result is
+      returned
+
+    With an `instrumentation`, every run is traced stage by stage (see
+    core.telemetry.instrumentation). Without one, each hook is a single
+    `is not None` check.
+
+    With a `pii_scanner` (core.pii.parallel.ParallelScanner), large
+    texts are scanned for PII in a process pool; the spans, and so every
+    decision and redaction, are identical to a serial scan.
+
+    With a `decision_cache` (core.enforcement.cache.DecisionCache),
+    model/region/tool decisions are reused across requests with the same
+    policy and request tuple. Every decision is still audited per request.
+    Only CompiledPolicy instances (and batches) use the cache: its key
+    starts with the policy content hash, which a raw policy dict would
+    need recomputed on every call, at a cost that can exceed the
+    evaluation it saves.
+
+    `text` may also be a core.redaction.mapped.MappedText: PII stages then
+    run over the mapped file, redaction is left to `MappedText.write`, and
+    `output_text` is None.
     """
 
     def __init__(
         self,
-        audit_emitter: Optional[AuditEventEmitter] = None,
         policy_validator: Optional[PolicyValidator] = None,
         redaction_engine: Optional[RedactionEngine] = None,
+        audit_mode: str = AUDIT_MODE_PER_STAGE,
+        instrumentation: Optional[Instrumentation] = None,
+        pii_scanner: Optional[ParallelScanner] = None,
+        decision_cache: Optional[DecisionCache] = None,
     ):
-        self.audit_emitter = audit_emitter or AuditEventEmitter()
+        if audit_mode not in AUDIT_MODES:
+            raise ValueError(
+                f"Unknown audit mode '{audit_mode}'. "
+                f"Expected one of: {', '.join(AUDIT_MODES)}"
+            )
+
         self.policy_validator = policy_validator or PolicyValidator()
         self.redaction_engine = redaction_engine or RedactionEngine()
+        self.audit_mode = audit_mode
+        self.instrumentation = instrumentation
+        self.pii_scanner = pii_scanner
+        self.decision_cache = decision_cache
 
-    def enforce(
+    def _scan_pii(
         self,
-        policy: Dict[str, Any],
+        text: Union[str, MappedText],
         *,
-        requested_model: str,
-        requested_max_tokens: Optional[int] = None,
-        region: Optional[str] = None,
-        tool_name: Optional[str] = None,
-        text: Optional[str] = None,
-        context: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
+        first_only: bool,
+    ) -> List[PiiSpan]:
         """
-        Execute governance enforcement and return the final result.
-
-        Returns:
-        {
-          "final_decision": Decision,
-          "decisions": List[Decision],
-          "output_text": Optional[str]
-        }
+        Scan text for PII. With `first_only`, only the first span of each
+        entity type is needed (detection without redaction).
         """
+        if isinstance(text, MappedText):
+            return text.scan_pii()
+        if self.pii_scanner is not None:
+            if first_only:
+                return self.pii_scanner.scan_first(text)
+            return self.pii_scanner.scan(text)
+        if first_only:
+            return scan_pii_first(text)
+        return scan_pii(text)
+
+    @property
+    def _aggregate_audit(self) -> bool:
+        return self.audit_mode == AUDIT_MODE_AGGREGATE
+
+    def _trace(self) -> Optional[Trace]:
+        instrumentation = self.instrumentation
+        return instrumentation.trace() if instrumentation is not None else None
+
+    def _compile(
+        self,
+        policy: Union[Dict[str, Any], CompiledPolicy],
+    ) -> CompiledPolicy:
+        """
+        Return a CompiledPolicy, validating raw policy dicts first.
+        """
+        if isinstance(policy, CompiledPolicy):
+            return policy
 
-        # ------------------------------------------------------------------
-        # 1. Validate policy
-        # ------------------------------------------------------------------
         validation = self.policy_validator.validate(policy)
         if not validation.valid:
             raise ValueError(f"Invalid policy: {validation.errors}")
 
-        decisions: List[Decision] = []
-        output_text: Optional[str] = text
+        return CompiledPolicy.from_policy(validation.policy)
+
+    def _static_decisions(
+        self,
+        compiled: CompiledPolicy,
+        *,
+        requested_model: str,
+        requested_max_tokens: Optional[int],
+        region: Optional[str],
+        tool_name: Optional[str],
+        trace: Optional[Trace] = None,
+        use_cache: bool = True,
+    ) -> Tuple[Decision, ...]:
+        """
+        Return the decisions of the stages that do not depend on request
+        content, from the decision cache when one is configured and
+        `use_cache` is set.
+        """
+        cache = self.decision_cache if use_cache else None
+        if cache is None:
+            return self._evaluate_static_stages(
+                compiled,
+                requested_model=requested_model,
+                requested_max_tokens=requested_max_tokens,
+                region=region,
+                tool_name=tool_name,
+                trace=trace,
+            )
+
+        key = (
+            compiled.content_hash,
+            requested_model,
+            requested_max_tokens,
+            region,
+            tool_name,
+        )
+
+        decisions = cache.get(key)
+        if decisions is None:
+            decisions = self._evaluate_static_stages(
+                compiled,
+                requested_model=requested_model,
+                requested_max_tokens=requested_max_tokens,
+                region=region,
+                tool_name=tool_name,
+                trace=trace,
+            )
+            cache.put(key, decisions)
+        elif trace is not None:
+            self._mark_static_stages(trace, decisions)
+
+        return decisions
+
+    @staticmethod
+    def _mark_static_stages(trace: Trace, decisions: Sequence[Decision]) -> None:
+        """
+        Mark reused static decisions on a trace, so per-stage decision
+        metrics stay identical to an evaluation.
+        """
+        for stage, decision in zip(_STATIC_STAGES, decisions):
+            trace.mark(stage, decision)
+
+    @staticmethod
+    def _evaluate_static_stages(
+        compiled: CompiledPolicy,
+        *,
+        requested_model: str,
+        requested_max_tokens: Optional[int],
+        region: Optional[str],
+        tool_name: Optional[str],
+        trace: Optional[Trace] = None,
+    ) -> Tuple[Decision, ...]:
+        """
+        Evaluate the stages that do not depend on request content.
+
+        Stops after the first BLOCK, so the returned tuple holds exactly
+        the decisions the pipeline records before reaching the content stages.
+        """
 
         # ------------------------------------------------------------------
         # 2. Model enforcement
         # ------------------------------------------------------------------
-        model_decision = enforce_model_policy(
-            policy=policy,
+        model_decision = evaluate_model_rules(
+            compiled.model,
             requested_model=requested_model,
             requested_max_tokens=requested_max_tokens,
         )
 
-        decisions.append(model_decision)
-        self.audit_emitter.emit(model_decision, context)
+        if trace is not None:
+            trace.mark(STAGE_MODEL, model_decision)
 
         if model_decision.decision == DecisionType.BLOCK:
-            return self._finalize(model_decision, decisions, output_text)
+            return (model_decision,)
 
         # ------------------------------------------------------------------
         # 3. Region enforcement
         # ------------------------------------------------------------------
-        region_decision = enforce_region_policy(
-            policy=policy,
+        region_decision = evaluate_region_rules(
+            compiled.regions,
             region=region,
         )
 
-        decisions.append(region_decision)
-        self.audit_emitter.emit(region_decision, context)
+        if trace is not None:
+            trace.mark(STAGE_REGION, region_decision)
 
         if region_decision.decision == DecisionType.BLOCK:
-            return self._finalize(region_decision, decisions, output_text)
+            return (model_decision, region_decision)
 
         # ------------------------------------------------------------------
         # 4. Tool enforcement (v0.3)
         # ------------------------------------------------------------------
-        tool_decision = enforce_tool_policy(
-            policy=policy,
+        tool_decision = evaluate_tool_rules(
+            compiled.tools,
             tool_name=tool_name,
         )
 
-        decisions.append(tool_decision)
-        self.audit_emitter.emit(tool_decision, context)
+        if trace is not None:
+            trace.mark(STAGE_TOOLS, tool_decision)
 
-        if tool_decision.decision == DecisionType.BLOCK:
-            return self._finalize(tool_decision, decisions, output_text)
+        return (model_decision, region_decision, tool_decision)
+
+    def _pipeline(
+        self,
+        compiled: CompiledPolicy,
+        static_decisions: Sequence[Decision],
+        *,
+        text: Union[str, MappedText, None],
+        trace: Optional[Trace] = None,
+    ) -> Generator[Union[Decision, _Offload], Any, Dict[str, Any]]:
+        """
+        Record stage decisions in order, then run the content stages
+        (keywords, PII) and redaction.
+
+        Yields each decision to be audited, and an `_Offload` for a PII
+        scan that waits on the scanner's process pool; returns the final
+        result.
+        """
+
+        decisions: List[Decision] = []
+        output_text = text if isinstance(text, str) else None
+
+        for decision in static_decisions:
+            decisions.append(decision)
+            yield decision
+
+            if decision.decision == DecisionType.BLOCK:
+                return self._finalize(decision, decisions, output_text)
 
-        # ------------------------------------------------------------------
-        # 5. PII / data enforcement
-        # ------------------------------------------------------------------
         if text is not None:
-            pii_decision = enforce_pii_policy(
-                policy=policy,
+            # --------------------------------------------------------------
+            # 5. Keyword enforcement (only when configured)
+            # --------------------------------------------------------------
+            keyword_decision: Optional[Decision] = None
+            keyword_spans: Sequence[PiiSpan] = ()
+
+            if compiled.keywords is not None:
+                if isinstance(text, MappedText):
+                    raise ValueError("Keyword rules cannot be enforced on mapped text")
+
+                keyword_spans = compiled.keywords.find(text)
+                keyword_decision = evaluate_keyword_rules(
+                    compiled.keywords,
+                    text=text,
+                    spans=keyword_spans,
+                )
+
+                if trace is not None:
+                    trace.mark(STAGE_KEYWORDS, keyword_decision)
+
+                decisions.append(keyword_decision)
+                yield keyword_decision
+
+                if keyword_decision.decision == DecisionType.BLOCK:
+                    return self._finalize(keyword_decision, decisions, output_text)
+
+            # --------------------------------------------------------------
+            # 6. PII / data enforcement
+            # --------------------------------------------------------------
+            # One scan serves both detection and redaction; detection
+            # alone stops at the first span of each entity type
+            spans: Optional[List[PiiSpan]] = None
+
+            if compiled.pii is not None:
+                scan = partial(
+                    self._scan_pii,
+                    text,
+                    first_only=compiled.pii.action != "redact",
+                )
+                if (
+                    self.pii_scanner is not None
+                    and isinstance(text, str)
+                    and self.pii_scanner.uses_pool(text)
+                ):
+                    spans = yield _Offload(scan)
+                else:
+                    spans = scan()
+
+            if trace is not None:
+                trace.mark(STAGE_PII_SCAN)
+
+            pii_decision = evaluate_pii_rules(
+                compiled.pii,
                 text=text,
+                spans=spans,
             )
 
+            if trace is not None:
+                trace.mark(STAGE_PII, pii_decision)
+
             decisions.append(pii_decision)
-            self.audit_emitter.emit(pii_decision, context)
+            yield pii_decision
 
             # BLOCK short-circuits
             if pii_decision.decision == DecisionType.BLOCK:
                 return self._finalize(pii_decision, decisions, output_text)
 
-            # MODIFY triggers deterministic redaction
-            if pii_decision.decision == DecisionType.MODIFY:
-                redaction_result = self.redaction_engine.redact(text)
-
-                # Replace last decision with enriched MODIFY decision
-                pii_decision = Decision.modify(
-                    reason=pii_decision.reason,
-                    policy_section=pii_decision.policy_section,
-                    policy_version=pii_decision.policy_version,
-                    metadata={
-                        **pii_decision.metadata,
-                        "redacted_entities": redaction_result.redacted_entities,
-                    },
+            # MODIFY triggers deterministic redaction of every span whose
+            # stage asked for it, in a single pass: overlapping keyword
+            # and PII spans are coalesced into one redacted range
+            redact_keywords = (
+                keyword_decision is not None
+                and keyword_decision.decision == DecisionType.MODIFY
+            )
+            redact_pii = pii_decision.decision == DecisionType.MODIFY
+
+            if redact_keywords or redact_pii:
+                redact_spans = [
+                    *(spans if redact_pii else ()),
+                    *(keyword_spans if redact_keywords else ()),
+                ]
+
+                if isinstance(text, MappedText):
+                    redacted_entities = text.redact(redact_spans)
+                else:
+                    redaction_result = self.redaction_engine.redact(text, redact_spans)
+                    redacted_entities = redaction_result.redacted_entities
+                    output_text = redaction_result.text
+
+                if trace is not None:
+                    trace.mark(STAGE_REDACTION)
+
+                # Replace modifying decisions with enriched MODIFY decisions
+                redacted = {"redacted_entities": redacted_entities}
+
+                if redact_keywords:
+                    keyword_decision = _enriched(keyword_decision, redacted)
+                    decisions[-2] = keyword_decision
+
+                if redact_pii:
+                    pii_decision = _enriched(pii_decision, redacted)
+                    decisions[-1] = pii_decision
+
+                return self._finalize(
+                    pii_decision if redact_pii else keyword_decision,
+                    decisions,
+                    output_text,
                 )
 
-                decisions[-1] = pii_decision
-                output_text = redaction_result.text
-
-                return self._finalize(pii_decision, decisions, output_text)
-
         # ------------------------------------------------------------------
-        # 6. Resolve final decision
+        # 7. Resolve final decision
         # ------------------------------------------------------------------
         final_decision = self._resolve_final(decisions)
         return self._finalize(final_decision, decisions, output_text)
 
-    # ======================================================================
-    # Helper methods
-    # ======================================================================
-
     @staticmethod
     def _resolve_final(decisions: List[Decision]) -> Decision:
         """
@@ -180,3 +462,262 @@ class EnforcementOrchestrator:
             "output_text": output_text,
         }
 
+
+class EnforcementOrchestrator(_EnforcementPipeline):
+    """
+    Orchestrates governance enforcement in a deterministic order.
+
+    This is the primary runtime entry point for ai-governor.
+    """
+
+    def __init__(
+        self,
+        audit_emitter: Optional[AuditEventEmitter] = None,
+        policy_validator: Optional[PolicyValidator] = None,
+        redaction_engine: Optional[RedactionEngine] = None,
+        audit_mode: str = AUDIT_MODE_PER_STAGE,
+        instrumentation: Optional[Instrumentation] = None,
+        pii_scanner: Optional[ParallelScanner] = None,
+        decision_cache: Optional[DecisionCache] = None,
+    ):
+        super().__init__(
+            policy_validator=policy_validator,
+            redaction_engine=redaction_engine,
+            audit_mode=audit_mode,
+            instrumentation=instrumentation,
+            pii_scanner=pii_scanner,
+            decision_cache=decision_cache,
+        )
+        self.audit_emitter = audit_emitter or AuditEventEmitter(
+            instrumentation=instrumentation
+        )
+
+    def enforce(
+        self,
+        policy: Union[Dict[str, Any], CompiledPolicy],
+        *,
+        requested_model: str,
+        requested_max_tokens: Optional[int] = None,
+        region: Optional[str] = None,
+        tool_name: Optional[str] = None,
+        text: Union[str, MappedText, None] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Execute governance enforcement and return the final result.
+
+        `policy` may be a raw policy dict (validated on every call) or a
+        CompiledPolicy (already validated, used as-is).
+
+        Returns:
+        {
+          "final_decision": Decision,
+          "decisions": List[Decision],
+          "output_text": Optional[str]
+        }
+        """
+
+        trace = self._trace()
+
+        try:
+            # --------------------------------------------------------------
+            # 1. Validate policy
+            # --------------------------------------------------------------
+            compiled = self._compile(policy)
+
+            if trace is not None:
+                trace.mark(STAGE_VALIDATE)
+
+            pipeline = self._pipeline(
+                compiled,
+                self._static_decisions(
+                    compiled,
+                    requested_model=requested_model,
+                    requested_max_tokens=requested_max_tokens,
+                    region=region,
+                    tool_name=tool_name,
+                    trace=trace,
+                    use_cache=isinstance(policy, CompiledPolicy),
+                ),
+                text=text,
+                trace=trace,
+            )
+
+            if self._aggregate_audit:
+                result = self._run(pipeline, emit=_discard)
+                self.audit_emitter.emit_aggregate(
+                    result["final_decision"],
+                    result["decisions"],
+                    context,
+                )
+
+                if trace is not None:
+                    trace.mark(STAGE_AUDIT)
+            else:
+                result = self._run(
+                    pipeline,
+                    emit=lambda decision: self.audit_emitter.emit(decision, context),
+                    trace=trace,
+                )
+
+        except Exception as e:
+            if trace is not None:
+                self.instrumentation.record(trace, error=e)
+            raise
+
+        if trace is not None:
+            self.instrumentation.record(trace, result)
+
+        return result
+
+    def enforce_batch(
+        self,
+        policy: Union[Dict[str, Any], CompiledPolicy],
+        requests: Sequence[Mapping[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Enforce a batch of requests against one policy.
+
+        Each request is a mapping with the keyword arguments of `enforce`
+        (`requested_model` is required). Results are returned in input
+        order and are identical to calling `enforce` once per request.
+
+        The policy is validated once, model/region/tool stages are
+        evaluated once per distinct request tuple, and all audit events
+        of the batch are handed to each sink as one group write after
+        evaluation. If that write fails, the whole batch fails. If a
+        request fails, the events of the requests before it are still
+        written before the error propagates.
+
+        With instrumentation, each request is traced without the shared
+        validation and audit write, which are not attributable to it.
+        """
+
+        compiled = self._compile(policy)
+
+        static_cache: Dict[Hashable, Tuple[Decision, ...]] = {}
+        events: List[AuditEvent] = []
+        results: List[Dict[str, Any]] = []
+        emitter = self.audit_emitter
+
+        try:
+            for request in requests:
+                unknown = set(request) - _BATCH_REQUEST_KEYS
+                if unknown:
+                    raise ValueError(
+                        f"Unknown batch request keys: {', '.join(sorted(unknown))}"
+                    )
+
+                key = (
+                    request["requested_model"],
+                    request.get("requested_max_tokens"),
+                    request.get("region"),
+                    request.get("tool_name"),
+                )
+
+                trace = self._trace()
+
+                static = static_cache.get(key)
+                if static is not None:
+                    if trace is not None:
+                        self._mark_static_stages(trace, static)
+                else:
+                    static = self._static_decisions(
+                        compiled,
+                        requested_model=key[0],
+                        requested_max_tokens=key[1],
+                        region=key[2],
+                        tool_name=key[3],
+                        trace=trace,
+                    )
+                    static_cache[key] = static
+
+                context = request.get("context")
+                pipeline = self._pipeline(
+                    compiled,
+                    static,
+                    text=request.get("text"),
+                    trace=trace,
+                )
+
+                if self._aggregate_audit:
+                    result = self._run(pipeline, emit=_discard)
+                    events.append(
+                        emitter.aggregate_event(
+                            result["final_decision"],
+                            result["decisions"],
+                            context,
+                        )
+                    )
+                else:
+                    result = self._run(
+                        pipeline,
+                        emit=lambda decision, context=context: events.append(
+                            emitter.stage_event(decision, context)
+                        ),
+                    )
+
+                if trace is not None:
+                    self.instrumentation.record(trace, result)
+
+                results.append(result)
+        finally:
+            # Decisions made so far are audited even when a request fails
+            emitter.emit_events(events)
+
+        return results
+
+    @staticmethod
+    def _run(
+        pipeline: Generator[Union[Decision, _Offload], Any, Dict[str, Any]],
+        *,
+        emit: Callable[[Decision], Any],
+        trace: Optional[Trace] = None,
+    ) -> Dict[str, Any]:
+        """
+        Drive a pipeline, emitting each decision before resuming it.
+        Offloaded work runs inline.
+        """
+        try:
+            item = next(pipeline)
+            while True:
+                if isinstance(item, _Offload):
+                    item = pipeline.send(item.call())
+                    continue
+
+                emit(item)
+
+                if trace is not None:
+                    trace.mark(STAGE_AUDIT)
+
+                item = next(pipeline)
+        except StopIteration as done:
+            return done.value
+
+
+def _enriched(decision: Decision, metadata: Dict[str, Any]) -> Decision:
+    """
+    Return a MODIFY decision with extra metadata.
+    """
+    return Decision.modify(
+        reason=decision.reason,
+        policy_section=decision.policy_section,
+        policy_version=decision.policy_version,
+        metadata={**decision.metadata, **metadata},
+    )
+
+
+def _discard(decision: Decision) -> None:
+    """Emit callback for aggregate mode: stages are audited at the end."""
+
+
+_BATCH_REQUEST_KEYS = frozenset(
+    {
+        "requested_model",
+        "requested_max_tokens",
+        "region",
+        "tool_name",
+        "text",
+        "context",
+    }
+)
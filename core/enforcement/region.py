@@ -1,34 +1,136 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 from core.decision import Decision
 
 
-def enforce_region_policy(
-    policy: Dict[str, Any],
-    region: Optional[str],
-) -> Decision:
+# Separates the levels of a hierarchical region code: "EU-DE" is inside "EU"
+REGION_SEPARATOR = "-"
+
+
+def _segments(region: Any) -> Tuple[Any, ...]:
+    if isinstance(region, str):
+        return tuple(region.split(REGION_SEPARATOR))
+    # Non-string codes (e.g. YAML numbers) are single-level
+    return (region,)
+
+
+class _RegionNode:
+    __slots__ = ("allowed", "code", "children")
+
+    def __init__(self) -> None:
+        # None when no rule names this exact code
+        self.allowed: Optional[bool] = None
+        self.code: Any = None
+        self.children: Dict[Any, _RegionNode] = {}
+
+
+class RegionIndex:
     """
-    Enforce region / jurisdiction governance rules.
+    Prefix trie of allow/deny region rules.
 
-    Region must be explicitly provided by the caller.
+    A rule applies to its code and every code below it. `lookup` walks a
+    region one level at a time and returns the deepest rule on the way,
+    so a check costs O(depth) however many rules the policy has.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self, allowed: Iterable[Any], denied: Iterable[Any] = ()):
+        self._root = _RegionNode()
+
+        for code in allowed:
+            self._insert(code, True)
+
+        # Denies are inserted last: they win over an allow of the same code
+        for code in denied:
+            self._insert(code, False)
+
+    def _insert(self, code: Any, allowed: bool) -> None:
+        node = self._root
+        for segment in _segments(code):
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _RegionNode()
+            node = child
+
+        node.allowed = allowed
+        node.code = code
+
+    def lookup(self, region: Any) -> Optional[Tuple[Any, bool]]:
+        """
+        Return (rule code, allowed) of the deepest rule covering
+        `region`, or None when no rule covers it.
+        """
+        node = self._root
+        match: Optional[Tuple[Any, bool]] = None
+
+        for segment in _segments(region):
+            node = node.children.get(segment)
+            if node is None:
+                break
+            if node.allowed is not None:
+                match = (node.code, node.allowed)
+
+        return match
+
+
+@dataclass(frozen=True)
+class RegionRules:
+    """
+    Pre-extracted `data.regions` policy section, ready for evaluation.
+
+    `index` is None when the section has an invalid shape.
+    """
+
+    index: Optional[RegionIndex]
+
+
+def compile_region_rules(policy: Dict[str, Any]) -> Optional[RegionRules]:
+    """
+    Extract the `data.regions` section of a policy.
+
+    Returns None when no region policy is defined.
     """
 
     data_policy = policy.get("data", {})
     region_policy = data_policy.get("regions")
 
-    # No region policy → allow
     if not region_policy:
+        return None
+
+    allowed_regions = region_policy.get("allowed")
+    denied_regions = region_policy.get("denied") or []
+
+    if not isinstance(allowed_regions, list) or not isinstance(denied_regions, list):
+        return RegionRules(index=None)
+
+    return RegionRules(index=RegionIndex(allowed_regions, denied_regions))
+
+
+def evaluate_region_rules(
+    rules: Optional[RegionRules],
+    region: Optional[str],
+) -> Decision:
+    """
+    Evaluate compiled region rules against a request region.
+
+    The deepest allow or deny rule covering the region decides: allowing
+    `EU` allows `EU-DE`, unless `EU-DE` (or `EU-DE-BY` for that region)
+    is denied.
+    """
+
+    # No region policy → allow
+    if rules is None:
         return Decision.allow(
             reason="No region policy defined",
             policy_section="data.regions",
         )
 
-    allowed_regions = region_policy.get("allowed")
-
     # Invalid policy shape (should be caught by validator)
-    if not isinstance(allowed_regions, list):
+    if rules.index is None:
         return Decision.block(
             reason="Invalid region policy configuration",
             policy_section="data.regions",
@@ -41,21 +143,42 @@ def enforce_region_policy(
             policy_section="data.regions",
         )
 
-    # Region not allowed
-    if region not in allowed_regions:
+    match = rules.index.lookup(region)
+
+    # Region not covered by any rule
+    if match is None:
         return Decision.block(
             reason=f"Region '{region}' is not allowed by policy",
             policy_section="data.regions",
-            metadata={
-                "region": region,
-                "allowed_regions": allowed_regions,
-            },
+            metadata={"region": region},
+        )
+
+    rule, allowed = match
+
+    # Region explicitly denied
+    if not allowed:
+        return Decision.block(
+            reason=f"Region '{region}' is denied by policy",
+            policy_section="data.regions",
+            metadata={"region": region, "matched_region": rule},
         )
 
     # Allowed
     return Decision.allow(
         reason=f"Region '{region}' is allowed by policy",
         policy_section="data.regions",
-        metadata={"region": region},
+        metadata={"region": region, "matched_region": rule},
     )
 
+
+def enforce_region_policy(
+    policy: Dict[str, Any],
+    region: Optional[str],
+) -> Decision:
+    """
+    Enforce region / jurisdiction governance rules.
+
+    Region must be explicitly provided by the caller.
+    """
+
+    return evaluate_region_rules(compile_region_rules(policy), region)
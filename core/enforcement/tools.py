@@ -1,26 +1,58 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Optional, Tuple
 
 from core.decision import Decision
 
 
-def enforce_tool_policy(
-    policy: Dict[str, Any],
-    *,
-    tool_name: Optional[str],
-) -> Decision:
+@dataclass(frozen=True)
+class ToolRules:
     """
-    Enforce tool / agent governance rules.
+    Pre-extracted `tools` policy section, ready for evaluation.
 
-    This function does NOT execute tools.
-    It only decides whether a tool invocation is allowed.
+    `allow` / `deny` are None when the corresponding key is absent
+    or not a list.
+    """
+
+    allow: Optional[FrozenSet[str]]
+    deny: Optional[FrozenSet[str]]
+    allow_list: Optional[Tuple[str, ...]]
+
+
+def compile_tool_rules(policy: Dict[str, Any]) -> Optional[ToolRules]:
+    """
+    Extract the `tools` section of a policy.
+
+    Returns None when no tool policy is defined.
     """
 
     tools_policy = policy.get("tools")
 
-    # No tool policy → allow
     if not tools_policy:
+        return None
+
+    allow = tools_policy.get("allow")
+    deny = tools_policy.get("deny")
+
+    return ToolRules(
+        allow=frozenset(allow) if isinstance(allow, list) else None,
+        deny=frozenset(deny) if isinstance(deny, list) else None,
+        allow_list=tuple(allow) if isinstance(allow, list) else None,
+    )
+
+
+def evaluate_tool_rules(
+    rules: Optional[ToolRules],
+    *,
+    tool_name: Optional[str],
+) -> Decision:
+    """
+    Evaluate compiled tool rules against a requested tool invocation.
+    """
+
+    # No tool policy → allow
+    if rules is None:
         return Decision.allow(
             reason="No tool governance policy defined",
             policy_section="tools",
@@ -32,11 +64,8 @@ def enforce_tool_policy(
             policy_section="tools",
         )
 
-    allow = tools_policy.get("allow")
-    deny = tools_policy.get("deny")
-
     # Explicit deny always wins
-    if isinstance(deny, list) and tool_name in deny:
+    if rules.deny is not None and tool_name in rules.deny:
         return Decision.block(
             reason=f"Tool '{tool_name}' is explicitly denied by policy",
             policy_section="tools",
@@ -44,14 +73,14 @@ def enforce_tool_policy(
         )
 
     # Allowlist enforcement
-    if isinstance(allow, list):
-        if tool_name not in allow:
+    if rules.allow is not None:
+        if tool_name not in rules.allow:
             return Decision.block(
                 reason=f"Tool '{tool_name}' is not allowed by policy",
                 policy_section="tools",
                 metadata={
                     "tool": tool_name,
-                    "allowed_tools": allow,
+                    "allowed_tools": list(rules.allow_list),
                 },
             )
 
@@ -62,3 +91,17 @@ def enforce_tool_policy(
         metadata={"tool": tool_name},
     )
 
+
+def enforce_tool_policy(
+    policy: Dict[str, Any],
+    *,
+    tool_name: Optional[str],
+) -> Decision:
+    """
+    Enforce tool / agent governance rules.
+
+    This function does NOT execute tools.
+    It only decides whether a tool invocation is allowed.
+    """
+
+    return evaluate_tool_rules(compile_tool_rules(policy), tool_name=tool_name)
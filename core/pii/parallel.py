@@ -0,0 +1,163 @@
+"""
+Parallel PII scanning for large texts.
+
+A large text is split into chunks right after barrier characters (see
+core.pii.scanner.BARRIER_PATTERN). No span can cross a barrier, so each
+chunk is scanned on its own, with the barrier before it as look-behind
+context, and the chunk results concatenated in order are exactly the
+spans of a serial `scan_pii` over the whole text. Chunks therefore need
+no overlap and their spans no de-duplication; a fixed overlap could not
+be correct anyway, since email matches have no maximum length.
+
+Chunks are scanned in a process pool, created on first use.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from core.pii.scanner import (
+    BARRIER_PATTERN,
+    PiiSpan,
+    first_spans,
+    scan_pii,
+    scan_pii_first,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+# Texts shorter than this are scanned serially
+DEFAULT_THRESHOLD = 4 * 1024 * 1024
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+_BARRIER = re.compile(BARRIER_PATTERN)
+
+
+def split_points(text: str, chunk_size: int) -> List[int]:
+    """
+    Return cut offsets `[0, ..., len(text)]`, roughly `chunk_size` apart.
+
+    Every inner cut immediately follows a barrier character. A chunk can
+    grow past `chunk_size` when the text has no barrier near a cut.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    length = len(text)
+    cuts = [0]
+
+    while length - cuts[-1] > chunk_size:
+        barrier = _BARRIER.search(text, cuts[-1] + chunk_size - 1)
+        if barrier is None or barrier.end() >= length:
+            break
+        cuts.append(barrier.end())
+
+    cuts.append(length)
+    return cuts
+
+
+def _scan_chunk(chunk: Tuple[str, int]) -> List[PiiSpan]:
+    text, start = chunk
+    return scan_pii(text, start)
+
+
+class ParallelScanner:
+    """
+    Scans texts of at least `threshold` characters in a process pool.
+
+    `scan` returns exactly what `scan_pii` returns; shorter texts are
+    scanned in-process. Pass an `executor` to share an existing pool,
+    otherwise one with `workers` processes (default: CPU count) is
+    created on first use and shut down by `close`. With a single worker
+    and no executor, every text is scanned in-process.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold: int = DEFAULT_THRESHOLD,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        self.threshold = threshold
+        self.chunk_size = chunk_size
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = executor
+        self._owns_executor = executor is None
+
+    def scan(self, text: str) -> List[PiiSpan]:
+        """
+        Return non-overlapping PII spans in text order.
+        """
+        if not self.uses_pool(text):
+            return scan_pii(text)
+
+        cuts = split_points(text, self.chunk_size)
+        if len(cuts) <= 2:
+            return scan_pii(text)
+
+        # Each chunk but the first starts with the barrier before its cut,
+        # as look-behind context
+        chunks = [(text[:cuts[1]], 0)] + [
+            (text[start - 1:end], 1) for start, end in zip(cuts[1:-1], cuts[2:])
+        ]
+
+        spans: List[PiiSpan] = []
+        for start, found in zip(cuts, self._pool().map(_scan_chunk, chunks)):
+            if start:
+                start -= 1
+            spans.extend(
+                PiiSpan(span.entity, span.start + start, span.end + start)
+                for span in found
+            )
+
+        return spans
+
+    def scan_first(self, text: str) -> List[PiiSpan]:
+        """
+        Return the first span of each entity type, like `scan_pii_first`.
+
+        Texts scanned in the pool are scanned in full; shorter ones stop
+        as soon as every entity type has been seen.
+        """
+        if not self.uses_pool(text):
+            return scan_pii_first(text)
+
+        return first_spans(self.scan(text))
+
+    def uses_pool(self, text: str) -> bool:
+        """
+        Return whether `scan` would scan `text` in the process pool.
+        """
+        return len(text) >= self.threshold and (
+            self.workers >= 2 or not self._owns_executor
+        )
+
+    def close(self) -> None:
+        """
+        Shut down the pool, if this scanner created it.
+        """
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> ParallelScanner:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _pool(self) -> Executor:
+        if self._executor is None:
+            # Imported lazily: only large texts need a process pool
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
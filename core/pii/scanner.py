@@ -0,0 +1,292 @@
+"""
+Single-pass PII scanner.
+
+All detectors are combined into one regex, so a text is scanned once
+regardless of how many detectors exist. Detection
+(core.enforcement.data) and redaction (core.redaction.engine) both
+consume the resulting spans.
+
+The combined regex is written so that the regex engine can skip most
+positions cheaply, while producing exactly the spans of a leftmost,
+detector-ordered scan with the reference patterns below:
+
+- An email can only start at the beginning of a run of local-part
+  characters: if no email starts there, none starts later in the same
+  run. The one exception (a previous match ending inside a run) is
+  handled explicitly in `scan_pii`.
+- Phone numbers and card numbers are both bounded digit runs, so they
+  share one branch and are told apart by length.
+- A digit run can contain non-ASCII digits, which email local parts
+  cannot: an email may then start inside the run, after its last
+  non-ASCII digit. The email takes priority, as it did when the email
+  detector ran first (see `_scan`).
+
+Most texts contain no PII at all, so `scan_pii` first checks cheaply
+whether any detector could match: every email contains an "@", and
+every other detector needs a run of at least `_MIN_DIGIT_RUN` digits.
+Texts without either skip the regex scan entirely.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+# --- Simple deterministic PII detectors (v0.1) ---
+#
+# Order matters: when several detectors could match at the same position,
+# the earlier one wins.
+
+EMAIL_PATTERN = r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+"
+PHONE_PATTERN = r"\b\d{10}\b"
+CREDIT_CARD_PATTERN = r"\b\d{13,19}\b"
+
+DETECTORS: Tuple[Tuple[str, str], ...] = (
+    ("email", EMAIL_PATTERN),
+    ("phone", PHONE_PATTERN),
+    ("credit_card", CREDIT_CARD_PATTERN),
+)
+
+ENTITY_TYPES: Tuple[str, ...] = tuple(entity for entity, _ in DETECTORS)
+
+_LOCAL = "a-zA-Z0-9_.+-"
+_LOCAL_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_.+-"
+)
+
+# Characters a match can contain: the ASCII email characters and decimal
+# digits. Any other character is a barrier: no span crosses it, and no
+# detector looks more than one character past a span, so text split right
+# after a barrier can be scanned piece by piece.
+MATCH_CHARS = _LOCAL_CHARS | frozenset("@")
+
+# _LOCAL_CHARS as byte values, for scanning bytes
+_LOCAL_BYTES = frozenset(map(ord, _LOCAL_CHARS))
+BARRIER_PATTERN = r"[^a-zA-Z0-9_.+\-@\d]"
+
+_SCAN_PATTERN = (
+    # email, anchored to the start of a local-part run
+    rf"(?P<email>[{_LOCAL}](?<![{_LOCAL}].)[{_LOCAL}]*"
+    r"@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+)"
+    # phone (10 digits) or credit card (13-19 digits), word-bounded
+    r"|(?P<digits>\d(?<!\w\d)\d{9,18}\b)"
+)
+
+# Public regexes, compiled on first use rather than at import: commands
+# that never scan text (validate, --help) do not pay for them.
+_REGEX_PATTERNS: Dict[str, str] = {
+    "EMAIL_REGEX": EMAIL_PATTERN,
+    "PHONE_REGEX": PHONE_PATTERN,
+    "CREDIT_CARD_REGEX": CREDIT_CARD_PATTERN,
+}
+
+
+@lru_cache(maxsize=None)
+def _compile(pattern: str) -> re.Pattern:
+    return re.compile(pattern)
+
+
+def __getattr__(name: str) -> re.Pattern:
+    pattern = _REGEX_PATTERNS.get(name)
+    if pattern is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _compile(pattern)
+
+
+_PHONE_LENGTH = 10
+_CREDIT_CARD_MIN_LENGTH = 13
+_CREDIT_CARD_MAX_LENGTH = 19
+
+# Shortest digit run the phone and credit card detectors can match
+_MIN_DIGIT_RUN = min(_PHONE_LENGTH, _CREDIT_CARD_MIN_LENGTH)
+
+
+def _may_contain_pii(text: str, start: int) -> bool:
+    """
+    Return False only if no detector can match in `text[start:]`.
+    """
+    if text.find("@", start) != -1:
+        return True
+
+    # A run of _MIN_DIGIT_RUN digits covers every residue modulo
+    # _MIN_DIGIT_RUN, so sampling every _MIN_DIGIT_RUN-th character
+    # finds one of its digits: a fraction of a full pass rules most
+    # texts out before the exact check.
+    sample = text[start + _MIN_DIGIT_RUN - 1 :: _MIN_DIGIT_RUN]
+    if _compile(r"\d").search(sample) is None:
+        return False
+
+    return _compile(rf"\d{{{_MIN_DIGIT_RUN}}}").search(text, start) is not None
+
+
+class PiiSpan(NamedTuple):
+    """A detected PII entity: `text[start:end]` is of type `entity`."""
+
+    entity: str
+    start: int
+    end: int
+
+
+def scan_pii(text: str, start: int = 0) -> List[PiiSpan]:
+    """
+    Scan text once and return non-overlapping PII spans in text order.
+
+    Scanning begins at `start`; characters before it are only used as
+    look-behind context (word boundaries, run starts).
+    """
+    if not _may_contain_pii(text, start):
+        return []
+
+    return list(_scan_text(text, start))
+
+
+def scan_pii_first(text: str) -> List[PiiSpan]:
+    """
+    Return the first PII span of each entity type found, in text order.
+
+    Detection only needs the entity types, so the scan stops as soon as
+    every type has been seen instead of collecting every span.
+    """
+    if not _may_contain_pii(text, 0):
+        return []
+
+    return first_spans(_scan_text(text, 0))
+
+
+def _scan_text(text: str, start: int) -> Iterator[PiiSpan]:
+    return _scan(
+        text,
+        start,
+        len(text),
+        _compile(_SCAN_PATTERN),
+        _compile(EMAIL_PATTERN),
+        _LOCAL_CHARS,
+    )
+
+
+def scan_pii_bytes(data: Any, start: int = 0, end: Optional[int] = None) -> List[PiiSpan]:
+    """
+    Byte-level scan_pii over `data[start:end]` (bytes, mmap, ...).
+
+    Matches scan_pii over the decoded text exactly when the range and
+    the byte before it are ASCII: the byte patterns only know ASCII
+    digits and word characters. Callers split other data into ASCII
+    ranges first (see core.redaction.mapped).
+    """
+    if end is None:
+        end = len(data)
+
+    if (
+        data.find(b"@", start, end) == -1
+        and _compile(rb"[0-9]{%d}" % _MIN_DIGIT_RUN).search(data, start, end) is None
+    ):
+        return []
+
+    return list(
+        _scan(
+            data,
+            start,
+            end,
+            _compile(_SCAN_PATTERN.encode("ascii")),
+            _compile(EMAIL_PATTERN.encode("ascii")),
+            _LOCAL_BYTES,
+        )
+    )
+
+
+def _scan(
+    text: Any,
+    start: int,
+    end: int,
+    pattern: re.Pattern,
+    email_pattern: re.Pattern,
+    local_chars: FrozenSet[Any],
+) -> Iterator[PiiSpan]:
+    search = pattern.search
+    email_match = email_pattern.match
+    position = start
+
+    while True:
+        # A previous match that ended inside a local-part run leaves an
+        # email start the anchored branch cannot see.
+        if (
+            start < position < end
+            and text[position] in local_chars
+            and text[position - 1] in local_chars
+        ):
+            match = email_match(text, position, end)
+            if match is not None:
+                yield PiiSpan("email", position, match.end())
+                position = match.end()
+                continue
+
+        match = search(text, position, end)
+        if match is None:
+            return
+
+        start, position = match.span()
+
+        if match.lastgroup == "email":
+            yield PiiSpan("email", start, position)
+            continue
+
+        if not text[start:position].isascii():
+            # An email starting after the last non-ASCII digit wins; the
+            # digits before it count only if they still form a match
+            # once the email is gone
+            run = position
+            while text[run - 1] in local_chars:
+                run -= 1
+
+            email = email_match(text, run, end)
+            if email is not None:
+                yield from _digits_span(start, run)
+                yield PiiSpan("email", run, email.end())
+                position = email.end()
+                continue
+
+        yield from _digits_span(start, position)
+
+
+def _digits_span(start: int, end: int) -> Tuple[PiiSpan, ...]:
+    if end - start == _PHONE_LENGTH:
+        return (PiiSpan("phone", start, end),)
+    if _CREDIT_CARD_MIN_LENGTH <= end - start <= _CREDIT_CARD_MAX_LENGTH:
+        return (PiiSpan("credit_card", start, end),)
+    return ()
+
+
+def first_spans(spans: Iterable[PiiSpan]) -> List[PiiSpan]:
+    """
+    Return the first span of each entity type in `spans`, in text order.
+
+    Stops consuming `spans` once every entity type has been seen.
+    """
+    first: Dict[str, PiiSpan] = {}
+
+    for span in spans:
+        if span.entity not in first:
+            first[span.entity] = span
+            if len(first) == len(ENTITY_TYPES):
+                break
+
+    return sorted(first.values(), key=lambda span: span.start)
+
+
+def entity_types(spans: Iterable[PiiSpan]) -> List[str]:
+    """
+    Return the distinct entity types found in spans, in detector order.
+    """
+    found = {span.entity for span in spans}
+    return [entity for entity in ENTITY_TYPES if entity in found]
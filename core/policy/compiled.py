@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from core.enforcement.data import PiiRules, compile_pii_rules
+from core.enforcement.keywords import KeywordRules, compile_keyword_rules
+from core.enforcement.model import ModelRules, compile_model_rules
+from core.enforcement.region import RegionRules, compile_region_rules
+from core.enforcement.tools import ToolRules, compile_tool_rules
+
+
+def policy_content_hash(policy: Dict[str, Any]) -> str:
+    """
+    Return a stable SHA-256 hash of a (merged) policy mapping.
+
+    The hash is computed over canonical JSON, so key order does not matter.
+    """
+
+    canonical = json.dumps(
+        policy,
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class CompiledPolicy:
+    """
+    A validated policy with every enforcement section pre-extracted.
+
+    Compiled policies are immutable and can be passed directly to
+    `EnforcementOrchestrator.enforce`, which then skips re-validation.
+    """
+
+    policy: Dict[str, Any]
+    model: Optional[ModelRules]
+    regions: Optional[RegionRules]
+    tools: Optional[ToolRules]
+    pii: Optional[PiiRules]
+    keywords: Optional[KeywordRules] = None
+
+    @classmethod
+    def from_policy(cls, policy: Dict[str, Any]) -> "CompiledPolicy":
+        """
+        Compile an already-validated policy mapping.
+
+        No validation is performed here; use `compile_policy` for
+        untrusted input.
+        """
+
+        return cls(
+            policy=policy,
+            model=compile_model_rules(policy),
+            regions=compile_region_rules(policy),
+            tools=compile_tool_rules(policy),
+            pii=compile_pii_rules(policy),
+            keywords=compile_keyword_rules(policy),
+        )
+
+    @cached_property
+    def content_hash(self) -> str:
+        return policy_content_hash(self.policy)
+
+    @property
+    def version(self) -> str:
+        return str(self.policy.get("version"))
+
+
+# ----------------------------------------------------------------------
+# Content-hash cache
+# ----------------------------------------------------------------------
+
+_CACHE_MAX_SIZE = 256
+
+_cache: "OrderedDict[str, CompiledPolicy]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def compile_policy(
+    policy: Dict[str, Any] | str | Path,
+    *,
+    validator: Any = None,
+) -> CompiledPolicy:
+    """
+    Validate and compile a policy, reusing a cached result when the
+    policy content has been compiled before.
+
+    Args:
+        policy:
+          - dict (already loaded)
+          - or path to policy file (inheritance is resolved)
+        validator: optional PolicyValidator instance
+
+    Raises:
+        ValueError if the policy is invalid.
+    """
+
+    # Imported lazily: core.policy_validator imports core.policy.loader.
+    from core.policy_validator import PolicyValidator
+
+    validator = validator or PolicyValidator()
+
+    if isinstance(policy, Path):
+        policy = str(policy)
+
+    if isinstance(policy, dict):
+        key = policy_content_hash(policy)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+
+    validation = validator.validate(policy)
+    if not validation.valid:
+        raise ValueError(f"Invalid policy: {validation.errors}")
+
+    resolved = validation.policy
+    key = policy_content_hash(resolved)
+
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
+    # Snapshot so later mutation of the caller's dict cannot leak in.
+    compiled = CompiledPolicy.from_policy(copy.deepcopy(resolved))
+    compiled.__dict__["content_hash"] = key
+
+    with _cache_lock:
+        _cache[key] = compiled
+        _cache.move_to_end(key)
+        while len(_cache) > _CACHE_MAX_SIZE:
+            _cache.popitem(last=False)
+
+    return compiled
+
+
+def clear_compiled_policy_cache() -> None:
+    """Drop every cached CompiledPolicy."""
+
+    with _cache_lock:
+        _cache.clear()
+
+
+def _cache_get(key: str) -> Optional[CompiledPolicy]:
+    with _cache_lock:
+        compiled = _cache.get(key)
+        if compiled is not None:
+            _cache.move_to_end(key)
+        return compiled
@@ -0,0 +1,100 @@
+"""
+Immutable policy nodes.
+
+FrozenDict and FrozenList are dict / list subclasses, so every consumer
+of policy mappings (validator, compilers, JSON encoding) accepts them
+unchanged. Because they can never change, a frozen subtree can be
+shared by reference between any number of policies.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Any, NoReturn
+
+
+def _immutable(self: Any, *args: Any, **kwargs: Any) -> NoReturn:
+    raise TypeError(f"{type(self).__name__} is immutable")
+
+
+class FrozenDict(dict):
+    """A dict that cannot be modified after construction."""
+
+    __slots__ = ()
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __ior__ = _immutable
+    clear = _immutable
+    pop = _immutable
+    popitem = _immutable
+    setdefault = _immutable
+    update = _immutable
+
+    # Immutable, so copies can be the node itself
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo: Any) -> "FrozenDict":
+        return self
+
+    def __reduce__(self) -> Any:
+        return (type(self), (dict(self),))
+
+    def __repr__(self) -> str:
+        return f"FrozenDict({dict.__repr__(self)})"
+
+
+class FrozenList(list):
+    """A list that cannot be modified after construction."""
+
+    __slots__ = ()
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __iadd__ = _immutable
+    __imul__ = _immutable
+    append = _immutable
+    clear = _immutable
+    extend = _immutable
+    insert = _immutable
+    pop = _immutable
+    remove = _immutable
+    reverse = _immutable
+    sort = _immutable
+
+    def __copy__(self) -> "FrozenList":
+        return self
+
+    def __deepcopy__(self, memo: Any) -> "FrozenList":
+        return self
+
+    def __reduce__(self) -> Any:
+        return (type(self), (list(self),))
+
+    def __repr__(self) -> str:
+        return f"FrozenList({list.__repr__(self)})"
+
+
+def freeze(value: Any) -> Any:
+    """
+    Return an immutable equivalent of a parsed policy value.
+
+    Dicts and lists are converted recursively, strings are interned (so
+    keys and values repeated across policies are stored once) and
+    already-frozen nodes are returned as-is.
+    """
+
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+
+    if isinstance(value, dict):
+        return FrozenDict((freeze(key), freeze(item)) for key, item in value.items())
+
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+
+    if type(value) is str:
+        return sys.intern(value)
+
+    return value
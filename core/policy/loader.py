@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import copy
+import os
+import threading
 import yaml
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Set
+from typing import Any, Dict, NamedTuple, Optional, Set, Tuple
 
 from core.policy.merge import merge_policies
 from core.policy.errors import (
@@ -23,16 +28,73 @@ def load_policy(
     - Supports single inheritance via `extends`
     - Detects cycles
     - Enforces version consistency
+
+    Resolved policies are cached per file and revalidated against the
+    stat of every file in their `extends` chain, so unchanged files are
+    never re-read. Callers always receive their own copy.
     """
 
     path = Path(path).resolve()
     _visited = _visited or set()
 
-    if path in _visited:
-        cycle = " → ".join(str(p.name) for p in list(_visited) + [path])
-        raise PolicyCycleError(f"Policy inheritance cycle detected: {cycle}")
+    return copy.deepcopy(_resolve(path, _visited).policy)
 
-    _visited.add(path)
+
+def load_policy_snapshot(
+    path: str | Path,
+) -> Tuple[Dict[str, Any], Dict[Path, Optional[FileStamp]]]:
+    """
+    Like `load_policy`, but also return the stat of every file in the
+    `extends` chain, as it was when that file was read.
+
+    Comparing the returned stamps with `file_stamp` tells whether the
+    policy may have changed since it was loaded.
+    """
+
+    resolved = _resolve(Path(path).resolve(), set())
+    return copy.deepcopy(resolved.policy), dict(resolved.chain)
+
+
+def clear_policy_cache() -> None:
+    """Drop every cached policy file."""
+
+    _cache.clear()
+
+
+# ----------------------------------------------------------------------
+# Resolution
+# ----------------------------------------------------------------------
+
+
+class FileStamp(NamedTuple):
+    """Identity of a file's content, as far as stat can tell."""
+
+    mtime_ns: int
+    size: int
+    ino: int
+
+
+@dataclass(frozen=True)
+class _ResolvedPolicy:
+    # Merged policy; shared by the cache, never handed out directly
+    policy: Dict[str, Any]
+    # (path, stamp) of this file, then of each base up the `extends` chain
+    chain: Tuple[Tuple[Path, Optional[FileStamp]], ...]
+
+
+def file_stamp(path: Path) -> Optional[FileStamp]:
+    """Return the current stamp of a file, or None if it cannot be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return FileStamp(st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def read_policy_file(path: Path) -> Dict[str, Any]:
+    """
+    Parse a single policy file, without resolving inheritance.
+    """
 
     try:
         with open(path, "r", encoding="utf-8") as f:
@@ -43,29 +105,172 @@ def load_policy(
     if not isinstance(policy, dict):
         raise PolicyInheritanceError(f"Policy file {path} must be a YAML mapping")
 
-    base_policy = {}
+    return policy
+
+
+def extends_path(policy: Dict[str, Any], path: Path) -> Optional[Path]:
+    """
+    Return the resolved path of the base a policy file extends, if any.
+    """
 
     extends = policy.get("extends")
-    if extends:
-        if not isinstance(extends, str):
-            raise PolicyInheritanceError(
-                f"`extends` must be a string path in {path}"
-            )
+    if not extends:
+        return None
+
+    if not isinstance(extends, str):
+        raise PolicyInheritanceError(
+            f"`extends` must be a string path in {path}"
+        )
+
+    return (path.parent / extends).resolve()
+
+
+def check_version_match(
+    base_policy: Dict[str, Any],
+    policy: Dict[str, Any],
+    path: Path,
+) -> None:
+    """
+    Version check (must match exactly).
+    """
 
-        base_path = (path.parent / extends).resolve()
-        base_policy = load_policy(base_path, _visited=_visited)
+    base_version = base_policy.get("version")
+    child_version = policy.get("version")
 
-        # Version check (must match exactly)
-        base_version = base_policy.get("version")
-        child_version = policy.get("version")
+    if base_version != child_version:
+        raise PolicyVersionMismatchError(
+            f"Policy version mismatch: base={base_version}, child={child_version} ({path})"
+        )
 
-        if base_version != child_version:
-            raise PolicyVersionMismatchError(
-                f"Policy version mismatch: base={base_version}, child={child_version} ({path})"
-            )
+
+def _resolve(path: Path, _visited: Set[Path]) -> _ResolvedPolicy:
+    if path in _visited:
+        cycle = " → ".join(str(p.name) for p in list(_visited) + [path])
+        raise PolicyCycleError(f"Policy inheritance cycle detected: {cycle}")
+
+    cached = _cache.get(path)
+    if cached is not None:
+        return cached
+
+    _visited.add(path)
+
+    # Stamped before reading: a concurrent edit makes the entry stale
+    # rather than caching new content under an old stamp.
+    stamp = file_stamp(path)
+
+    policy = read_policy_file(path)
+
+    base_policy: Dict[str, Any] = {}
+    base_chain: Tuple[Tuple[Path, Optional[FileStamp]], ...] = ()
+
+    base_path = extends_path(policy, path)
+    if base_path is not None:
+        base = _resolve(base_path, _visited)
+        base_policy = base.policy
+        base_chain = base.chain
+
+        check_version_match(base_policy, policy, path)
 
     merged = merge_policies(base_policy, policy)
     merged.pop("extends", None)
 
-    return merged
+    # May share nested values with the cached base; cached policies are
+    # never mutated, only copied out by `load_policy`.
+    resolved = _ResolvedPolicy(
+        policy=merged,
+        chain=((path, stamp),) + base_chain,
+    )
+
+    if stamp is not None:
+        _cache.put(path, resolved)
+
+    return resolved
+
+
+# ----------------------------------------------------------------------
+# Stat-validated file cache
+# ----------------------------------------------------------------------
+
+_CACHE_MAX_SIZE = 512
+
+
+class _PolicyFileCache:
+    """
+    Process-wide LRU cache of resolved policies, keyed by resolved path.
+
+    An entry is valid while every file in its `extends` chain still has
+    the (mtime, size, inode) it had when it was read. When a file is
+    found to have changed, its entry and the entries of every policy
+    extending it are dropped together.
+    """
+
+    def __init__(self, max_size: int = _CACHE_MAX_SIZE):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Path, _ResolvedPolicy]" = OrderedDict()
+        # base path -> paths of cached policies whose chain includes it
+        self._dependents: Dict[Path, Set[Path]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, path: Path) -> Optional[_ResolvedPolicy]:
+        with self._lock:
+            entry = self._entries.get(path)
+
+        if entry is None:
+            return None
+
+        # Stat outside the lock; stale files invalidate their dependents
+        for file_path, stamp in entry.chain:
+            if file_stamp(file_path) != stamp:
+                self.invalidate(file_path)
+                return None
+
+        with self._lock:
+            if self._entries.get(path) is entry:
+                self._entries.move_to_end(path)
+
+        return entry
+
+    def put(self, path: Path, entry: _ResolvedPolicy) -> None:
+        with self._lock:
+            self._remove(path)
+
+            self._entries[path] = entry
+            for base_path, _ in entry.chain[1:]:
+                self._dependents.setdefault(base_path, set()).add(path)
+
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, path: Path) -> None:
+        """
+        Drop the entry for `path` and every entry that extends it.
+        """
+        with self._lock:
+            # Chains are complete, so dependents of dependents are
+            # already dependents of `path`.
+            for dependent in list(self._dependents.get(path, ())):
+                self._remove(dependent)
+            self._remove(path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._dependents.clear()
+
+    def _remove(self, path: Path) -> None:
+        entry = self._entries.pop(path, None)
+        if entry is None:
+            return
+
+        for base_path, _ in entry.chain[1:]:
+            dependents = self._dependents.get(base_path)
+            if dependents is not None:
+                dependents.discard(path)
+                if not dependents:
+                    del self._dependents[base_path]
+
 
+_cache = _PolicyFileCache()
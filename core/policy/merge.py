@@ -1,6 +1,8 @@
 from __future__ import annotations
 from typing import Any, Dict
 
+from core.policy.frozen import FrozenDict, freeze
+
 
 def merge_policies(base: Dict[str, Any], child: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -41,3 +43,38 @@ def merge_policies(base: Dict[str, Any], child: Dict[str, Any]) -> Dict[str, Any
 
     return result
 
+
+def merge_frozen_policies(base: FrozenDict, child: Dict[str, Any]) -> FrozenDict:
+    """
+    Merge child policy onto a frozen base policy, sharing structure.
+
+    Same semantics as `merge_policies`, but the result is frozen and
+    every base subtree the child does not touch is reused by reference
+    instead of being copied.
+    """
+
+    result = dict(base)
+
+    for key, child_value in child.items():
+        if key == "extends":
+            continue  # handled by loader
+
+        # Explicit removal
+        if child_value is None:
+            result.pop(key, None)
+            continue
+
+        base_value = base.get(key)
+
+        # Dict → deep merge
+        if isinstance(base_value, dict) and isinstance(child_value, dict):
+            result[freeze(key)] = merge_frozen_policies(
+                freeze(base_value),
+                child_value,
+            )
+            continue
+
+        # List → replace, scalar → override
+        result[freeze(key)] = freeze(child_value)
+
+    return FrozenDict(result)
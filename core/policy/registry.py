@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+
+from core.policy.compiled import CompiledPolicy
+from core.policy.errors import PolicyCycleError
+from core.policy.frozen import FrozenDict, freeze
+from core.policy.loader import (
+    FileStamp,
+    check_version_match,
+    extends_path,
+    file_stamp,
+    read_policy_file,
+)
+from core.policy.merge import merge_frozen_policies
+
+
+@dataclass(frozen=True)
+class RegistryFootprint:
+    """
+    Approximate memory held by a registry's policies.
+
+    `bytes` counts every distinct node once (shallow `sys.getsizeof` of
+    containers and leaves); `unshared_bytes` is what the same policies
+    would take if every tenant held a private copy of its tree.
+    """
+
+    tenants: int
+    nodes: int
+    bytes: int
+    unshared_bytes: int
+
+    @property
+    def sharing_ratio(self) -> float:
+        return self.unshared_bytes / self.bytes if self.bytes else 1.0
+
+
+class TenantPolicyRegistry:
+    """
+    Resolved policies for many tenants, with structural sharing.
+
+    Policies are stored as immutable FrozenDict trees. Inheritance is
+    resolved with `merge_frozen_policies`, so subtrees a tenant inherits
+    unchanged from its base are shared by reference with the base and
+    with every other tenant extending it. Each base file is parsed and
+    resolved once per registry (revalidated by file stat); tenant files
+    themselves are not retained.
+
+    `get` and `compiled` are O(1) dict lookups.
+
+    Usage:
+        registry = TenantPolicyRegistry()
+        registry.add("acme", "tenants/acme.yaml")
+        orchestrator.enforce(registry.compiled("acme"), ...)
+    """
+
+    def __init__(self, *, validator: Any = None):
+        # Imported lazily: core.policy_validator imports core.policy.loader.
+        from core.policy_validator import PolicyValidator
+
+        self.validator = validator or PolicyValidator()
+
+        self._tenants: Dict[str, FrozenDict] = {}
+        self._compiled: Dict[str, CompiledPolicy] = {}
+        # base path -> (stamps of its extends chain, resolved policy)
+        self._bases: Dict[
+            Path,
+            Tuple[Tuple[Tuple[Path, Optional[FileStamp]], ...], FrozenDict],
+        ] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    def add(self, tenant_id: str, path: str | Path) -> FrozenDict:
+        """
+        Resolve, validate and register a tenant's policy file.
+
+        Raises:
+            PolicyError if the file or a base it extends cannot be loaded,
+            or the `extends` chain is inconsistent or cyclic.
+            ValueError if the resolved policy is invalid.
+        """
+        with self._lock:
+            _, policy = self._resolve(Path(path).resolve(), set(), base=False)
+            return self._register(tenant_id, policy)
+
+    def add_policy(self, tenant_id: str, policy: Mapping[str, Any]) -> FrozenDict:
+        """
+        Validate and register an already-loaded policy mapping.
+
+        Raises:
+            ValueError if the policy is invalid.
+        """
+        with self._lock:
+            return self._register(tenant_id, freeze(dict(policy)))
+
+    def remove(self, tenant_id: str) -> None:
+        with self._lock:
+            self._tenants.pop(tenant_id, None)
+            self._compiled.pop(tenant_id, None)
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def get(self, tenant_id: str) -> FrozenDict:
+        """
+        Return the resolved policy of a tenant.
+
+        Raises:
+            KeyError for unknown tenants.
+        """
+        return self._tenants[tenant_id]
+
+    def compiled(self, tenant_id: str) -> CompiledPolicy:
+        """
+        Return the compiled policy of a tenant, ready for `enforce`.
+
+        Raises:
+            KeyError for unknown tenants.
+        """
+        return self._compiled[tenant_id]
+
+    def __contains__(self, tenant_id: object) -> bool:
+        return tenant_id in self._tenants
+
+    def __len__(self) -> int:
+        return len(self._tenants)
+
+    @property
+    def tenant_ids(self) -> List[str]:
+        return list(self._tenants)
+
+    # ------------------------------------------------------------------
+    # Memory reporting
+    # ------------------------------------------------------------------
+
+    def memory_footprint(self) -> RegistryFootprint:
+        """
+        Measure the memory held by the registered policy trees.
+
+        The per-tenant CompiledPolicy rule structures (model matchers,
+        keyword automata, region indexes) are not counted, so the result
+        under-reports the registry's total memory.
+        """
+        seen: Set[int] = set()
+        # id -> full (unshared) size of the subtree rooted there
+        tree_sizes: Dict[int, int] = {}
+        nodes = 0
+        distinct = 0
+
+        def visit(value: Any) -> int:
+            nonlocal nodes, distinct
+
+            key = id(value)
+            if key in tree_sizes:
+                return tree_sizes[key]
+
+            size = sys.getsizeof(value)
+            if key not in seen:
+                seen.add(key)
+                distinct += size
+                if isinstance(value, (dict, list)):
+                    nodes += 1
+
+            total = size
+            if isinstance(value, dict):
+                for item_key, item in value.items():
+                    total += visit(item_key) + visit(item)
+            elif isinstance(value, list):
+                for item in value:
+                    total += visit(item)
+
+            tree_sizes[key] = total
+            return total
+
+        tenants = list(self._tenants.values())
+        unshared = sum(visit(policy) for policy in tenants)
+
+        return RegistryFootprint(
+            tenants=len(tenants),
+            nodes=nodes,
+            bytes=distinct,
+            unshared_bytes=unshared,
+        )
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _register(self, tenant_id: str, policy: FrozenDict) -> FrozenDict:
+        validation = self.validator.validate(policy)
+        if not validation.valid:
+            raise ValueError(f"Invalid policy: {validation.errors}")
+
+        # Compiled first so both maps are updated together
+        compiled = CompiledPolicy.from_policy(policy)
+
+        self._tenants[tenant_id] = policy
+        self._compiled[tenant_id] = compiled
+        return policy
+
+    def _resolve(
+        self,
+        path: Path,
+        _visited: Set[Path],
+        *,
+        base: bool,
+    ) -> Tuple[Tuple[Tuple[Path, Optional[FileStamp]], ...], FrozenDict]:
+        """
+        Resolve a policy file and its `extends` chain into a frozen tree,
+        reusing bases resolved earlier.
+        """
+        if path in _visited:
+            cycle = " → ".join(str(p.name) for p in list(_visited) + [path])
+            raise PolicyCycleError(f"Policy inheritance cycle detected: {cycle}")
+
+        cached = self._bases.get(path)
+        if cached is not None and all(
+            file_stamp(p) == stamp for p, stamp in cached[0]
+        ):
+            return cached
+
+        _visited.add(path)
+
+        stamp = file_stamp(path)
+        policy = read_policy_file(path)
+
+        base_chain: Tuple[Tuple[Path, Optional[FileStamp]], ...] = ()
+        base_policy = FrozenDict()
+
+        base_path = extends_path(policy, path)
+        if base_path is not None:
+            base_chain, base_policy = self._resolve(base_path, _visited, base=True)
+            check_version_match(base_policy, policy, path)
+
+        resolved = (
+            ((path, stamp),) + base_chain,
+            merge_frozen_policies(base_policy, policy),
+        )
+
+        if base and stamp is not None:
+            self._bases[path] = resolved
+
+        return resolved
+
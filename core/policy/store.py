@@ -0,0 +1,359 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple
+
+from core.policy.compiled import CompiledPolicy, compile_policy
+from core.policy.loader import FileStamp, file_stamp, load_policy_snapshot
+
+DEFAULT_POLL_INTERVAL = 1.0
+
+
+class PolicyStore:
+    """
+    Owns the compiled policies of a service and keeps them current.
+
+    Policies are registered by name with the file they are loaded from.
+    A background watcher notices changes to a policy file or to any base
+    it extends (inotify on Linux, stat polling elsewhere), then re-loads,
+    re-validates and re-compiles the policy off the request path.
+
+    The store publishes an immutable snapshot of name -> CompiledPolicy.
+    A reload builds a new snapshot and swaps the reference in one step:
+    `get` is a single dict lookup on the current snapshot, takes no lock
+    and never sees a half-loaded policy.
+
+    A reload that fails (unreadable file, invalid policy) keeps the
+    previous version in place and is recorded in `errors`; it is retried
+    when the files change again.
+
+    Usage:
+        store = PolicyStore({"default": "policy.yaml"})
+        orchestrator.enforce(store.get("default"), ...)
+        store.close()
+    """
+
+    def __init__(
+        self,
+        policies: Optional[Mapping[str, str | Path]] = None,
+        *,
+        validator: Any = None,
+        watch: bool = True,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        on_error: Optional[Callable[[str, Exception], None]] = None,
+    ):
+        if poll_interval <= 0:
+            raise ValueError("poll_interval must be positive")
+
+        self.validator = validator
+        self.poll_interval = poll_interval
+        self.on_error = on_error
+
+        # Published snapshot: replaced, never mutated
+        self._policies: Dict[str, CompiledPolicy] = {}
+        self._paths: Dict[str, Path] = {}
+        self._stamps: Dict[str, Dict[Path, Optional[FileStamp]]] = {}
+        self._errors: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._inotify: Optional[_Inotify] = None
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
+
+        for name, path in (policies or {}).items():
+            self.add(name, path)
+
+        if watch:
+            self.start()
+
+    # ------------------------------------------------------------------
+    # Read path
+    # ------------------------------------------------------------------
+
+    def get(self, name: str) -> CompiledPolicy:
+        """
+        Return the current compiled policy registered under `name`.
+
+        Raises:
+            KeyError if no policy is registered under `name`.
+        """
+        return self._policies[name]
+
+    __getitem__ = get
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._policies
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._policies)
+
+    @property
+    def errors(self) -> Dict[str, str]:
+        """Last reload error per policy name, for policies whose reload failed."""
+        return dict(self._errors)
+
+    # ------------------------------------------------------------------
+    # Registration and reload
+    # ------------------------------------------------------------------
+
+    def add(self, name: str, path: str | Path) -> CompiledPolicy:
+        """
+        Load, validate and publish a policy under `name`.
+
+        Unlike background reloads, this fails loudly.
+
+        Raises:
+            ValueError if the policy is invalid.
+        """
+        path = Path(path).resolve()
+
+        with self._lock:
+            compiled, stamps = self._load(path)
+
+            self._paths[name] = path
+            self._stamps[name] = stamps
+            self._errors.pop(name, None)
+            self._publish({name: compiled})
+
+        self._watch_files(stamps)
+        return compiled
+
+    def remove(self, name: str) -> None:
+        """Stop serving and watching the policy registered under `name`."""
+
+        with self._lock:
+            self._paths.pop(name, None)
+            self._stamps.pop(name, None)
+            self._errors.pop(name, None)
+
+            snapshot = dict(self._policies)
+            snapshot.pop(name, None)
+            self._policies = snapshot
+
+    def refresh(self) -> List[str]:
+        """
+        Reload every policy whose files changed since it was loaded.
+
+        Called by the watcher; may also be called directly. Returns the
+        names of the policies that were swapped.
+        """
+        swapped: Dict[str, CompiledPolicy] = {}
+        watch: Dict[Path, Optional[FileStamp]] = {}
+
+        with self._lock:
+            for name, path in list(self._paths.items()):
+                seen = self._stamps[name]
+                if all(file_stamp(p) == stamp for p, stamp in seen.items()):
+                    continue
+
+                # Retry a failing policy only after its files change again
+                current = {p: file_stamp(p) for p in seen}
+
+                try:
+                    compiled, stamps = self._load(path)
+                except Exception as e:
+                    self._stamps[name] = current
+                    self._errors[name] = str(e)
+                    if self.on_error is not None:
+                        self.on_error(name, e)
+                    continue
+
+                self._stamps[name] = stamps
+                self._errors.pop(name, None)
+                watch.update(stamps)
+
+                if compiled is not self._policies.get(name):
+                    swapped[name] = compiled
+
+            if swapped:
+                self._publish(swapped)
+
+        self._watch_files(watch)
+        return list(swapped)
+
+    def _load(
+        self,
+        path: Path,
+    ) -> Tuple[CompiledPolicy, Dict[Path, Optional[FileStamp]]]:
+        policy, stamps = load_policy_snapshot(path)
+        return compile_policy(policy, validator=self.validator), stamps
+
+    def _publish(self, updates: Dict[str, CompiledPolicy]) -> None:
+        # Called with the lock held. One reference assignment: readers
+        # see either the old snapshot or the new one.
+        snapshot = dict(self._policies)
+        snapshot.update(updates)
+        self._policies = snapshot
+
+    # ------------------------------------------------------------------
+    # Watcher
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the background watcher (idempotent)."""
+
+        if self._thread is not None:
+            return
+
+        self._stop.clear()
+        self._inotify = _Inotify.create()
+        if self._inotify is not None:
+            self._wake_r, self._wake_w = os.pipe()
+            for stamps in list(self._stamps.values()):
+                self._watch_files(stamps)
+
+        self._thread = threading.Thread(
+            target=self._run,
+            name="ai-governor-policy-store",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop the background watcher. Published policies stay readable."""
+
+        thread = self._thread
+        if thread is None:
+            return
+
+        self._stop.set()
+        if self._wake_w is not None:
+            os.write(self._wake_w, b"\0")
+
+        thread.join()
+        self._thread = None
+
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        for fd in (self._wake_r, self._wake_w):
+            if fd is not None:
+                os.close(fd)
+        self._wake_r = self._wake_w = None
+
+    def __enter__(self) -> "PolicyStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def watching_with_inotify(self) -> bool:
+        return self._inotify is not None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wait()
+            if self._stop.is_set():
+                return
+
+            try:
+                self.refresh()
+            except Exception:
+                # The watcher must outlive any single failed refresh;
+                # per-policy failures are already recorded in `errors`.
+                pass
+
+    def _wait(self) -> None:
+        if self._inotify is None:
+            self._stop.wait(self.poll_interval)
+            return
+
+        # The timeout doubles as a polling fallback for changes inotify
+        # cannot see (e.g. network filesystems).
+        readable, _, _ = select.select(
+            [self._inotify.fd, self._wake_r], [], [], self.poll_interval
+        )
+        if self._inotify.fd in readable:
+            self._inotify.drain()
+
+    def _watch_files(self, stamps: Mapping[Path, Any]) -> None:
+        inotify = self._inotify
+        if inotify is None:
+            return
+
+        # Directories, not files: editors and deploy tools usually
+        # replace files by rename, which a file watch would not follow.
+        for directory in {path.parent for path in stamps}:
+            inotify.add_watch(directory)
+
+
+# ----------------------------------------------------------------------
+# inotify (Linux), via ctypes
+# ----------------------------------------------------------------------
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+)
+
+
+class _Inotify:
+    """
+    Minimal inotify wrapper. Events only wake the watcher; what changed
+    is decided by comparing file stamps.
+    """
+
+    def __init__(self, libc: Any, fd: int):
+        self._libc = libc
+        self.fd = fd
+        self._watched: Set[Path] = set()
+
+    @classmethod
+    def create(cls) -> Optional["_Inotify"]:
+        """Return an inotify instance, or None where it is unavailable."""
+
+        if not sys.platform.startswith("linux"):
+            return None
+
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+
+        if fd < 0:
+            return None
+
+        return cls(libc, fd)
+
+    def add_watch(self, directory: Path) -> None:
+        if directory in self._watched:
+            return
+
+        if self._libc.inotify_add_watch(
+            self.fd, os.fsencode(directory), _WATCH_MASK
+        ) >= 0:
+            self._watched.add(directory)
+
+    def drain(self) -> None:
+        try:
+            while os.read(self.fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+
+    def close(self) -> None:
+        os.close(self.fd)
@@ -92,6 +92,9 @@ class PolicyValidator:
             if not isinstance(allowed, list):
                 errors.append("data.regions.allowed must be a list")
 
+            if "denied" in regions and not isinstance(regions["denied"], list):
+                errors.append("data.regions.denied must be a list")
+
         # PII policy
         pii = data.get("pii")
         if pii is not None:
@@ -101,6 +104,29 @@ class PolicyValidator:
                     "data.pii.action must be one of: block, redact"
                 )
 
+        # Keyword policy
+        keywords = data.get("keywords")
+        if keywords is not None:
+            if not isinstance(keywords, dict):
+                errors.append("data.keywords must be a mapping")
+            else:
+                terms = keywords.get("terms")
+                if not isinstance(terms, list) or not all(
+                    isinstance(term, str) and term for term in terms
+                ):
+                    errors.append(
+                        "data.keywords.terms must be a list of non-empty strings"
+                    )
+
+                if keywords.get("action") not in ("block", "redact"):
+                    errors.append(
+                        "data.keywords.action must be one of: block, redact"
+                    )
+
+                for key in ("ignore_case", "whole_word"):
+                    if key in keywords and not isinstance(keywords[key], bool):
+                        errors.append(f"data.keywords.{key} must be a boolean")
+
         # Tool policy validation (v0.3)
         tools = resolved.get("tools")
         if tools is not None:
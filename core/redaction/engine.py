@@ -2,24 +2,93 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
 
-# Keep regexes aligned with PII detection
-EMAIL_REGEX = re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+")
-PHONE_REGEX = re.compile(r"\b\d{10}\b")
-CREDIT_CARD_REGEX = re.compile(r"\b\d{13,19}\b")
+from core.pii import scanner as _scanner
+from core.pii.scanner import PiiSpan, scan_pii
 
-REDACTION_MAP: Dict[str, Tuple[re.Pattern, str]] = {
-    "email": (EMAIL_REGEX, "[REDACTED_EMAIL]"),
-    "phone": (PHONE_REGEX, "[REDACTED_PHONE]"),
-    "credit_card": (CREDIT_CARD_REGEX, "[REDACTED_CREDIT_CARD]"),
+REPLACEMENTS: Dict[str, str] = {
+    "email": "[REDACTED_EMAIL]",
+    "phone": "[REDACTED_PHONE]",
+    "credit_card": "[REDACTED_CREDIT_CARD]",
+    "keyword": "[REDACTED_KEYWORD]",
 }
 
+# Entity -> rank, used to break ties between spans covering exactly the
+# same text: the entity listed first in REPLACEMENTS wins.
+_PRIORITY: Dict[str, int] = {entity: rank for rank, entity in enumerate(REPLACEMENTS)}
+
+
+def __getattr__(name: str) -> Any:
+    # REDACTION_MAP: entity -> (regex, replacement), built on first use so
+    # that importing the engine compiles no regexes.
+    if name == "REDACTION_MAP":
+        redaction_map: Dict[str, Tuple[re.Pattern, str]] = {
+            "email": (_scanner.EMAIL_REGEX, REPLACEMENTS["email"]),
+            "phone": (_scanner.PHONE_REGEX, REPLACEMENTS["phone"]),
+            "credit_card": (_scanner.CREDIT_CARD_REGEX, REPLACEMENTS["credit_card"]),
+        }
+        globals()[name] = redaction_map
+        return redaction_map
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def merge_spans(*groups: Sequence[PiiSpan]) -> List[PiiSpan]:
+    """
+    Merge span lists from several scanners into one non-overlapping list.
+
+    Overlapping spans are coalesced into one span covering all of them,
+    so no part of any span survives redaction. The coalesced span takes
+    the entity of the leftmost-longest span; on an exact tie, of the
+    span from the earlier group, then of the entity listed first in
+    REPLACEMENTS.
+    """
+    unranked = len(_PRIORITY)
+    ordered = sorted(
+        (
+            span.start,
+            span.start - span.end,
+            index,
+            _PRIORITY.get(span.entity, unranked),
+            span,
+        )
+        for index, group in enumerate(groups)
+        for span in group
+    )
+
+    merged: List[PiiSpan] = []
+
+    for start, _, _, _, span in ordered:
+        if merged and start < merged[-1].end:
+            if span.end > merged[-1].end:
+                merged[-1] = merged[-1]._replace(end=span.end)
+            continue
+
+        merged.append(span)
+
+    return merged
+
+
+class RedactedSpan(NamedTuple):
+    """
+    One replacement: `original[start:end]` became
+    `redacted[redacted_start:redacted_end]`.
+    """
+
+    entity: str
+    start: int
+    end: int
+    redacted_start: int
+    redacted_end: int
+
 
 @dataclass(frozen=True)
 class RedactionResult:
     text: str
     redacted_entities: List[str]
+    # Every replacement in text order, with its offsets in both texts
+    spans: Tuple[RedactedSpan, ...] = ()
 
 
 class RedactionEngine:
@@ -29,17 +98,62 @@ class RedactionEngine:
     Applies simple, explainable transformations.
     """
 
-    def redact(self, text: str) -> RedactionResult:
-        redacted_entities: List[str] = []
-        redacted_text = text
+    def redact(
+        self,
+        text: str,
+        spans: Optional[Sequence[PiiSpan]] = None,
+    ) -> RedactionResult:
+        """
+        Replace every PII span with its placeholder.
+
+        `spans` may carry the result of `scan_pii(text)` to avoid
+        rescanning text that has already been inspected. Supplied spans
+        may come in any order and may overlap: they are coalesced with
+        `merge_spans` first, so the output never depends on the order in
+        which detectors ran. `redacted_entities` lists the entity of
+        every supplied span, including those coalesced into another.
 
-        for entity, (pattern, replacement) in REDACTION_MAP.items():
-            if pattern.search(redacted_text):
-                redacted_text = pattern.sub(replacement, redacted_text)
-                redacted_entities.append(entity)
+        The output is built in one pass over the resolved spans.
+        """
+        if spans is None:
+            spans = scan_pii(text)
+            entities = {span.entity for span in spans}
+        else:
+            entities = {span.entity for span in spans}
+            spans = merge_spans(spans)
+
+        if not spans:
+            return RedactionResult(text=text, redacted_entities=[])
+
+        parts: List[str] = []
+        redacted: List[RedactedSpan] = []
+        position = 0
+        # Length of the output built so far
+        offset = 0
+
+        for span in spans:
+            kept = text[position:span.start]
+            replacement = REPLACEMENTS[span.entity]
+            parts.append(kept)
+            parts.append(replacement)
+
+            offset += len(kept)
+            redacted.append(
+                RedactedSpan(
+                    span.entity,
+                    span.start,
+                    span.end,
+                    offset,
+                    offset + len(replacement),
+                )
+            )
+            offset += len(replacement)
+            position = span.end
+
+        parts.append(text[position:])
 
         return RedactionResult(
-            text=redacted_text,
-            redacted_entities=sorted(set(redacted_entities)),
+            text="".join(parts),
+            redacted_entities=sorted(entities),
+            spans=tuple(redacted),
         )
-
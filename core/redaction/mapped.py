@@ -0,0 +1,162 @@
+"""
+Memory-mapped enforcement input.
+
+`MappedText` maps a UTF-8 text file instead of reading it into a str,
+scans it for PII window by window and writes the redacted content
+straight from the mapping, so memory use stays flat whatever the file
+size or the number of matches.
+
+Windows end right after an ASCII barrier byte (see
+core.pii.scanner.BARRIER_PATTERN): no match crosses one, and an ASCII
+byte is never part of a multi-byte character. An all-ASCII window is
+scanned in place with the byte-level detectors; any other window is
+decoded on its own and scanned with `scan_pii`, so the spans are exactly
+those of `scan_pii` over the decoded file, in byte offsets.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import re
+from typing import Any, BinaryIO, Iterator, List, Sequence
+
+from core.pii.scanner import PiiSpan, first_spans, scan_pii, scan_pii_bytes
+from core.redaction.engine import REPLACEMENTS
+
+DEFAULT_WINDOW = 1024 * 1024
+
+# ASCII bytes no match can contain
+_ASCII_BARRIER = re.compile(rb"[^a-zA-Z0-9_.+\-@\x80-\xff]")
+_NON_ASCII = re.compile(rb"[\x80-\xff]")
+
+_COPY_SIZE = 1024 * 1024
+
+
+class MappedText:
+    """
+    A read-only UTF-8 text file, mapped into memory.
+
+    Pass it as `text` to `EnforcementOrchestrator.enforce`: PII
+    detection and redaction then run over the mapping, and `write`
+    streams the content, redacted as decided, to a file.
+
+    Spans are never collected for the whole file, which could hold
+    millions of them: `scan_pii` stops at the first span of each entity
+    type, which is all a detection decision needs, and `write` scans
+    again window by window as it copies.
+
+    Keyword rules need the text as a str and are not supported.
+    """
+
+    def __init__(self, path: str, *, window: int = DEFAULT_WINDOW):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+
+        self.path = path
+        self.window = window
+        # Entity types `write` replaces
+        self.redacted_entities: List[str] = []
+
+        with open(path, "rb") as f:
+            self.size = os.fstat(f.fileno()).st_size
+            # Empty files cannot be mapped
+            self._buffer: Any = (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+            )
+
+    def close(self) -> None:
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self) -> MappedText:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+
+    def scan_pii(self) -> List[PiiSpan]:
+        """
+        Return the first PII span of each entity type found, in byte
+        offsets and text order.
+        """
+        return first_spans(self._spans())
+
+    def redact(self, spans: Sequence[PiiSpan]) -> List[str]:
+        """
+        Have `write` replace every span of the entity types in `spans`.
+
+        Returns those entity types, sorted.
+        """
+        self.redacted_entities = sorted({span.entity for span in spans})
+        return self.redacted_entities
+
+    def write(self, out: BinaryIO) -> None:
+        """
+        Write the file content to `out`, with redactions applied.
+        """
+        redacted = frozenset(self.redacted_entities)
+
+        with memoryview(self._buffer) as view:
+            position = 0
+
+            if redacted:
+                for span in self._spans():
+                    if span.entity in redacted:
+                        self._copy(out, view, position, span.start)
+                        out.write(REPLACEMENTS[span.entity].encode("utf-8"))
+                        position = span.end
+
+            self._copy(out, view, position, self.size)
+
+    # ------------------------------------------------------------------
+
+    def _spans(self) -> Iterator[PiiSpan]:
+        buffer = self._buffer
+        size = self.size
+        position = 0
+
+        while position < size:
+            end = position + self.window
+            if end < size:
+                barrier = _ASCII_BARRIER.search(buffer, end - 1)
+                end = barrier.end() if barrier is not None else size
+            else:
+                end = size
+
+            if _NON_ASCII.search(buffer, position, end) is None:
+                yield from scan_pii_bytes(buffer, position, end)
+            else:
+                yield from self._scan_decoded(position, end)
+
+            position = end
+
+    def _scan_decoded(self, start: int, end: int) -> List[PiiSpan]:
+        # Keep the barrier before the window as look-behind context
+        context = 1 if start else 0
+        text = self._buffer[start - context:end].decode("utf-8")
+
+        spans: List[PiiSpan] = []
+        # Byte offset of character `char`
+        byte = start - context
+        char = 0
+
+        for span in scan_pii(text, context):
+            byte += len(text[char:span.start].encode("utf-8"))
+            length = len(text[span.start:span.end].encode("utf-8"))
+            spans.append(PiiSpan(span.entity, byte, byte + length))
+            byte += length
+            char = span.end
+
+        return spans
+
+    @staticmethod
+    def _copy(out: BinaryIO, view: memoryview, start: int, end: int) -> None:
+        if end - start <= _COPY_SIZE:
+            out.write(view[start:end])
+            return
+
+        for offset in range(start, end, _COPY_SIZE):
+            out.write(view[offset:min(offset + _COPY_SIZE, end)])
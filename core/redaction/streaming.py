@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List, Optional, Set
+
+from core.pii.scanner import MATCH_CHARS, PiiSpan, scan_pii
+from core.redaction.engine import RedactionEngine
+
+DEFAULT_MAX_WINDOW = 1024
+
+
+def _is_match_char(ch: str) -> bool:
+    # Anything else is a barrier: every match before it is already final
+    return ch in MATCH_CHARS or ch.isdecimal()
+
+
+class StreamingRedactor:
+    """
+    Incremental redactor for token streams.
+
+    Text is released as soon as no future chunk can change how it is
+    redacted: everything up to the last character that cannot be part of
+    a PII match. Only the trailing run after that character is held back,
+    so entities split across chunk boundaries are still caught.
+
+    The held-back look-behind is bounded by `max_window` characters. When
+    a single run exceeds it, its first characters are released anyway,
+    unredacted, and the rest of the run is scanned as if a new run
+    started at the cut. An email whose local part is longer than the
+    window therefore has the start of its local part emitted in clear,
+    while the remainder and the domain are still redacted; digits after
+    the cut may be redacted even where the full text has no match.
+
+    For streams without such runs, the concatenated output is identical
+    to `RedactionEngine.redact` over the full text.
+    """
+
+    def __init__(
+        self,
+        engine: Optional[RedactionEngine] = None,
+        *,
+        max_window: int = DEFAULT_MAX_WINDOW,
+    ):
+        if max_window < 1:
+            raise ValueError("max_window must be at least 1")
+
+        self.engine = engine or RedactionEngine()
+        self.max_window = max_window
+        self._pending = ""
+        self._context = ""
+        self._entities: Set[str] = set()
+
+    @property
+    def redacted_entities(self) -> List[str]:
+        """Entity types redacted so far, sorted."""
+        return sorted(self._entities)
+
+    def feed(self, chunk: str) -> str:
+        """
+        Add a chunk and return the redacted text that is now safe to emit.
+
+        May return an empty string while a candidate entity is pending.
+        """
+        buffer = self._pending + chunk
+
+        cut = len(buffer)
+        floor = max(0, len(buffer) - self.max_window)
+        while cut > floor and _is_match_char(buffer[cut - 1]):
+            cut -= 1
+
+        forced = cut == floor and floor > 0 and _is_match_char(buffer[cut - 1])
+
+        return self._release(buffer, cut, forced=forced)
+
+    def flush(self) -> str:
+        """
+        Release everything still held back. Call once the stream ends.
+        """
+        buffer = self._pending
+        return self._release(buffer, len(buffer), forced=False)
+
+    def redact_iter(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Redact a synchronous stream of chunks, yielding non-empty output.
+        """
+        for chunk in chunks:
+            output = self.feed(chunk)
+            if output:
+                yield output
+
+        output = self.flush()
+        if output:
+            yield output
+
+    async def aredact_iter(self, chunks: AsyncIterable[str]) -> AsyncIterator[str]:
+        """
+        Redact an asynchronous stream of chunks, yielding non-empty output.
+        """
+        async for chunk in chunks:
+            output = self.feed(chunk)
+            if output:
+                yield output
+
+        output = self.flush()
+        if output:
+            yield output
+
+    # ------------------------------------------------------------------
+
+    def _release(self, buffer: str, cut: int, *, forced: bool) -> str:
+        offset = len(self._context)
+        spans = scan_pii(self._context + buffer, offset)
+
+        if forced:
+            # Never split an entity that straddles a forced cut.
+            for span in spans:
+                if span.start - offset < cut < span.end - offset:
+                    cut = span.start - offset if span.start > offset else span.end - offset
+                    break
+
+        released = [
+            PiiSpan(span.entity, span.start - offset, span.end - offset)
+            for span in spans
+            if span.end - offset <= cut
+        ]
+
+        if cut == 0:
+            self._pending = buffer
+            return ""
+
+        result = self.engine.redact(buffer[:cut], released)
+        self._entities.update(result.redacted_entities)
+
+        # After a forced cut, drop the look-behind: the held rest of the
+        # run must not look like the middle of one, or an email it
+        # completes later would not be matched at all
+        self._context = "" if forced else buffer[cut - 1]
+        self._pending = buffer[cut:]
+
+        return result.text
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import json
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List
+
+from core.telemetry.instrumentation import Histogram, Instrumentation
+
+
+class SpanExporter(ABC):
+    """
+    Receives finished spans (OpenTelemetry-style dicts), one enforcement
+    run at a time.
+
+    Exporters run on the enforcement path and should be cheap; an
+    exporter that needs network I/O should queue spans and ship them
+    elsewhere.
+    """
+
+    @abstractmethod
+    def export(self, spans: List[Dict[str, Any]]) -> None:
+        pass
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps spans in memory; useful for tests and debugging."""
+
+    def __init__(self) -> None:
+        self.spans: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self.spans.extend(spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.spans.clear()
+
+
+class JsonLinesSpanExporter(SpanExporter):
+    """
+    Appends spans as JSON Lines to a local file, for a collector agent
+    (or a human) to pick up.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Dict[str, Any]]) -> None:
+        data = "".join(json.dumps(span, sort_keys=True) + "\n" for span in spans)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(data)
+
+
+# ----------------------------------------------------------------------
+# Prometheus text exposition
+# ----------------------------------------------------------------------
+
+
+def prometheus_text(instrumentation: Instrumentation) -> str:
+    """
+    Render the collected metrics in the Prometheus text exposition
+    format (version 0.0.4).
+    """
+
+    with instrumentation._lock:
+        lines: List[str] = []
+
+        _histograms(
+            lines,
+            "ai_governor_stage_duration_seconds",
+            "Duration of each enforcement stage.",
+            "stage",
+            instrumentation.stage_durations,
+        )
+        _histograms(
+            lines,
+            "ai_governor_enforce_duration_seconds",
+            "Duration of enforce calls, by final decision.",
+            "decision",
+            instrumentation.enforce_durations,
+        )
+        _histograms(
+            lines,
+            "ai_governor_audit_sink_write_duration_seconds",
+            "Duration of audit sink writes.",
+            "sink",
+            instrumentation.sink_durations,
+        )
+
+        lines.append("# HELP ai_governor_decisions_total Stage decisions by policy section.")
+        lines.append("# TYPE ai_governor_decisions_total counter")
+        for (section, decision), count in sorted(instrumentation.decisions.items()):
+            labels = _labels(policy_section=section, decision=decision.value)
+            lines.append(f"ai_governor_decisions_total{labels} {count}")
+
+        lines.append("# HELP ai_governor_enforcements_total Enforce calls by final decision.")
+        lines.append("# TYPE ai_governor_enforcements_total counter")
+        for outcome, count in sorted(instrumentation.enforcements.items()):
+            lines.append(
+                f"ai_governor_enforcements_total{_labels(decision=outcome)} {count}"
+            )
+
+        lines.append("# HELP ai_governor_audit_sink_errors_total Failed audit sink writes.")
+        lines.append("# TYPE ai_governor_audit_sink_errors_total counter")
+        for sink, count in sorted(instrumentation.sink_errors.items()):
+            lines.append(f"ai_governor_audit_sink_errors_total{_labels(sink=sink)} {count}")
+
+    return "\n".join(lines) + "\n"
+
+
+def _histograms(
+    lines: List[str],
+    name: str,
+    help_text: str,
+    label: str,
+    family: Dict[str, Histogram],
+) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+
+    for value, histogram in sorted(family.items()):
+        for bound, count in histogram.cumulative():
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f"{name}_bucket{_labels(**{label: value, 'le': le})} {count}")
+        lines.append(f"{name}_sum{_labels(**{label: value})} {histogram.sum!r}")
+        lines.append(f"{name}_count{_labels(**{label: value})} {histogram.count}")
+
+
+def _labels(**labels: str) -> str:
+    rendered = ",".join(
+        f'{key}="{_escape(str(value))}"' for key, value in labels.items()
+    )
+    return "{" + rendered + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
@@ -0,0 +1,254 @@
+"""
+In-process enforcement instrumentation.
+
+Orchestrators and emitters accept an optional `Instrumentation`. When
+none is configured every hook is a single `is not None` check, so
+disabled instrumentation costs close to nothing.
+
+When enabled, each `enforce` call records a Trace: consecutive stage
+marks on a monotonic clock. Finished traces feed
+
+- latency histograms per stage and per enforcement
+- decision counters keyed by (policy_section, DecisionType)
+- optional OpenTelemetry-style spans, handed to a span exporter
+
+Sink writes are timed separately by the audit emitters.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from core.decision import Decision, DecisionType
+
+# Seconds; fine-grained at the low end, where enforcement stages live
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+)
+
+STAGE_VALIDATE = "validate"
+STAGE_MODEL = "model"
+STAGE_REGION = "region"
+STAGE_TOOLS = "tools"
+STAGE_KEYWORDS = "keywords"
+STAGE_PII_SCAN = "pii_scan"
+STAGE_PII = "pii"
+STAGE_REDACTION = "redaction"
+STAGE_AUDIT = "audit"
+
+_clock = time.perf_counter_ns
+
+
+class Histogram:
+    """
+    Cumulative-bucket latency histogram (Prometheus semantics).
+
+    Not thread-safe on its own; Instrumentation serialises updates.
+    """
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        # One extra slot for +Inf
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """Return (upper bound, cumulative count) pairs, ending with +Inf."""
+
+        total = 0
+        pairs = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+
+class Trace:
+    """
+    Stage timings of one enforcement run.
+
+    Stages run back to back, so each `mark` closes the stage that
+    started at the previous mark.
+    """
+
+    __slots__ = ("wall_start_ns", "start_ns", "last_ns", "stages")
+
+    def __init__(self) -> None:
+        self.wall_start_ns = time.time_ns()
+        self.start_ns = self.last_ns = _clock()
+        # (stage, start_ns, end_ns, decision or None)
+        self.stages: List[Tuple[str, int, int, Optional[Decision]]] = []
+
+    def mark(self, stage: str, decision: Optional[Decision] = None) -> None:
+        now = _clock()
+        self.stages.append((stage, self.last_ns, now, decision))
+        self.last_ns = now
+
+
+class Instrumentation:
+    """
+    Collects enforcement metrics and, optionally, exports spans.
+
+    Usage:
+        instrumentation = Instrumentation()
+        orchestrator = EnforcementOrchestrator(instrumentation=instrumentation)
+        ...
+        prometheus_text(instrumentation)
+    """
+
+    def __init__(
+        self,
+        *,
+        span_exporter: Any = None,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.span_exporter = span_exporter
+        self.buckets = tuple(buckets)
+
+        self._lock = threading.Lock()
+        self.stage_durations: Dict[str, Histogram] = {}
+        self.enforce_durations: Dict[str, Histogram] = {}
+        self.sink_durations: Dict[str, Histogram] = {}
+        self.sink_errors: Dict[str, int] = {}
+        self.decisions: Dict[Tuple[str, DecisionType], int] = {}
+        self.enforcements: Dict[str, int] = {}
+
+    # ------------------------------------------------------------------
+    # Hooks
+    # ------------------------------------------------------------------
+
+    def trace(self) -> Trace:
+        return Trace()
+
+    def record(
+        self,
+        trace: Trace,
+        result: Optional[Dict[str, Any]] = None,
+        *,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Record a finished enforcement run.
+
+        `result` is the orchestrator result; `error` is set instead when
+        enforcement raised.
+        """
+        end_ns = _clock()
+        outcome = "ERROR" if error is not None else result["final_decision"].decision.value
+
+        with self._lock:
+            for stage, start_ns, stop_ns, _ in trace.stages:
+                self._histogram(self.stage_durations, stage).observe(
+                    (stop_ns - start_ns) / 1e9
+                )
+
+            self._histogram(self.enforce_durations, outcome).observe(
+                (end_ns - trace.start_ns) / 1e9
+            )
+            self.enforcements[outcome] = self.enforcements.get(outcome, 0) + 1
+
+            if result is not None:
+                for decision in result["decisions"]:
+                    key = (decision.policy_section, decision.decision)
+                    self.decisions[key] = self.decisions.get(key, 0) + 1
+
+        if self.span_exporter is not None:
+            self.span_exporter.export(_spans(trace, end_ns, outcome, error))
+
+    def observe_sink(self, sink: Any, duration_ns: int, *, failed: bool = False) -> None:
+        """Record one audit sink write."""
+
+        name = type(sink).__name__
+        with self._lock:
+            self._histogram(self.sink_durations, name).observe(duration_ns / 1e9)
+            if failed:
+                self.sink_errors[name] = self.sink_errors.get(name, 0) + 1
+
+    # ------------------------------------------------------------------
+
+    def _histogram(self, family: Dict[str, Histogram], label: str) -> Histogram:
+        histogram = family.get(label)
+        if histogram is None:
+            histogram = family[label] = Histogram(self.buckets)
+        return histogram
+
+
+def _spans(
+    trace: Trace,
+    end_ns: int,
+    outcome: str,
+    error: Optional[BaseException],
+) -> List[Dict[str, Any]]:
+    """
+    Convert a trace into OpenTelemetry-style span dicts: one root span
+    for the enforcement run, one child span per stage.
+    """
+
+    trace_id = os.urandom(16).hex()
+    root_id = os.urandom(8).hex()
+
+    def wall(ns: int) -> int:
+        return trace.wall_start_ns + (ns - trace.start_ns)
+
+    root: Dict[str, Any] = {
+        "trace_id": trace_id,
+        "span_id": root_id,
+        "parent_span_id": None,
+        "name": "ai_governor.enforce",
+        "start_time_unix_nano": wall(trace.start_ns),
+        "end_time_unix_nano": wall(end_ns),
+        "attributes": {"ai_governor.decision": outcome},
+        "status": {"code": "ERROR" if error is not None else "OK"},
+    }
+    if error is not None:
+        root["status"]["message"] = str(error)
+
+    spans = [root]
+    for stage, start_ns, stop_ns, decision in trace.stages:
+        attributes: Dict[str, Any] = {"ai_governor.stage": stage}
+        if decision is not None:
+            attributes["ai_governor.policy_section"] = decision.policy_section
+            attributes["ai_governor.decision"] = decision.decision.value
+
+        spans.append(
+            {
+                "trace_id": trace_id,
+                "span_id": os.urandom(8).hex(),
+                "parent_span_id": root_id,
+                "name": f"ai_governor.stage.{stage}",
+                "start_time_unix_nano": wall(start_ns),
+                "end_time_unix_nano": wall(stop_ns),
+                "attributes": attributes,
+                "status": {"code": "OK"},
+            }
+        )
+
+    return spans
@@ -7,18 +7,18 @@ No real LLM calls are made.
 
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
-import yaml
 
-from core.enforcement.orchestrator import EnforcementOrchestrator
+from core.enforcement.async_orchestrator import AsyncEnforcementOrchestrator
 from core.decision import DecisionType
+from core.policy.store import PolicyStore
 
 app = FastAPI(title="ai-governor FastAPI Demo")
 
-# Load policy once (static for demo)
-with open("policy.yaml") as f:
-    POLICY = yaml.safe_load(f)
+# Compiled once, then hot-reloaded in the background when policy.yaml
+# (or any policy it extends) changes
+policies = PolicyStore({"default": "policy.yaml"})
 
-orchestrator = EnforcementOrchestrator()
+orchestrator = AsyncEnforcementOrchestrator()
 
 
 class GenerateRequest(BaseModel):
@@ -29,9 +29,9 @@ class GenerateRequest(BaseModel):
 
 
 @app.post("/generate")
-def generate(req: GenerateRequest):
-    result = orchestrator.enforce(
-        policy=POLICY,
+async def generate(req: GenerateRequest):
+    result = await orchestrator.enforce(
+        policy=policies.get("default"),
         requested_model=req.model,
         region=req.region,
         tool_name=req.tool,
@@ -0,0 +1,36 @@
+"""
+Post-inference hooks.
+
+Applied to model output before it is returned to the caller.
+"""
+
+from __future__ import annotations
+
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, Optional
+
+from core.redaction.engine import RedactionEngine
+from core.redaction.streaming import DEFAULT_MAX_WINDOW, StreamingRedactor
+
+
+def redact_stream(
+    chunks: Iterable[str],
+    *,
+    engine: Optional[RedactionEngine] = None,
+    max_window: int = DEFAULT_MAX_WINDOW,
+) -> Iterator[str]:
+    """
+    Redact PII from a streamed model response, chunk by chunk.
+    """
+    return StreamingRedactor(engine, max_window=max_window).redact_iter(chunks)
+
+
+def aredact_stream(
+    chunks: AsyncIterable[str],
+    *,
+    engine: Optional[RedactionEngine] = None,
+    max_window: int = DEFAULT_MAX_WINDOW,
+) -> AsyncIterator[str]:
+    """
+    Redact PII from an asynchronously streamed model response.
+    """
+    return StreamingRedactor(engine, max_window=max_window).aredact_iter(chunks)
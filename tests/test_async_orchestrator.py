@@ -0,0 +1,152 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from core.audit.async_sinks import AsyncAuditSink, AsyncJsonFileSink, AsyncStreamSink
+from core.audit.emitter import AsyncAuditEventEmitter
+from core.audit.sinks import AuditSinkError
+from core.decision import DecisionType
+from core.enforcement.async_orchestrator import AsyncEnforcementOrchestrator
+from core.enforcement.orchestrator import EnforcementOrchestrator
+from core.pii.parallel import ParallelScanner
+
+
+POLICY = {
+    "version": "0.1",
+    "model": {"allow": ["gpt-4.1"], "deny": ["*-preview"]},
+    "data": {"pii": {"action": "redact"}},
+}
+
+
+class RecordingSink(AsyncAuditSink):
+    def __init__(self):
+        self.events = []
+
+    async def write(self, event):
+        self.events.append(event)
+
+
+class FailingSink(AsyncAuditSink):
+    async def write(self, event):
+        raise AuditSinkError("down")
+
+
+class GatedExecutor:
+    """Runs a map only once the event loop has set the gate."""
+
+    def __init__(self):
+        self.gate = threading.Event()
+
+    def map(self, fn, *iterables):
+        assert self.gate.wait(timeout=5), "event loop blocked during the scan"
+        return map(fn, *iterables)
+
+    def shutdown(self, wait=True):
+        pass
+
+
+class BufferWriter:
+    def __init__(self):
+        self.data = b""
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        pass
+
+
+def test_async_matches_sync_enforce():
+    sink = RecordingSink()
+    orchestrator = AsyncEnforcementOrchestrator(
+        audit_emitter=AsyncAuditEventEmitter([sink])
+    )
+    requests = [
+        {"requested_model": "gpt-4.1", "text": "Hello"},
+        {"requested_model": "gpt-4.1", "text": "Mail test@example.com"},
+        {"requested_model": "gpt-4.1-preview", "text": "Hello"},
+    ]
+
+    for request in requests:
+        result = asyncio.run(orchestrator.enforce(POLICY, **request))
+        expected = EnforcementOrchestrator().enforce(POLICY, **request)
+
+        assert [d.to_dict() for d in result["decisions"]] == [
+            d.to_dict() for d in expected["decisions"]
+        ]
+        assert result["output_text"] == expected["output_text"]
+
+    assert [e["policy_section"] for e in sink.events[:4]] == [
+        "model", "data.regions", "tools", "data.pii",
+    ]
+
+
+def test_async_sink_failure_is_fail_fast():
+    orchestrator = AsyncEnforcementOrchestrator(
+        audit_emitter=AsyncAuditEventEmitter([FailingSink()])
+    )
+
+    with pytest.raises(AuditSinkError):
+        asyncio.run(orchestrator.enforce(POLICY, requested_model="gpt-4.1"))
+
+
+def test_async_file_sink_concurrent_writes(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    orchestrator = AsyncEnforcementOrchestrator(
+        audit_emitter=AsyncAuditEventEmitter([AsyncJsonFileSink(str(path))])
+    )
+
+    async def run_many():
+        return await asyncio.gather(
+            *(
+                orchestrator.enforce(
+                    POLICY,
+                    requested_model="gpt-4.1",
+                    text="Hi",
+                    context={"request_id": i},
+                )
+                for i in range(20)
+            )
+        )
+
+    results = asyncio.run(run_many())
+
+    assert all(r["final_decision"].decision == DecisionType.ALLOW for r in results)
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(lines) == 80
+
+
+def test_async_stream_sink_writes_json_lines():
+    writer = BufferWriter()
+    sink = AsyncStreamSink(writer)
+
+    asyncio.run(sink.write_batch([{"b": 1, "a": 2}, {"c": 3}]))
+
+    assert writer.data == b'{"a": 2, "b": 1}\n{"c": 3}\n'
+
+
+def test_async_pool_scan_does_not_block_event_loop():
+    executor = GatedExecutor()
+    orchestrator = AsyncEnforcementOrchestrator(
+        audit_emitter=AsyncAuditEventEmitter([RecordingSink()]),
+        pii_scanner=ParallelScanner(threshold=0, chunk_size=1000, executor=executor),
+    )
+    text = "Mail a@b.com or call 9876543210. " * 200
+
+    async def run():
+        task = asyncio.create_task(
+            orchestrator.enforce(POLICY, requested_model="gpt-4.1", text=text)
+        )
+        await asyncio.sleep(0.01)
+        executor.gate.set()
+        return await task
+
+    result = asyncio.run(run())
+
+    serial = EnforcementOrchestrator().enforce(
+        POLICY, requested_model="gpt-4.1", text=text
+    )
+    assert result["output_text"] == serial["output_text"]
+    assert result["final_decision"] == serial["final_decision"]
@@ -0,0 +1,165 @@
+import asyncio
+
+import pytest
+
+from core.audit.async_sinks import AsyncAuditSink
+from core.audit.emitter import (
+    AUDIT_MODE_AGGREGATE,
+    AsyncAuditEventEmitter,
+    AuditEventEmitter,
+)
+from core.audit.sinks import AuditSink, AuditSinkError
+from core.enforcement.async_orchestrator import AsyncEnforcementOrchestrator
+from core.enforcement.orchestrator import EnforcementOrchestrator
+
+
+POLICY = {
+    "version": "0.1",
+    "model": {"allow": ["gpt-4.1"]},
+    "data": {
+        "regions": {"allowed": ["EU"]},
+        "pii": {"action": "redact"},
+    },
+}
+
+
+class RecordingSink(AuditSink):
+    def __init__(self):
+        self.events = []
+        self.writes = 0
+
+    def write(self, event):
+        self.writes += 1
+        self.events.append(event)
+
+    def write_batch(self, events):
+        self.writes += 1
+        self.events.extend(events)
+
+
+class AsyncRecordingSink(AsyncAuditSink):
+    def __init__(self):
+        self.events = []
+
+    async def write(self, event):
+        self.events.append(event)
+
+
+class FailingSink(AuditSink):
+    def write(self, event):
+        raise AuditSinkError("down")
+
+
+def _orchestrator(sink, audit_mode=AUDIT_MODE_AGGREGATE):
+    return EnforcementOrchestrator(
+        audit_emitter=AuditEventEmitter([sink]),
+        audit_mode=audit_mode,
+    )
+
+
+def test_aggregate_mode_emits_one_event_per_enforce():
+    sink = RecordingSink()
+
+    result = _orchestrator(sink).enforce(
+        POLICY,
+        requested_model="gpt-4.1",
+        region="EU",
+        text="Mail test@example.com",
+        context={"request_id": "r1"},
+    )
+
+    assert sink.writes == 1
+    (event,) = sink.events
+
+    assert event["event_type"] == "llm_governance_enforcement"
+    assert event["decision"] == "MODIFY"
+    assert event["policy_section"] == "data.pii"
+    assert event["context"] == {"request_id": "r1"}
+    assert event["stages"] == [d.to_dict() for d in result["decisions"]]
+    assert [s["policy_section"] for s in event["stages"]] == [
+        "model",
+        "data.regions",
+        "tools",
+        "data.pii",
+    ]
+
+
+def test_aggregate_mode_records_stages_up_to_block():
+    sink = RecordingSink()
+
+    _orchestrator(sink).enforce(POLICY, requested_model="gpt-4.1", region="US")
+
+    (event,) = sink.events
+    assert event["decision"] == "BLOCK"
+    assert event["policy_section"] == "data.regions"
+    assert len(event["stages"]) == 2
+
+
+def test_per_stage_mode_is_default_and_unchanged():
+    sink = RecordingSink()
+    orchestrator = EnforcementOrchestrator(audit_emitter=AuditEventEmitter([sink]))
+
+    orchestrator.enforce(POLICY, requested_model="gpt-4.1", region="EU", text="Hi")
+
+    assert len(sink.events) == 4
+    assert all("stages" not in event for event in sink.events)
+    assert {event["event_type"] for event in sink.events} == {
+        "llm_governance_decision"
+    }
+
+
+def test_aggregate_mode_results_match_per_stage_mode():
+    kwargs = dict(requested_model="gpt-4.1", region="EU", text="Call 9876543210")
+
+    aggregate = _orchestrator(RecordingSink()).enforce(POLICY, **kwargs)
+    per_stage = _orchestrator(RecordingSink(), "per_stage").enforce(POLICY, **kwargs)
+
+    assert aggregate["output_text"] == per_stage["output_text"]
+    assert aggregate["final_decision"] == per_stage["final_decision"]
+    assert aggregate["decisions"] == per_stage["decisions"]
+
+
+def test_aggregate_mode_batch_writes_one_event_per_request():
+    sink = RecordingSink()
+
+    _orchestrator(sink).enforce_batch(
+        POLICY,
+        [
+            {"requested_model": "gpt-4.1", "region": "EU", "text": "Hi"},
+            {"requested_model": "gpt-4.1", "region": "US"},
+            {"requested_model": "gpt-4.1", "region": "EU"},
+        ],
+    )
+
+    assert sink.writes == 1
+    assert [event["decision"] for event in sink.events] == [
+        "ALLOW",
+        "BLOCK",
+        "ALLOW",
+    ]
+
+
+def test_aggregate_mode_fails_fast_on_sink_error():
+    with pytest.raises(AuditSinkError):
+        _orchestrator(FailingSink()).enforce(POLICY, requested_model="gpt-4.1")
+
+
+def test_unknown_audit_mode_is_rejected():
+    with pytest.raises(ValueError, match="Unknown audit mode"):
+        EnforcementOrchestrator(audit_mode="sometimes")
+
+
+def test_async_aggregate_mode_emits_one_event():
+    sink = AsyncRecordingSink()
+    orchestrator = AsyncEnforcementOrchestrator(
+        audit_emitter=AsyncAuditEventEmitter([sink]),
+        audit_mode=AUDIT_MODE_AGGREGATE,
+    )
+
+    result = asyncio.run(
+        orchestrator.enforce(POLICY, requested_model="gpt-4.1", region="EU", text="Hi")
+    )
+
+    (event,) = sink.events
+    assert event["decision"] == "ALLOW"
+    assert event["stages"] == [d.to_dict() for d in result["decisions"]]
@@ -0,0 +1,104 @@
+import json
+
+import pytest
+
+import core.audit.emitter as emitter_module
+from core.audit.emitter import AuditEventEmitter
+from core.audit.encoding import encode_event, encode_events
+from core.audit.sinks import AuditSink, AuditSinkError, JsonFileSink, StdoutSink
+from core.decision import Decision
+
+
+EVENTS = [
+    {"b": 1, "a": [1.5, None, True], "nested": {"z": "é", "y": " "}},
+    {"reason": "Tab\tand \"quotes\"", "nan": float("inf"), "k": {}},
+]
+
+
+class EncodedRecordingSink(AuditSink):
+    def __init__(self):
+        self.data = []
+
+    def write(self, event):
+        raise AssertionError("write_encoded should be used")
+
+    def write_encoded(self, data, event):
+        self.data.append(data)
+
+
+class LegacySink(AuditSink):
+    def __init__(self):
+        self.events = []
+
+    def write(self, event):
+        self.events.append(event)
+
+
+def _decision():
+    return Decision.allow(reason="ok", policy_section="model", policy_version="0.1")
+
+
+def test_encoding_is_byte_identical_to_json_dumps():
+    for event in EVENTS:
+        expected = (json.dumps(event, sort_keys=True) + "\n").encode("utf-8")
+        assert encode_event(event) == expected
+
+    assert encode_events(EVENTS) == b"".join(encode_event(e) for e in EVENTS)
+
+
+def test_emitter_encodes_once_for_all_sinks(monkeypatch):
+    calls = []
+
+    def counting_encode(payload):
+        calls.append(payload)
+        return encode_event(payload)
+
+    monkeypatch.setattr(emitter_module, "encode_event", counting_encode)
+
+    first, second = EncodedRecordingSink(), EncodedRecordingSink()
+    AuditEventEmitter([first, second]).emit(_decision())
+
+    assert len(calls) == 1
+    assert first.data[0] is second.data[0]
+
+
+def test_sinks_without_write_encoded_still_receive_dicts():
+    sink = LegacySink()
+    event = AuditEventEmitter([sink]).emit(_decision())
+
+    assert sink.events == [event.to_dict()]
+
+
+def test_file_sink_output_unchanged(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    emitter = AuditEventEmitter([JsonFileSink(str(path))])
+
+    event = emitter.emit(_decision())
+    batch = emitter.emit_batch([(_decision(), {"n": 1}), (_decision(), {"n": 2})])
+
+    expected = "".join(
+        json.dumps(e.to_dict(), sort_keys=True) + "\n" for e in [event, *batch]
+    )
+    assert path.read_text(encoding="utf-8") == expected
+
+
+def test_stdout_sink_output_unchanged(capsys):
+    event = AuditEventEmitter([StdoutSink()]).emit(_decision())
+
+    assert capsys.readouterr().out == json.dumps(event.to_dict(), sort_keys=True) + "\n"
+
+
+def test_unencodable_event_keeps_sink_failure_semantics(tmp_path):
+    decision = Decision.allow(
+        reason="ok",
+        policy_section="model",
+        policy_version="0.1",
+        metadata={"bad": object()},
+    )
+
+    lenient = JsonFileSink(str(tmp_path / "a.jsonl"), fail_fast=False)
+    AuditEventEmitter([lenient]).emit(decision)
+
+    strict = JsonFileSink(str(tmp_path / "b.jsonl"))
+    with pytest.raises(AuditSinkError):
+        AuditEventEmitter([strict]).emit(decision)
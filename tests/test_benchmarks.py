@@ -0,0 +1,101 @@
+import json
+
+from benchmarks.corpus import Corpus
+from benchmarks.harness import BenchmarkResult, compare, percentile
+from benchmarks.runner import main, run_benchmarks
+from benchmarks.startup import (
+    STARTUP_BUDGETS,
+    StartupBudget,
+    StartupResult,
+    check_budget,
+    measure_startup,
+    parse_importtime,
+)
+
+
+def _result(name, p50, **params):
+    return BenchmarkResult(name=name, params=params, p50_ns=p50, p99_ns=p50)
+
+
+def test_corpus_is_reproducible():
+    assert Corpus(1).text(4096) == Corpus(1).text(4096)
+    assert Corpus(1).text(4096) != Corpus(2).text(4096)
+    assert len(Corpus(1).text(1000)) == 1000
+    assert Corpus(1).requests(5) == Corpus(1).requests(5)
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+
+    assert percentile(values, 0.50) == 50
+    assert percentile(values, 0.99) == 99
+    assert percentile([7], 0.99) == 7
+
+
+def test_compare_flags_regressions_over_threshold():
+    baseline = [_result("a", 100), _result("b", 100, n=1), _result("gone", 5)]
+    current = [_result("a", 109), _result("b", 125, n=1), _result("new", 5)]
+
+    comparisons, regressions = compare(baseline, current, threshold=0.10)
+
+    assert [c.key for c in regressions] == ["b[n=1]"]
+    assert {c.key for c in comparisons} == {"a", "b[n=1]", "gone", "new"}
+
+
+def test_quick_run_produces_results():
+    results = run_benchmarks(pattern=r"^stage\.region", min_time=0.001, samples=3)
+
+    (result,) = results
+    assert result.key == "stage.region"
+    assert 0 < result.p50_ns <= result.p99_ns
+    assert result.ops_per_sec > 0
+
+
+def test_compare_command_exit_status(tmp_path):
+    def write(name, p50):
+        path = tmp_path / name
+        path.write_text(
+            json.dumps({"results": [_result("a", p50).to_dict()]}),
+            encoding="utf-8",
+        )
+        return str(path)
+
+    baseline = write("baseline.json", 100)
+
+    assert main(["compare", baseline, write("same.json", 101)]) == 0
+    assert main(["compare", baseline, write("slow.json", 150)]) == 1
+
+
+def test_parse_importtime():
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   yaml.reader\n"
+        "import time:       300 |        420 | yaml\n"
+    )
+
+    assert parse_importtime(output) == {"yaml.reader": 120, "yaml": 420}
+
+
+def test_check_budget_flags_time_and_forbidden_imports():
+    budget = StartupBudget("cli.main", max_ms=10, forbidden=("yaml",))
+    result = StartupResult(
+        module="cli.main",
+        min_us=12_000,
+        median_us=13_000,
+        modules=frozenset({"cli.main", "yaml.reader", "yamlish"}),
+    )
+
+    assert check_budget(result, budget) == [
+        "cli.main: imports in 12.0ms, budget 10.0ms",
+        "cli.main: imports yaml.reader",
+    ]
+    assert check_budget(result, budget, scale=2.0) == ["cli.main: imports yaml.reader"]
+
+
+def test_cli_modules_import_nothing_forbidden():
+    for budget in STARTUP_BUDGETS:
+        result = measure_startup(budget.module, repeat=1)
+
+        # Time budgets are for `python -m benchmarks startup`; here only
+        # the import graph is checked.
+        assert check_budget(result, budget, scale=float("inf")) == []
@@ -0,0 +1,182 @@
+import json
+import subprocess
+from argparse import Namespace
+
+import pytest
+
+from cli.enforce_batch import run_enforce_batch
+
+
+POLICY = """\
+version: "0.1"
+model:
+  allow: [gpt-4.1]
+data:
+  regions:
+    allowed: [EU]
+  pii:
+    action: redact
+"""
+
+ALLOW = {"model": "gpt-4.1", "region": "EU", "text": "hello"}
+MODIFY = {"model": "gpt-4.1", "region": "EU", "text": "mail test@example.com"}
+BLOCK = {"model": "gpt-4.1", "region": "US"}
+
+
+@pytest.fixture
+def policy(tmp_path):
+    path = tmp_path / "policy.yaml"
+    path.write_text(POLICY)
+    return path
+
+
+def _write_requests(path, requests):
+    path.write_text("".join(json.dumps(r) + "\n" for r in requests))
+    return path
+
+
+def _run(policy, input_path, output_path, **overrides):
+    args = Namespace(
+        policy=str(policy),
+        input=str(input_path),
+        output=str(output_path),
+        workers=1,
+        chunk_size=None,
+        window=None,
+        audit_log=str(output_path.parent / "audit.jsonl"),
+        verbose=False,
+    )
+    for key, value in overrides.items():
+        setattr(args, key, value)
+    return run_enforce_batch(args)
+
+
+def _results(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@pytest.mark.parametrize(
+    "requests, expected",
+    [
+        ([ALLOW, ALLOW], 0),
+        ([ALLOW, MODIFY], 10),
+        ([MODIFY, BLOCK, ALLOW], 20),
+        ([], 0),
+    ],
+)
+def test_aggregate_exit_code(tmp_path, policy, requests, expected):
+    inp = _write_requests(tmp_path / "in.jsonl", requests)
+
+    assert _run(policy, inp, tmp_path / "out.jsonl") == expected
+
+
+def test_results_are_in_input_order_and_match_enforce_output(tmp_path, policy):
+    requests = [ALLOW, BLOCK, MODIFY] * 5
+    inp = _write_requests(tmp_path / "in.jsonl", requests)
+    out = tmp_path / "out.jsonl"
+
+    _run(policy, inp, out, chunk_size=2)
+
+    results = _results(out)
+    assert [r["final_decision"] for r in results] == [
+        "ALLOW", "BLOCK", "MODIFY"
+    ] * 5
+    assert set(results[0]) == {"final_decision", "reason", "policy_section"}
+
+
+def test_process_pool_matches_in_process_run(tmp_path, policy):
+    requests = [ALLOW, BLOCK, MODIFY, {"model": "gpt-4.1", "region": "EU"}] * 10
+    inp = _write_requests(tmp_path / "in.jsonl", requests)
+
+    serial = tmp_path / "serial.jsonl"
+    parallel = tmp_path / "parallel.jsonl"
+
+    assert _run(policy, inp, serial) == 20
+    assert _run(policy, inp, parallel, workers=2, chunk_size=3, window=2) == 20
+
+    assert serial.read_text() == parallel.read_text()
+
+
+def test_audit_events_go_to_audit_log(tmp_path, policy):
+    inp = _write_requests(tmp_path / "in.jsonl", [ALLOW, BLOCK])
+    out = tmp_path / "out.jsonl"
+
+    _run(policy, inp, out)
+
+    audit = (tmp_path / "audit.jsonl").read_text().splitlines()
+    assert audit
+    assert all("decision" in json.loads(line) for line in audit)
+    assert len(_results(out)) == 2
+
+
+def test_process_pool_audit_events_are_in_input_order(tmp_path, policy):
+    requests = [
+        {**request, "context": {"n": n}}
+        for n, request in enumerate([ALLOW, BLOCK, MODIFY] * 10)
+    ]
+    inp = _write_requests(tmp_path / "in.jsonl", requests)
+
+    _run(policy, inp, tmp_path / "out.jsonl", workers=2, chunk_size=1, window=4)
+
+    audit = [
+        json.loads(line)
+        for line in (tmp_path / "audit.jsonl").read_text().splitlines()
+    ]
+    order = [event["context"]["n"] for event in audit]
+    assert order == sorted(order)
+    assert set(order) == set(range(len(requests)))
+
+
+def test_blank_lines_are_skipped(tmp_path, policy):
+    inp = tmp_path / "in.jsonl"
+    inp.write_text(json.dumps(ALLOW) + "\n\n" + json.dumps(BLOCK) + "\n")
+    out = tmp_path / "out.jsonl"
+
+    assert _run(policy, inp, out) == 20
+    assert len(_results(out)) == 2
+
+
+def test_invalid_request_fails_fast(tmp_path, policy, capsys):
+    inp = tmp_path / "in.jsonl"
+    inp.write_text(json.dumps(ALLOW) + "\n" + '{"region": "EU"}\n')
+
+    assert _run(policy, inp, tmp_path / "out.jsonl", chunk_size=1) == 3
+    assert "line 2" in capsys.readouterr().err
+
+
+def test_invalid_policy_returns_3(tmp_path, capsys):
+    policy = tmp_path / "policy.yaml"
+    policy.write_text("version: 0.1\nunknown_section: {}\n")
+    inp = _write_requests(tmp_path / "in.jsonl", [ALLOW])
+
+    assert _run(policy, inp, tmp_path / "out.jsonl", workers=2) == 3
+    assert "Enforcement failed" in capsys.readouterr().err
+
+
+def test_missing_input_returns_3(tmp_path, policy, capsys):
+    assert _run(policy, tmp_path / "missing.jsonl", tmp_path / "out.jsonl") == 3
+    assert capsys.readouterr().err.startswith("Enforcement failed:")
+
+
+def test_missing_policy_returns_2(tmp_path):
+    inp = _write_requests(tmp_path / "in.jsonl", [ALLOW])
+
+    assert _run(tmp_path / "missing.yaml", inp, tmp_path / "out.jsonl") == 2
+
+
+def test_cli_reads_stdin_and_prints_summary(policy):
+    stdin = "".join(json.dumps(r) + "\n" for r in [ALLOW, MODIFY])
+
+    result = subprocess.run(
+        ["ai-governor", "enforce-batch", "--policy", str(policy), "--workers", "2"],
+        input=stdin,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 10
+    assert [json.loads(line)["final_decision"] for line in result.stdout.splitlines()] == [
+        "ALLOW",
+        "MODIFY",
+    ]
+    assert "2 requests: 1 allow, 1 modify, 0 block" in result.stderr
@@ -0,0 +1,240 @@
+import io
+import json
+import os
+import socket
+import stat
+import threading
+from argparse import Namespace
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cli.client import request, run_remote
+from cli.enforce import run_enforce
+from cli.serve import GovernorServer
+from cli.validate import run_validate
+
+
+POLICY = """\
+version: "0.1"
+model:
+  allow: [gpt-4.1]
+data:
+  regions:
+    allowed: [EU]
+  pii:
+    action: redact
+"""
+
+
+@pytest.fixture
+def policy(tmp_path):
+    path = tmp_path / "policy.yaml"
+    path.write_text(POLICY)
+    return path
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = GovernorServer(str(tmp_path / "gov.sock"))
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def _enforce_args(policy, **overrides):
+    args = {
+        "policy": str(policy),
+        "model": "gpt-4.1",
+        "max_tokens": None,
+        "region": "EU",
+        "text": "hello",
+        "context": None,
+        "output_text": None,
+        "verbose": False,
+    }
+    args.update(overrides)
+    return args
+
+
+def _local(run, args):
+    out, err = io.StringIO(), io.StringIO()
+    code = run(Namespace(**args), stdout=out, stderr=err)
+    return {"stdout": out.getvalue(), "stderr": err.getvalue(), "exit_code": code}
+
+
+def _without_timestamps(output):
+    lines = []
+    for line in output.splitlines():
+        try:
+            event = json.loads(line)
+        except ValueError:
+            lines.append(line)
+            continue
+        if isinstance(event, dict):
+            event.pop("timestamp", None)
+        lines.append(event)
+    return lines
+
+
+@pytest.mark.parametrize(
+    "overrides, expected_code",
+    [
+        ({}, 0),
+        ({"text": "mail test@example.com"}, 10),
+        ({"region": "US"}, 20),
+        ({"region": "US", "verbose": True}, 20),
+    ],
+)
+def test_enforce_matches_cli(server, policy, overrides, expected_code):
+    args = _enforce_args(policy, **overrides)
+
+    remote = request(server.socket_path, "enforce", args)
+    local = _local(run_enforce, args)
+
+    assert remote["exit_code"] == local["exit_code"] == expected_code
+    assert remote["stderr"] == local["stderr"]
+    assert _without_timestamps(remote["stdout"]) == _without_timestamps(
+        local["stdout"]
+    )
+
+
+@pytest.mark.parametrize("as_json", [False, True])
+def test_validate_matches_cli(server, policy, as_json):
+    args = {"policy": str(policy), "json": as_json, "strict": False}
+
+    assert request(server.socket_path, "validate", args) == _local(run_validate, args)
+
+
+def test_policy_load_failure_returns_2(server, tmp_path):
+    args = _enforce_args(tmp_path / "missing.yaml")
+
+    response = request(server.socket_path, "enforce", args)
+
+    assert response["exit_code"] == 2
+    assert response["stderr"].startswith("Failed to load policy:")
+
+
+def test_invalid_policy_fails_like_cli(server, tmp_path):
+    path = tmp_path / "invalid.yaml"
+    path.write_text("version: 0.1\nunknown_section: {}\n")
+    args = _enforce_args(path)
+
+    remote = request(server.socket_path, "enforce", args)
+
+    assert remote == _local(run_enforce, args)
+    assert remote["exit_code"] == 3
+
+
+def test_policy_changes_are_picked_up(server, policy):
+    args = _enforce_args(policy)
+    assert request(server.socket_path, "enforce", args)["exit_code"] == 0
+
+    policy.write_text(POLICY.replace("[gpt-4.1]", "[gpt-4o]  "))
+
+    assert request(server.socket_path, "enforce", args)["exit_code"] == 20
+
+
+def test_concurrent_clients(server, policy):
+    cases = [
+        (_enforce_args(policy), 0),
+        (_enforce_args(policy, text="mail test@example.com"), 10),
+        (_enforce_args(policy, region="US"), 20),
+    ] * 20
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        codes = list(
+            pool.map(
+                lambda case: request(server.socket_path, "enforce", case[0])[
+                    "exit_code"
+                ],
+                cases,
+            )
+        )
+
+    assert codes == [expected for _, expected in cases]
+
+
+def test_several_requests_per_connection(server, policy):
+    message = json.dumps({"command": "enforce", "args": _enforce_args(policy)})
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(server.socket_path)
+        sock.sendall((message + "\n" + message + "\n").encode())
+        with sock.makefile("rb") as f:
+            responses = [json.loads(f.readline()) for _ in range(2)]
+
+    assert [r["exit_code"] for r in responses] == [0, 0]
+
+
+def test_unknown_command_and_malformed_request(server):
+    assert request(server.socket_path, "explode", {})["exit_code"] == 2
+    assert server.execute_line(b"not json\n")["exit_code"] == 2
+
+
+def test_socket_is_private(server):
+    mode = os.stat(server.socket_path).st_mode
+    assert stat.S_IMODE(mode) == 0o600
+
+
+def test_run_remote_without_server_returns_none(tmp_path, policy):
+    args = Namespace(
+        command="enforce", socket=str(tmp_path / "none.sock"), **_enforce_args(policy)
+    )
+
+    assert run_remote(args) is None
+
+
+@pytest.mark.parametrize("reply", [b"", b'{"stdout": "trunc', b"not json\n"])
+def test_run_remote_does_not_rerun_after_a_failed_exchange(
+    tmp_path, policy, capsys, reply
+):
+    path = str(tmp_path / "drop.sock")
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(path)
+    listener.listen(1)
+
+    def drop():
+        conn, _ = listener.accept()
+        with conn:
+            conn.recv(65536)
+            conn.sendall(reply)
+
+    thread = threading.Thread(target=drop)
+    thread.start()
+    args = Namespace(command="enforce", socket=path, **_enforce_args(policy))
+
+    try:
+        assert run_remote(args) == 2
+    finally:
+        thread.join()
+        listener.close()
+
+    assert capsys.readouterr().err.startswith("Server request failed:")
+
+
+def test_stale_socket_is_replaced(tmp_path):
+    path = str(tmp_path / "stale.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+
+    server = GovernorServer(path)
+    server.server_close()
+
+    assert not os.path.exists(path)
+
+
+def test_refuses_to_replace_other_files(tmp_path):
+    path = tmp_path / "not-a-socket"
+    path.write_text("keep me")
+
+    with pytest.raises(FileExistsError):
+        GovernorServer(str(path))
+
+    assert path.read_text() == "keep me"
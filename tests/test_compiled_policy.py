@@ -0,0 +1,103 @@
+import pytest
+import yaml
+
+from core.decision import DecisionType
+from core.enforcement.orchestrator import EnforcementOrchestrator
+from core.policy.compiled import CompiledPolicy, compile_policy
+
+
+BASE_POLICY = {
+    "version": "0.1",
+    "model": {
+        "allow": ["gpt-4.1"],
+        "deny": ["*-preview"],
+        "max_tokens": 4096,
+    },
+    "data": {
+        "regions": {"allowed": ["IN", "EU"]},
+        "pii": {"action": "redact"},
+    },
+    "tools": {"allow": ["search"]},
+}
+
+
+class CountingValidator:
+    def __init__(self):
+        from core.policy_validator import PolicyValidator
+
+        self.calls = 0
+        self._inner = PolicyValidator()
+
+    def validate(self, policy):
+        self.calls += 1
+        return self._inner.validate(policy)
+
+
+def test_compile_extracts_sections():
+    compiled = compile_policy(BASE_POLICY)
+
+    assert isinstance(compiled, CompiledPolicy)
+    assert compiled.model.deny == ("*-preview",)
+    assert compiled.model.max_tokens == 4096
+    assert compiled.regions.index.lookup("EU") == ("EU", True)
+    assert compiled.tools.allow == frozenset({"search"})
+    assert compiled.pii.action == "redact"
+
+
+def test_compile_is_cached_by_content_hash():
+    reordered = {key: BASE_POLICY[key] for key in reversed(list(BASE_POLICY))}
+
+    first = compile_policy(BASE_POLICY)
+    second = compile_policy(dict(reordered))
+
+    assert first is second
+    assert first.content_hash == second.content_hash
+
+
+def test_compile_rejects_invalid_policy():
+    with pytest.raises(ValueError):
+        compile_policy({"version": "0.1", "data": {"pii": {"action": "delete"}}})
+
+
+def test_compile_from_file_resolves_inheritance(tmp_path):
+    (tmp_path / "base.yaml").write_text(
+        yaml.dump({"version": "0.1", "model": {"deny": ["*-preview"]}})
+    )
+    (tmp_path / "child.yaml").write_text(
+        yaml.dump({"version": "0.1", "extends": "base.yaml"})
+    )
+
+    compiled = compile_policy(tmp_path / "child.yaml")
+
+    assert compiled.model.deny == ("*-preview",)
+    assert "extends" not in compiled.policy
+
+
+def test_enforce_skips_validation_for_compiled_policy():
+    validator = CountingValidator()
+    orchestrator = EnforcementOrchestrator(policy_validator=validator)
+    compiled = compile_policy(BASE_POLICY)
+
+    result = orchestrator.enforce(
+        compiled,
+        requested_model="gpt-4.1",
+        region="EU",
+        tool_name="search",
+        text="Contact me at test@example.com",
+    )
+
+    assert validator.calls == 0
+    assert result["final_decision"].decision == DecisionType.MODIFY
+
+
+def test_compiled_and_raw_policy_decisions_match():
+    orchestrator = EnforcementOrchestrator()
+    compiled = compile_policy(BASE_POLICY)
+
+    for model in ("gpt-4.1", "gpt-4.1-preview", "gpt-3.5"):
+        raw = orchestrator.enforce(BASE_POLICY, requested_model=model, region="IN")
+        fast = orchestrator.enforce(compiled, requested_model=model, region="IN")
+
+        assert [d.to_dict() for d in raw["decisions"]] == [
+            d.to_dict() for d in fast["decisions"]
+        ]
@@ -1,3 +1,8 @@
+import pickle
+from dataclasses import FrozenInstanceError
+
+import pytest
+
 from core.decision import Decision, DecisionType
 
 
@@ -13,3 +18,48 @@ def test_block_decision_serialization():
     assert data["policy_section"] == "test.section"
     assert data["policy_version"] == "0.1"
 
+
+
+def test_metadata_free_decisions_are_shared():
+    first = Decision.allow(reason="No tool invocation requested", policy_section="tools")
+    second = Decision.allow(reason="No tool invocation requested", policy_section="tools")
+
+    assert first is second
+    assert first.to_dict() == {
+        "decision": "ALLOW",
+        "reason": "No tool invocation requested",
+        "policy_section": "tools",
+        "policy_version": "0.1",
+        "metadata": {},
+    }
+    assert first.metadata == {}
+    with pytest.raises(TypeError):
+        first.metadata["key"] = "value"
+
+
+def test_decisions_with_metadata_are_not_shared():
+    first = Decision.block(reason="r", policy_section="s", metadata={"k": 1})
+    second = Decision.block(reason="r", policy_section="s", metadata={"k": 1})
+
+    assert first is not second
+    assert first == second
+    assert first.to_dict()["metadata"] == {"k": 1}
+    assert Decision.block(reason="r", policy_section="s") != first
+
+
+def test_decision_is_frozen_and_slotted():
+    decision = Decision.modify(reason="r", policy_section="s")
+
+    with pytest.raises(FrozenInstanceError):
+        decision.reason = "other"
+    assert not hasattr(decision, "__dict__")
+
+
+def test_decision_pickles():
+    for decision in (
+        Decision.allow(reason="r", policy_section="s"),
+        Decision.modify(reason="r", policy_section="s", metadata={"k": [1]}),
+    ):
+        restored = pickle.loads(pickle.dumps(decision))
+        assert restored == decision
+        assert restored.to_dict() == decision.to_dict()
@@ -0,0 +1,117 @@
+from core.audit.emitter import AuditEventEmitter
+from core.audit.sinks import AuditSink
+from core.decision import DecisionType
+from core.enforcement.cache import DecisionCache
+from core.enforcement.orchestrator import EnforcementOrchestrator
+from core.policy.compiled import compile_policy
+from core.telemetry.instrumentation import Instrumentation
+
+
+POLICY = {
+    "version": "0.1",
+    "model": {"allow": ["gpt-4.1"], "max_tokens": 1024},
+    "data": {"regions": {"allowed": ["EU"]}},
+    "tools": {"allow": ["search"]},
+}
+
+COMPILED = compile_policy(POLICY)
+
+
+class RecordingSink(AuditSink):
+    def __init__(self):
+        self.events = []
+
+    def write(self, event):
+        self.events.append(event)
+
+
+def _orchestrator(cache, sink=None, **kwargs):
+    return EnforcementOrchestrator(
+        audit_emitter=AuditEventEmitter([sink or RecordingSink()]),
+        decision_cache=cache,
+        **kwargs,
+    )
+
+
+def test_cached_results_match_uncached_and_are_audited_per_request():
+    cache = DecisionCache()
+    sink = RecordingSink()
+    cached = _orchestrator(cache, sink)
+    uncached = _orchestrator(None)
+
+    for region in ("EU", "EU", "US", "EU"):
+        result = cached.enforce(
+            COMPILED, requested_model="gpt-4.1", region=region, tool_name="search"
+        )
+        expected = uncached.enforce(
+            POLICY, requested_model="gpt-4.1", region=region, tool_name="search"
+        )
+        assert result == expected
+
+    assert cache.stats() == {"size": 2, "max_size": 1024, "hits": 2, "misses": 2}
+    # 3 decisions per allowed request, 2 per region block
+    assert len(sink.events) == 3 + 3 + 2 + 3
+
+
+def test_policy_change_is_never_served_stale_decisions():
+    cache = DecisionCache()
+    orchestrator = _orchestrator(cache)
+
+    allowed = orchestrator.enforce(
+        compile_policy(POLICY), requested_model="gpt-4.1", region="EU"
+    )
+    changed = {**POLICY, "model": {"allow": ["other"]}}
+    blocked = orchestrator.enforce(
+        compile_policy(changed), requested_model="gpt-4.1", region="EU"
+    )
+
+    assert allowed["final_decision"].decision == DecisionType.ALLOW
+    assert blocked["final_decision"].decision == DecisionType.BLOCK
+    assert cache.hits == 0 and cache.misses == 2
+
+
+def test_lru_eviction():
+    cache = DecisionCache(max_size=2)
+
+    cache.put("a", ())
+    cache.put("b", ())
+    assert cache.get("a") == ()
+    cache.put("c", ())
+
+    assert cache.get("b") is None
+    assert cache.get("a") == () and cache.get("c") == ()
+    assert len(cache) == 2
+
+
+def test_unhashable_keys_are_not_cached():
+    cache = DecisionCache()
+
+    assert cache.get(("model", ["EU"])) is None
+    cache.put(("model", ["EU"]), ())
+
+    assert len(cache) == 0 and cache.misses == 1
+
+
+def test_hits_keep_stage_metrics():
+    instrumentation = Instrumentation()
+    cache = DecisionCache()
+    orchestrator = _orchestrator(cache, instrumentation=instrumentation)
+
+    for _ in range(3):
+        orchestrator.enforce(COMPILED, requested_model="gpt-4.1", region="EU")
+
+    assert cache.hits == 2
+    assert instrumentation.decisions[("model", DecisionType.ALLOW)] == 3
+    assert instrumentation.decisions[("data.regions", DecisionType.ALLOW)] == 3
+    assert instrumentation.stage_durations["tools"].count == 3
+
+
+def test_raw_policy_dicts_bypass_the_cache():
+    cache = DecisionCache()
+    orchestrator = _orchestrator(cache)
+
+    for _ in range(2):
+        result = orchestrator.enforce(POLICY, requested_model="gpt-4.1", region="EU")
+        assert result["final_decision"].decision == DecisionType.ALLOW
+
+    assert cache.stats() == {"size": 0, "max_size": 1024, "hits": 0, "misses": 0}
@@ -0,0 +1,151 @@
+import json
+
+import pytest
+
+from core.audit.emitter import AuditEventEmitter
+from core.audit.sinks import AuditSink, AuditSinkError, JsonFileSink
+from core.decision import DecisionType
+from core.enforcement.orchestrator import EnforcementOrchestrator
+from core.telemetry.instrumentation import Instrumentation
+
+
+POLICY = {
+    "version": "0.1",
+    "model": {"allow": ["gpt-4.1"], "deny": ["*-preview"]},
+    "data": {
+        "regions": {"allowed": ["IN", "EU"]},
+        "pii": {"action": "redact"},
+    },
+}
+
+REQUESTS = [
+    {"requested_model": "gpt-4.1", "region": "EU", "text": "Hello"},
+    {"requested_model": "gpt-4.1-preview", "region": "EU", "text": "Hi"},
+    {"requested_model": "gpt-4.1", "region": "US"},
+    {
+        "requested_model": "gpt-4.1",
+        "region": "EU",
+        "text": "Mail test@example.com",
+        "context": {"request_id": "4"},
+    },
+]
+
+
+class RecordingSink(AuditSink):
+    def __init__(self):
+        self.writes = []
+
+    def write(self, event):
+        self.writes.append([event])
+
+    def write_batch(self, events):
+        self.writes.append(list(events))
+
+
+class FailingSink(AuditSink):
+    def write(self, event):
+        raise AuditSinkError("down")
+
+
+def _summary(result):
+    return (
+        result["final_decision"].to_dict(),
+        [d.to_dict() for d in result["decisions"]],
+        result["output_text"],
+    )
+
+
+def test_batch_matches_per_request_enforce():
+    sink = RecordingSink()
+    orchestrator = EnforcementOrchestrator(audit_emitter=AuditEventEmitter([sink]))
+
+    batch = orchestrator.enforce_batch(POLICY, REQUESTS)
+    single = [orchestrator.enforce(POLICY, **request) for request in REQUESTS]
+
+    assert [_summary(r) for r in batch] == [_summary(r) for r in single]
+    assert batch[1]["final_decision"].decision == DecisionType.BLOCK
+    assert batch[3]["output_text"] == "Mail [REDACTED_EMAIL]"
+
+
+def test_batch_audit_is_one_group_write_in_order():
+    sink = RecordingSink()
+    orchestrator = EnforcementOrchestrator(audit_emitter=AuditEventEmitter([sink]))
+
+    results = orchestrator.enforce_batch(POLICY, REQUESTS)
+
+    assert len(sink.writes) == 1
+    expected = [d.policy_section for r in results for d in r["decisions"]]
+    assert [e["policy_section"] for e in sink.writes[0]] == expected
+    assert sink.writes[0][-1]["context"] == {"request_id": "4"}
+
+
+def test_batch_file_sink_writes_all_events(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    orchestrator = EnforcementOrchestrator(
+        audit_emitter=AuditEventEmitter([JsonFileSink(str(path))])
+    )
+
+    results = orchestrator.enforce_batch(POLICY, REQUESTS)
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == sum(len(r["decisions"]) for r in results)
+    assert all(json.loads(line)["event_type"] for line in lines)
+
+
+def test_batch_sink_failure_fails_batch():
+    orchestrator = EnforcementOrchestrator(
+        audit_emitter=AuditEventEmitter([FailingSink()])
+    )
+
+    with pytest.raises(AuditSinkError):
+        orchestrator.enforce_batch(POLICY, REQUESTS)
+
+
+def test_batch_rejects_unknown_keys():
+    orchestrator = EnforcementOrchestrator()
+
+    with pytest.raises(ValueError):
+        orchestrator.enforce_batch(POLICY, [{"requested_model": "gpt-4.1", "foo": 1}])
+
+
+def test_batch_stage_metrics_match_per_request_enforce():
+    batched = Instrumentation()
+    single = Instrumentation()
+    requests = REQUESTS + REQUESTS
+
+    EnforcementOrchestrator(
+        audit_emitter=AuditEventEmitter([RecordingSink()]),
+        instrumentation=batched,
+    ).enforce_batch(POLICY, requests)
+
+    orchestrator = EnforcementOrchestrator(
+        audit_emitter=AuditEventEmitter([RecordingSink()]),
+        instrumentation=single,
+    )
+    for request in requests:
+        orchestrator.enforce(POLICY, **request)
+
+    assert batched.decisions == single.decisions
+    for stage in ("model", "region", "tools"):
+        assert (
+            batched.stage_durations[stage].count
+            == single.stage_durations[stage].count
+        )
+
+
+def test_batch_failure_still_audits_earlier_requests():
+    sink = RecordingSink()
+    orchestrator = EnforcementOrchestrator(audit_emitter=AuditEventEmitter([sink]))
+
+    with pytest.raises(ValueError):
+        orchestrator.enforce_batch(
+            POLICY,
+            [REQUESTS[0], {"requested_model": "gpt-4.1", "foo": 1}],
+        )
+
+    assert [e["policy_section"] for e in sink.writes[0]] == [
+        "model",
+        "data.regions",
+        "tools",
+        "data.pii",
+    ]
@@ -0,0 +1,84 @@
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from core.audit.sinks import AuditSinkError, GroupCommitJsonFileSink
+
+
+def test_group_commit_writes_json_lines(tmp_path):
+    path = tmp_path / "audit.jsonl"
+
+    with GroupCommitJsonFileSink(str(path)) as sink:
+        sink.write({"event": "a"})
+        sink.write_batch([{"event": "b"}, {"event": "c"}])
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["event"] for line in lines] == ["a", "b", "c"]
+
+
+def test_concurrent_writes_share_fsyncs(tmp_path, monkeypatch):
+    path = tmp_path / "audit.jsonl"
+    fsyncs = []
+    real_fsync = os.fsync
+
+    def slow_fsync(fd):
+        fsyncs.append(fd)
+        time.sleep(0.01)
+        real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", slow_fsync)
+    sink = GroupCommitJsonFileSink(str(path), fsync=True)
+
+    def worker(n):
+        for i in range(10):
+            sink.write({"worker": n, "seq": i})
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    sink.close()
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(lines) == 80
+    assert len(fsyncs) < 80
+    for n in range(8):
+        assert [e["seq"] for e in lines if e["worker"] == n] == list(range(10))
+
+
+def test_group_size_is_bounded(tmp_path, monkeypatch):
+    path = tmp_path / "audit.jsonl"
+    writes = []
+    real_write = os.write
+
+    def recording_write(fd, data):
+        writes.append(bytes(data).count(b"\n"))
+        return real_write(fd, data)
+
+    monkeypatch.setattr(os, "write", recording_write)
+    sink = GroupCommitJsonFileSink(str(path), fsync=False, max_batch_size=2)
+
+    sink.write_batch([{"n": 1}, {"n": 2}])
+    sink.write({"n": 3})
+    sink.close()
+
+    assert max(writes) <= 2
+
+
+def test_group_commit_fail_fast():
+    sink = GroupCommitJsonFileSink("/invalid/path/audit.jsonl")
+
+    with pytest.raises(AuditSinkError):
+        sink.write({"event": "test"})
+
+
+def test_write_after_close_fails(tmp_path):
+    sink = GroupCommitJsonFileSink(str(tmp_path / "audit.jsonl"))
+    sink.close()
+
+    with pytest.raises(AuditSinkError):
+        sink.write({"event": "late"})
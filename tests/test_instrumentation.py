@@ -0,0 +1,178 @@
+import asyncio
+
+import pytest
+
+from core.audit.async_sinks import AsyncAuditSink
+from core.audit.emitter import AsyncAuditEventEmitter, AuditEventEmitter
+from core.audit.sinks import AuditSink, AuditSinkError
+from core.decision import DecisionType
+from core.enforcement.async_orchestrator import AsyncEnforcementOrchestrator
+from core.enforcement.orchestrator import EnforcementOrchestrator
+from core.telemetry.exporters import InMemorySpanExporter, prometheus_text
+from core.telemetry.instrumentation import Histogram, Instrumentation
+
+
+POLICY = {
+    "version": "0.1",
+    "model": {"allow": ["gpt-4.1"]},
+    "data": {
+        "regions": {"allowed": ["EU"]},
+        "pii": {"action": "redact"},
+    },
+}
+
+
+class NullSink(AuditSink):
+    def write(self, event):
+        pass
+
+
+class FailingSink(AuditSink):
+    def write(self, event):
+        raise AuditSinkError("down")
+
+
+class AsyncNullSink(AsyncAuditSink):
+    async def write(self, event):
+        pass
+
+
+def _orchestrator(instrumentation, sink=None, **kwargs):
+    return EnforcementOrchestrator(
+        audit_emitter=AuditEventEmitter(
+            [sink or NullSink()],
+            instrumentation=instrumentation,
+        ),
+        instrumentation=instrumentation,
+        **kwargs,
+    )
+
+
+def test_stages_and_decisions_are_recorded():
+    instrumentation = Instrumentation()
+
+    _orchestrator(instrumentation).enforce(
+        POLICY,
+        requested_model="gpt-4.1",
+        region="EU",
+        text="Mail test@example.com",
+    )
+
+    assert set(instrumentation.stage_durations) == {
+        "validate",
+        "model",
+        "region",
+        "tools",
+        "pii_scan",
+        "pii",
+        "redaction",
+        "audit",
+    }
+    assert instrumentation.stage_durations["audit"].count == 4
+    assert instrumentation.decisions[("data.pii", DecisionType.MODIFY)] == 1
+    assert instrumentation.decisions[("model", DecisionType.ALLOW)] == 1
+    assert instrumentation.enforcements == {"MODIFY": 1}
+    assert instrumentation.sink_durations["NullSink"].count == 4
+
+
+def test_block_stops_recording_at_blocking_stage():
+    instrumentation = Instrumentation()
+
+    _orchestrator(instrumentation).enforce(POLICY, requested_model="gpt-4.1", region="US")
+
+    assert "tools" not in instrumentation.stage_durations
+    assert instrumentation.decisions[("data.regions", DecisionType.BLOCK)] == 1
+    assert instrumentation.enforcements == {"BLOCK": 1}
+
+
+def test_sink_failure_is_recorded_as_error():
+    instrumentation = Instrumentation()
+
+    with pytest.raises(AuditSinkError):
+        _orchestrator(instrumentation, FailingSink()).enforce(
+            POLICY, requested_model="gpt-4.1"
+        )
+
+    assert instrumentation.enforcements == {"ERROR": 1}
+    assert instrumentation.sink_errors == {"FailingSink": 1}
+
+
+def test_spans_are_exported_as_one_trace():
+    exporter = InMemorySpanExporter()
+    instrumentation = Instrumentation(span_exporter=exporter)
+
+    _orchestrator(instrumentation, audit_mode="aggregate").enforce(
+        POLICY, requested_model="gpt-4.1", region="EU", text="Hi"
+    )
+
+    root, *children = exporter.spans
+    assert root["name"] == "ai_governor.enforce"
+    assert root["attributes"] == {"ai_governor.decision": "ALLOW"}
+    assert {span["trace_id"] for span in exporter.spans} == {root["trace_id"]}
+    assert all(span["parent_span_id"] == root["span_id"] for span in children)
+    assert [span["name"] for span in children][-1] == "ai_governor.stage.audit"
+
+    for span in exporter.spans:
+        assert span["start_time_unix_nano"] <= span["end_time_unix_nano"]
+
+
+def test_prometheus_text_export():
+    instrumentation = Instrumentation()
+    _orchestrator(instrumentation).enforce(POLICY, requested_model="gpt-4.1", region="EU")
+
+    text = prometheus_text(instrumentation)
+
+    assert "# TYPE ai_governor_stage_duration_seconds histogram" in text
+    assert 'ai_governor_stage_duration_seconds_bucket{stage="model",le="+Inf"} 1' in text
+    assert (
+        'ai_governor_decisions_total{policy_section="model",decision="ALLOW"} 1'
+        in text
+    )
+    assert 'ai_governor_enforcements_total{decision="ALLOW"} 1' in text
+    assert text.endswith("\n")
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram(buckets=(0.001, 0.01))
+    for seconds in (0.0005, 0.001, 0.005, 1.0):
+        histogram.observe(seconds)
+
+    assert histogram.cumulative() == [(0.001, 2), (0.01, 3), (float("inf"), 4)]
+    assert histogram.count == 4
+
+
+def test_batch_records_every_request():
+    instrumentation = Instrumentation()
+
+    _orchestrator(instrumentation).enforce_batch(
+        POLICY,
+        [{"requested_model": "gpt-4.1", "region": "EU"}] * 3,
+    )
+
+    assert sum(instrumentation.enforcements.values()) == 3
+    assert instrumentation.decisions[("model", DecisionType.ALLOW)] == 3
+
+
+def test_disabled_instrumentation_is_inert():
+    orchestrator = EnforcementOrchestrator(audit_emitter=AuditEventEmitter([NullSink()]))
+
+    assert orchestrator.instrumentation is None
+    assert orchestrator._trace() is None
+    orchestrator.enforce(POLICY, requested_model="gpt-4.1")
+
+
+def test_async_orchestrator_is_instrumented():
+    instrumentation = Instrumentation()
+    orchestrator = AsyncEnforcementOrchestrator(
+        audit_emitter=AsyncAuditEventEmitter(
+            [AsyncNullSink()],
+            instrumentation=instrumentation,
+        ),
+        instrumentation=instrumentation,
+    )
+
+    asyncio.run(orchestrator.enforce(POLICY, requested_model="gpt-4.1", region="EU"))
+
+    assert instrumentation.enforcements == {"ALLOW": 1}
+    assert instrumentation.stage_durations["audit"].count == 3
+    assert instrumentation.sink_durations["AsyncNullSink"].count == 3
@@ -0,0 +1,204 @@
+import random
+import re
+
+from core.decision import DecisionType
+from core.enforcement.keywords import compile_keyword_rules, enforce_keyword_policy
+from core.enforcement.orchestrator import EnforcementOrchestrator
+from core.keywords.automaton import KeywordAutomaton
+from core.policy_validator import PolicyValidator
+from core.telemetry.instrumentation import Instrumentation
+
+
+def _policy(action="redact", terms=("project falcon", "acme"), **options):
+    return {
+        "version": "0.1",
+        "model": {"allow": ["gpt-4.1"]},
+        "data": {
+            "pii": {"action": "redact"},
+            "keywords": {"terms": list(terms), "action": action, **options},
+        },
+    }
+
+
+def _matches(automaton, text):
+    return [text[span.start:span.end] for span in automaton.find(text)]
+
+
+# ----------------------------------------------------------------------
+# Automaton
+# ----------------------------------------------------------------------
+
+def test_automaton_matches_case_insensitively_on_word_boundaries():
+    automaton = KeywordAutomaton(["acme", "Project Falcon"])
+
+    assert _matches(automaton, "PROJECT FALCON for Acme, not acmecorp") == [
+        "PROJECT FALCON",
+        "Acme",
+    ]
+
+
+def test_automaton_options():
+    exact = KeywordAutomaton(["acme"], ignore_case=False)
+    assert _matches(exact, "Acme acme") == ["acme"]
+
+    substring = KeywordAutomaton(["acme"], whole_word=False)
+    assert _matches(substring, "acmecorp") == ["acme"]
+
+
+def test_automaton_prefers_leftmost_longest_match():
+    automaton = KeywordAutomaton(["new", "new york", "york city"], whole_word=False)
+
+    assert _matches(automaton, "new york city") == ["new york"]
+
+
+def test_automaton_agrees_with_regex_reference():
+    rng = random.Random(7)
+
+    for _ in range(300):
+        terms = {
+            "".join(rng.choice("abc ") for _ in range(rng.randint(1, 4))).strip() or "a"
+            for _ in range(rng.randint(1, 6))
+        }
+        text = "".join(rng.choice("abcAB _") for _ in range(rng.randint(0, 40)))
+        alternation = "|".join(
+            re.escape(term) for term in sorted(terms, key=len, reverse=True)
+        )
+        reference = re.compile(rf"(?<!\w)(?:{alternation})(?!\w)", re.IGNORECASE)
+
+        # Leftmost-longest, non-overlapping
+        expected = []
+        position = 0
+        while True:
+            candidates = [
+                m for m in (reference.match(text, i) for i in range(position, len(text) + 1))
+                if m and m.end() > m.start()
+            ]
+            if not candidates:
+                break
+            match = candidates[0]
+            expected.append((match.start(), match.end()))
+            position = match.end()
+
+        found = KeywordAutomaton(terms).find(text)
+        assert [(span.start, span.end) for span in found] == expected, (terms, text)
+
+
+def test_automaton_scan_does_not_depend_on_term_count():
+    terms = [f"term{i:06d}" for i in range(20_000)] + ["acme"]
+    automaton = KeywordAutomaton(terms)
+
+    assert automaton.term_count == 20_001
+    assert _matches(automaton, "Ask ACME about term000042.") == ["ACME", "term000042"]
+
+
+# ----------------------------------------------------------------------
+# Stage
+# ----------------------------------------------------------------------
+
+def test_identical_term_lists_share_one_automaton():
+    first = compile_keyword_rules(_policy())
+    second = compile_keyword_rules(_policy())
+    exact = compile_keyword_rules(_policy(ignore_case=False))
+
+    assert first.automaton is second.automaton
+    assert exact.automaton is not first.automaton
+
+
+def test_no_keyword_policy_allows():
+    decision = enforce_keyword_policy({"version": "0.1"}, text="acme")
+
+    assert decision.decision == DecisionType.ALLOW
+
+
+def test_keyword_block_and_redact_decisions():
+    blocked = enforce_keyword_policy(_policy("block"), text="Ask Acme")
+    redacted = enforce_keyword_policy(_policy("redact"), text="Ask Acme and ACME")
+    clean = enforce_keyword_policy(_policy("block"), text="Ask someone")
+
+    assert blocked.decision == DecisionType.BLOCK
+    assert redacted.decision == DecisionType.MODIFY
+    assert redacted.metadata == {"keyword_matches": 2}
+    assert clean.decision == DecisionType.ALLOW
+
+
+# ----------------------------------------------------------------------
+# Orchestrator
+# ----------------------------------------------------------------------
+
+def test_keyword_block_short_circuits_before_pii():
+    result = EnforcementOrchestrator().enforce(
+        _policy("block"),
+        requested_model="gpt-4.1",
+        text="Project Falcon, mail a@acme.com",
+    )
+
+    assert result["final_decision"].decision == DecisionType.BLOCK
+    assert result["final_decision"].policy_section == "data.keywords"
+    assert result["decisions"][-1].policy_section == "data.keywords"
+
+
+def test_keyword_and_pii_redaction_share_one_pass():
+    instrumentation = Instrumentation()
+    orchestrator = EnforcementOrchestrator(instrumentation=instrumentation)
+
+    result = orchestrator.enforce(
+        _policy("redact"),
+        requested_model="gpt-4.1",
+        text="Project falcon for ACME, mail a@acme.com",
+    )
+
+    assert result["output_text"] == (
+        "[REDACTED_KEYWORD] for [REDACTED_KEYWORD], mail [REDACTED_EMAIL]"
+    )
+    assert result["final_decision"].decision == DecisionType.MODIFY
+    assert [d.policy_section for d in result["decisions"]][-2:] == [
+        "data.keywords",
+        "data.pii",
+    ]
+    assert result["decisions"][-2].metadata["redacted_entities"] == ["email", "keyword"]
+    assert "keywords" in instrumentation.stage_durations
+
+
+def test_keyword_straddling_pii_is_redacted_entirely():
+    result = EnforcementOrchestrator().enforce(
+        _policy("redact", terms=["com rocks"]),
+        requested_model="gpt-4.1",
+        text="mail a@acme.com rocks hard",
+    )
+
+    assert result["output_text"] == "mail [REDACTED_EMAIL] hard"
+    assert result["decisions"][-1].metadata["redacted_entities"] == [
+        "email",
+        "keyword",
+    ]
+
+
+def test_keyword_redaction_without_pii():
+    result = EnforcementOrchestrator().enforce(
+        _policy("redact"),
+        requested_model="gpt-4.1",
+        text="Status of project falcon?",
+    )
+
+    assert result["output_text"] == "Status of [REDACTED_KEYWORD]?"
+    assert result["final_decision"].policy_section == "data.keywords"
+
+
+# ----------------------------------------------------------------------
+# Validation
+# ----------------------------------------------------------------------
+
+def test_validator_rejects_malformed_keyword_policy():
+    validator = PolicyValidator()
+
+    result = validator.validate(
+        _policy("mask", terms=["ok", ""], ignore_case="yes")
+    )
+
+    assert not result.valid
+    assert result.errors == [
+        "data.keywords.terms must be a list of non-empty strings",
+        "data.keywords.action must be one of: block, redact",
+        "data.keywords.ignore_case must be a boolean",
+    ]
+    assert validator.validate(_policy()).valid
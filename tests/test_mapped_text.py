@@ -0,0 +1,178 @@
+import io
+import random
+import tracemalloc
+from argparse import Namespace
+
+import pytest
+
+from cli.enforce import run_enforce
+from core.decision import DecisionType
+from core.enforcement.orchestrator import EnforcementOrchestrator
+from core.pii.scanner import scan_pii
+from core.redaction.engine import RedactionEngine
+from core.redaction.mapped import MappedText
+
+
+PIECES = [
+    "hello", " ", "a.b@example.com", "9876543210", "4111111111111111",
+    "12345", "@", ".", "-", "x", "\n", "ü", "é1234567890", "1234567890@mail.io",
+    "a@b.c", "٣" * 10, "€ ", "3" * 20,
+]
+
+POLICY = {
+    "version": "0.1",
+    "model": {"allow": ["gpt-4.1"]},
+    "data": {"pii": {"action": "redact"}},
+}
+
+
+def _write(tmp_path, text, name="input.txt"):
+    path = tmp_path / name
+    path.write_bytes(text.encode("utf-8"))
+    return path
+
+
+def test_mapped_scan_and_redaction_match_in_memory(tmp_path):
+    rng = random.Random(4)
+    engine = RedactionEngine()
+
+    for i in range(150):
+        text = "".join(rng.choice(PIECES) for _ in range(rng.randint(0, 40)))
+        path = _write(tmp_path, text, f"{i}.txt")
+        data = text.encode("utf-8")
+        expected = scan_pii(text)
+
+        with MappedText(str(path), window=rng.randint(1, 32)) as mapped:
+            assert [
+                (span.entity, data[span.start:span.end].decode("utf-8"))
+                for span in mapped._spans()
+            ] == [(span.entity, text[span.start:span.end]) for span in expected]
+
+            found = mapped.scan_pii()
+            assert sorted(span.entity for span in found) == sorted(
+                {span.entity for span in expected}
+            )
+
+            mapped.redact(found)
+            out = io.BytesIO()
+            mapped.write(out)
+
+        assert out.getvalue() == engine.redact(text).text.encode("utf-8"), text
+
+
+def test_empty_file(tmp_path):
+    with MappedText(str(_write(tmp_path, ""))) as mapped:
+        assert mapped.scan_pii() == []
+        out = io.BytesIO()
+        mapped.write(out)
+
+    assert out.getvalue() == b""
+
+
+def test_large_file_is_scanned_without_loading_it(tmp_path):
+    line = "log line 12345: mail a@b.com or call 9876543210\n"
+    path = _write(tmp_path, line * 20_000 + "ünïcode\n")
+
+    tracemalloc.start()
+    try:
+        with MappedText(str(path), window=64 * 1024) as mapped:
+            mapped.redact(mapped.scan_pii())
+            with open(tmp_path / "out.txt", "wb") as f:
+                mapped.write(f)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < 1024 * 1024
+    assert (tmp_path / "out.txt").read_text(encoding="utf-8").endswith(
+        "mail [REDACTED_EMAIL] or call [REDACTED_PHONE]\nünïcode\n"
+    )
+
+
+def test_orchestrator_enforces_mapped_text(tmp_path):
+    text = "Mail a@b.com or call 9876543210"
+    orchestrator = EnforcementOrchestrator()
+
+    with MappedText(str(_write(tmp_path, text))) as mapped:
+        result = orchestrator.enforce(POLICY, requested_model="gpt-4.1", text=mapped)
+
+    expected = orchestrator.enforce(POLICY, requested_model="gpt-4.1", text=text)
+
+    assert result["final_decision"] == expected["final_decision"]
+    assert result["final_decision"].decision == DecisionType.MODIFY
+    assert result["output_text"] is None
+    assert mapped.redacted_entities == ["email", "phone"]
+
+
+def test_keyword_rules_need_in_memory_text(tmp_path):
+    policy = {
+        "version": "0.1",
+        "model": {"allow": ["gpt-4.1"]},
+        "data": {"keywords": {"terms": ["acme"], "action": "redact"}},
+    }
+
+    with MappedText(str(_write(tmp_path, "acme"))) as mapped:
+        with pytest.raises(ValueError):
+            EnforcementOrchestrator().enforce(
+                policy, requested_model="gpt-4.1", text=mapped
+            )
+
+
+@pytest.mark.parametrize("keywords", [False, True])
+def test_cli_writes_output_text(tmp_path, keywords):
+    policy = tmp_path / "policy.yaml"
+    policy.write_text(
+        'version: "0.1"\n'
+        "model:\n  allow: [gpt-4.1]\n"
+        "data:\n  pii:\n    action: redact\n"
+        + ("  keywords:\n    terms: [acme]\n    action: redact\n" if keywords else "")
+    )
+    source = _write(tmp_path, "Acme: mail a@b.com, ünïcode stays\n")
+    output = tmp_path / "out.txt"
+
+    code = run_enforce(
+        Namespace(
+            policy=str(policy),
+            model="gpt-4.1",
+            max_tokens=None,
+            region=None,
+            text=f"@{source}",
+            context=None,
+            output_text=str(output),
+            verbose=False,
+        ),
+        stdout=io.StringIO(),
+        stderr=io.StringIO(),
+    )
+
+    assert code == 10
+    assert output.read_text(encoding="utf-8") == (
+        ("[REDACTED_KEYWORD]" if keywords else "Acme")
+        + ": mail [REDACTED_EMAIL], ünïcode stays\n"
+    )
+
+
+@pytest.mark.parametrize("content", ["", "- not\n- a mapping\n"])
+def test_cli_invalid_policy_with_file_text(tmp_path, content):
+    policy = tmp_path / "policy.yaml"
+    policy.write_text(content)
+    source = _write(tmp_path, "mail a@b.com\n")
+    stderr = io.StringIO()
+
+    code = run_enforce(
+        Namespace(
+            policy=str(policy),
+            model="gpt-4.1",
+            max_tokens=None,
+            region=None,
+            text=f"@{source}",
+            context=None,
+            output_text=None,
+            verbose=False,
+        ),
+        stdout=io.StringIO(),
+        stderr=stderr,
+    )
+
+    assert code == 3
+    assert stderr.getvalue().startswith("Enforcement failed: Invalid policy:")
@@ -52,3 +52,58 @@ def test_token_limit_exceeded():
     assert decision.decision == DecisionType.BLOCK
     assert decision.policy_section == "model.max_tokens"
 
+
+
+def test_first_deny_pattern_in_policy_order_is_reported():
+    policy = {
+        "version": "0.1",
+        "model": {"deny": ["gpt-*", "gpt-4.1-preview", "*-preview"]},
+    }
+
+    decision = enforce_model_policy(policy, requested_model="gpt-4.1-preview")
+
+    assert decision.metadata["matched_pattern"] == "gpt-*"
+
+
+def test_literal_deny_before_glob_is_reported():
+    policy = {
+        "version": "0.1",
+        "model": {"deny": ["o1-preview", "*-preview"]},
+    }
+
+    decision = enforce_model_policy(policy, requested_model="o1-preview")
+
+    assert decision.metadata["matched_pattern"] == "o1-preview"
+
+
+def test_pattern_set_matches_fnmatch():
+    import fnmatch
+
+    from core.enforcement.model import PatternSet
+
+    patterns = ["gpt-4.1", "gpt-4?", "claude-[0-9]*", "*-mini", "llama-*-instruct"]
+    names = [
+        "gpt-4.1", "gpt-4o", "gpt-40", "claude-3-opus", "claude-x",
+        "o4-mini", "llama-3-instruct", "llama-3", "", "gpt-4.1\n",
+    ]
+    pattern_set = PatternSet(patterns)
+
+    for name in names:
+        expected = next(
+            (p for p in patterns if fnmatch.fnmatch(name, p)), None
+        )
+        assert pattern_set.first_match(name) == expected
+
+
+def test_model_verdicts_are_cached():
+    from core.enforcement.model import compile_model_rules
+
+    rules = compile_model_rules(BASE_POLICY)
+    rules.matcher.verdict.cache_clear()
+
+    for _ in range(3):
+        enforce_model_policy(BASE_POLICY, requested_model="llama-3")
+
+    info = rules.matcher.verdict.cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
@@ -0,0 +1,84 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from core.decision import DecisionType
+from core.enforcement.orchestrator import EnforcementOrchestrator
+from core.pii.parallel import ParallelScanner, split_points
+from core.pii.scanner import MATCH_CHARS, scan_pii
+
+
+PIECES = [
+    "hello", " ", "a.b@example.com", "9876543210", "4111111111111111",
+    "12345", "@", ".", "-", "_", "x", "\n", "ü", "1234567890@mail.io",
+    "+", "a@b.c", "1" * 11, "3" * 20, "٣" * 10, "foo-bar.baz",
+]
+
+
+def _random_text(rng, pieces=40):
+    return "".join(rng.choice(PIECES) for _ in range(rng.randint(0, pieces)))
+
+
+def test_split_points_cut_after_barriers():
+    rng = random.Random(1)
+
+    for _ in range(200):
+        text = _random_text(rng) or "x"
+        cuts = split_points(text, rng.randint(1, 20))
+
+        assert cuts[0] == 0 and cuts[-1] == len(text)
+        assert all(start < end for start, end in zip(cuts, cuts[1:]))
+        for cut in cuts[1:-1]:
+            barrier = text[cut - 1]
+            assert barrier not in MATCH_CHARS and not barrier.isdecimal()
+
+
+def test_parallel_scan_matches_serial_scan():
+    rng = random.Random(2)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for chunk_size in (1, 5, 17, 64):
+            scanner = ParallelScanner(
+                threshold=0, chunk_size=chunk_size, executor=executor
+            )
+            for _ in range(200):
+                text = _random_text(rng)
+                assert scanner.scan(text) == scan_pii(text), (chunk_size, text)
+
+
+def test_process_pool_scan_matches_serial_scan():
+    text = " ".join(["mail a.b@example.com", "call 9876543210", "ok"] * 2000)
+
+    with ParallelScanner(threshold=0, chunk_size=4096, workers=2) as scanner:
+        assert scanner.scan(text) == scan_pii(text)
+        assert scanner._executor is not None
+
+    assert scanner._executor is None
+
+
+def test_small_texts_stay_serial():
+    scanner = ParallelScanner(threshold=1024, workers=2)
+
+    assert scanner.scan("mail a@b.com") == scan_pii("mail a@b.com")
+    assert scanner._executor is None
+
+
+def test_orchestrator_uses_parallel_scanner():
+    policy = {
+        "version": "0.1",
+        "model": {"allow": ["gpt-4.1"]},
+        "data": {"pii": {"action": "redact"}},
+    }
+    text = "Mail a@b.com or call 9876543210. " * 500
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        parallel = EnforcementOrchestrator(
+            pii_scanner=ParallelScanner(threshold=0, chunk_size=1000, executor=executor)
+        ).enforce(policy, requested_model="gpt-4.1", text=text)
+
+    serial = EnforcementOrchestrator().enforce(
+        policy, requested_model="gpt-4.1", text=text
+    )
+
+    assert parallel["final_decision"].decision == DecisionType.MODIFY
+    assert parallel["output_text"] == serial["output_text"]
+    assert parallel["final_decision"] == serial["final_decision"]
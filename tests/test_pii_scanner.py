@@ -0,0 +1,197 @@
+import random
+import re
+import subprocess
+import sys
+
+from core.pii.scanner import (
+    CREDIT_CARD_REGEX,
+    DETECTORS,
+    EMAIL_REGEX,
+    PHONE_REGEX,
+    PiiSpan,
+    entity_types,
+    scan_pii,
+)
+
+
+PIECES = [
+    "hello", " ", "a.b@example.com", "9876543210", "4111111111111111",
+    "12345", "@", ".", "-", "_", "x", "\n", "ü", "1234567890@mail.io",
+    "+", "a@b.c", "1" * 11, "2" * 12, "3" * 20, "\u0663" * 10,
+]
+
+
+def _sequential_redaction(text):
+    replacements = [
+        (EMAIL_REGEX, "[REDACTED_EMAIL]"),
+        (PHONE_REGEX, "[REDACTED_PHONE]"),
+        (CREDIT_CARD_REGEX, "[REDACTED_CREDIT_CARD]"),
+    ]
+    for pattern, replacement in replacements:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def test_scan_returns_typed_spans_in_order():
+    text = "Call 9876543210 or mail test@example.com, card 4111111111111111"
+
+    spans = scan_pii(text)
+
+    assert [span.entity for span in spans] == ["phone", "email", "credit_card"]
+    assert all(isinstance(span, PiiSpan) for span in spans)
+    assert text[spans[1].start:spans[1].end] == "test@example.com"
+
+
+def test_entity_types_uses_detector_order():
+    spans = scan_pii("4111111111111111 then a@b.com")
+
+    assert entity_types(spans) == ["email", "credit_card"]
+
+
+def test_no_pii():
+    assert scan_pii("Hello world") == []
+
+
+def _reference_scan(text):
+    """
+    Leftmost, detector-ordered scan, except that an email overlapping a
+    digit match wins; the digits before it are matched on their own.
+    """
+    reference = re.compile(
+        "|".join(f"(?P<{entity}>{pattern})" for entity, pattern in DETECTORS)
+    )
+    digits = re.compile(f"{PHONE_REGEX.pattern}|{CREDIT_CARD_REGEX.pattern}")
+    spans = []
+    position = 0
+
+    while True:
+        match = reference.search(text, position)
+        if match is None:
+            return spans
+
+        email = EMAIL_REGEX.search(text, match.start())
+        if match.lastgroup != "email" and email and email.start() < match.end():
+            if digits.fullmatch(text, match.start(), email.start()):
+                length = email.start() - match.start()
+                entity = "phone" if length == 10 else "credit_card"
+                spans.append(PiiSpan(entity, match.start(), email.start()))
+            match = email
+            entity = "email"
+        else:
+            entity = match.lastgroup
+
+        spans.append(PiiSpan(entity, match.start(), match.end()))
+        position = match.end()
+
+
+def test_scan_matches_reference_alternation():
+    rng = random.Random(3)
+
+    for _ in range(2000):
+        text = "".join(rng.choice(PIECES) for _ in range(rng.randint(1, 10)))
+        assert scan_pii(text) == _reference_scan(text), text
+
+
+def test_scan_first_returns_first_span_of_each_entity():
+    from core.pii.scanner import scan_pii_first
+
+    rng = random.Random(5)
+
+    for _ in range(1000):
+        text = "".join(rng.choice(PIECES) for _ in range(rng.randint(0, 10)))
+        spans = scan_pii(text)
+        expected = [
+            span
+            for index, span in enumerate(spans)
+            if span.entity not in {s.entity for s in spans[:index]}
+        ]
+        assert scan_pii_first(text) == expected, text
+
+
+def test_prefilter_never_rejects_text_with_pii():
+    from core.pii.scanner import _may_contain_pii
+
+    reference = re.compile(
+        "|".join(f"(?P<{entity}>{pattern})" for entity, pattern in DETECTORS)
+    )
+    pieces = PIECES + ["1", "22", "0" * 9, "\u0663" * 4]
+    rng = random.Random(11)
+
+    for _ in range(2000):
+        text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 12)))
+        start = rng.randint(0, len(text))
+        if reference.search(text, start):
+            assert _may_contain_pii(text, start), (text, start)
+
+
+def test_prefilter_rejects_clean_text():
+    from core.pii.scanner import _may_contain_pii
+
+    assert not _may_contain_pii("Invoice 2024-123456789 for order 42", 0)
+    assert not _may_contain_pii("x@y.co then 12345", 6)
+    assert _may_contain_pii("ref 1234567890", 0)
+    assert scan_pii("Invoice 2024-123456789 for order 42") == []
+
+
+def test_single_pass_redaction_matches_sequential_substitution():
+    from core.redaction.engine import RedactionEngine
+
+    # Non-ASCII digits are excluded: sequential substitution can create
+    # new word boundaries next to them, which a single pass does not.
+    pieces = [piece for piece in PIECES if piece.isascii()]
+    rng = random.Random(7)
+    engine = RedactionEngine()
+
+    for _ in range(500):
+        text = "".join(rng.choice(pieces) for _ in range(rng.randint(1, 12)))
+        assert engine.redact(text).text == _sequential_redaction(text)
+
+
+def test_non_ascii_digits_do_not_hide_an_email():
+    from core.redaction.engine import RedactionEngine
+
+    text = "+84\u0663796\u0663374@28766625033.4a1564\u0663.1"
+
+    assert RedactionEngine().redact(text).text == (
+        "+84\u0663796\u0663[REDACTED_EMAIL]\u0663.1"
+    )
+
+    # Every email the email detector finds on its own is found
+    pieces = PIECES + ["\u0663", "84\u0663796\u0663374", "\uff11" * 10]
+    rng = random.Random(13)
+
+    for _ in range(2000):
+        text = "".join(rng.choice(pieces) for _ in range(rng.randint(1, 12)))
+        emails = [span for span in scan_pii(text) if span.entity == "email"]
+        assert [(span.start, span.end) for span in emails] == [
+            m.span() for m in EMAIL_REGEX.finditer(text)
+        ], text
+
+
+def test_non_ascii_digit_numbers_are_detected():
+    from core.enforcement.data import detect_pii
+    from core.redaction.engine import RedactionEngine
+
+    arabic_indic = "".join(chr(0x0660 + i) for i in range(10))
+    full_width_card = "".join(chr(0xFF10 + int(d)) for d in "4111111111111111")
+    text = f"call {arabic_indic} or pay with {full_width_card}"
+
+    assert detect_pii(text) == ["phone", "credit_card"]
+    assert RedactionEngine().redact(text).text == (
+        "call [REDACTED_PHONE] or pay with [REDACTED_CREDIT_CARD]"
+    )
+
+
+def test_regexes_are_compiled_on_first_use():
+    code = (
+        "import core.enforcement.orchestrator\n"
+        "import core.pii.scanner as scanner\n"
+        "assert scanner._compile.cache_info().currsize == 0\n"
+        "scanner.scan_pii('a@b.co')\n"
+        "assert scanner._compile.cache_info().currsize == 2\n"
+        "from core.redaction.engine import REDACTION_MAP\n"
+        "from core.enforcement.data import EMAIL_REGEX\n"
+        "assert REDACTION_MAP['email'][0] is EMAIL_REGEX\n"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,156 @@
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+
+import core.policy.loader as loader
+from core.policy.errors import PolicyCycleError
+from core.policy.loader import clear_policy_cache, load_policy
+
+
+def write_policy(tmp: Path, name: str, content: dict):
+    path = tmp / name
+    with open(path, "w") as f:
+        yaml.dump(content, f)
+    return path
+
+
+def touch(path: Path, bump: int = 1):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + bump * 1_000_000_000))
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_policy_cache()
+    yield
+    clear_policy_cache()
+
+
+@pytest.fixture
+def parse_count(monkeypatch):
+    calls = []
+    real = yaml.safe_load
+
+    def counting_load(stream):
+        calls.append(getattr(stream, "name", None))
+        return real(stream)
+
+    monkeypatch.setattr(loader.yaml, "safe_load", counting_load)
+    return calls
+
+
+@pytest.fixture
+def chain(tmp_path):
+    base = write_policy(
+        tmp_path,
+        "base.yaml",
+        {"version": "0.1", "model": {"allow": ["gpt-4.1"]}},
+    )
+    child = write_policy(
+        tmp_path,
+        "child.yaml",
+        {"version": "0.1", "extends": "base.yaml", "data": {"pii": {"action": "block"}}},
+    )
+    return base, child
+
+
+def test_unchanged_files_are_not_reparsed(chain, parse_count):
+    _, child = chain
+
+    first = load_policy(child)
+    second = load_policy(child)
+
+    assert first == second
+    assert len(parse_count) == 2  # child + base, once each
+
+
+def test_shared_base_is_parsed_once(tmp_path, chain, parse_count):
+    _, child = chain
+    other = write_policy(
+        tmp_path,
+        "other.yaml",
+        {"version": "0.1", "extends": "base.yaml"},
+    )
+
+    load_policy(child)
+    load_policy(other)
+
+    assert sorted(Path(name).name for name in parse_count) == [
+        "base.yaml",
+        "child.yaml",
+        "other.yaml",
+    ]
+
+
+def test_callers_receive_independent_copies(chain):
+    _, child = chain
+
+    first = load_policy(child)
+    first["model"]["allow"].append("mutated")
+
+    assert load_policy(child)["model"]["allow"] == ["gpt-4.1"]
+
+
+def test_changed_file_is_reloaded(chain):
+    _, child = chain
+    load_policy(child)
+
+    write_policy(
+        child.parent,
+        "child.yaml",
+        {"version": "0.1", "extends": "base.yaml", "data": {"pii": {"action": "redact"}}},
+    )
+    touch(child)
+
+    assert load_policy(child)["data"]["pii"]["action"] == "redact"
+
+
+def test_base_change_invalidates_dependents(chain):
+    base, child = chain
+    load_policy(child)
+
+    write_policy(
+        base.parent,
+        "base.yaml",
+        {"version": "0.1", "model": {"allow": ["gpt-4.1", "gpt-4o"]}},
+    )
+    touch(base)
+
+    assert load_policy(child)["model"]["allow"] == ["gpt-4.1", "gpt-4o"]
+    assert child.resolve() in loader._cache._entries
+
+
+def test_invalidating_base_drops_dependent_entries(chain):
+    base, child = chain
+    load_policy(child)
+
+    loader._cache.invalidate(base.resolve())
+
+    assert len(loader._cache) == 0
+
+
+def test_cycle_introduced_after_caching_is_detected(chain):
+    base, child = chain
+    load_policy(child)
+
+    write_policy(
+        base.parent,
+        "base.yaml",
+        {"version": "0.1", "extends": "child.yaml"},
+    )
+    touch(base)
+
+    with pytest.raises(PolicyCycleError):
+        load_policy(child)
+
+
+def test_cache_size_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(loader._cache, "max_size", 3)
+
+    for i in range(5):
+        load_policy(write_policy(tmp_path, f"p{i}.yaml", {"version": "0.1"}))
+
+    assert len(loader._cache) == 3
+    assert (tmp_path / "p0.yaml").resolve() not in loader._cache._entries
@@ -0,0 +1,150 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+from core.policy.compiled import CompiledPolicy
+from core.policy.loader import clear_policy_cache
+from core.policy.store import PolicyStore
+
+
+def write_policy(tmp: Path, name: str, content: dict):
+    path = tmp / name
+    with open(path, "w") as f:
+        yaml.dump(content, f)
+
+    # Filesystem timestamps can be coarse; make every rewrite visible.
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_policy_cache()
+
+
+@pytest.fixture
+def files(tmp_path):
+    base = write_policy(
+        tmp_path,
+        "base.yaml",
+        {"version": "0.1", "model": {"allow": ["gpt-4.1"]}},
+    )
+    child = write_policy(
+        tmp_path,
+        "child.yaml",
+        {"version": "0.1", "extends": "base.yaml"},
+    )
+    return base, child
+
+
+def test_get_returns_compiled_policy(files):
+    _, child = files
+    store = PolicyStore({"tenant": child}, watch=False)
+
+    compiled = store.get("tenant")
+
+    assert isinstance(compiled, CompiledPolicy)
+    assert compiled.model.allow == ("gpt-4.1",)
+    assert "tenant" in store
+    assert store.names == ["tenant"]
+
+
+def test_invalid_policy_fails_on_add(tmp_path):
+    bad = write_policy(tmp_path, "bad.yaml", {"version": "0.1", "model": "nope"})
+
+    with pytest.raises(ValueError, match="Invalid policy"):
+        PolicyStore({"bad": bad}, watch=False)
+
+
+def test_refresh_swaps_changed_policy(files):
+    _, child = files
+    store = PolicyStore({"tenant": child}, watch=False)
+    before = store.get("tenant")
+
+    assert store.refresh() == []
+
+    write_policy(
+        child.parent,
+        "child.yaml",
+        {"version": "0.1", "extends": "base.yaml", "model": {"allow": ["gpt-4o"]}},
+    )
+
+    assert store.refresh() == ["tenant"]
+    assert store.get("tenant").model.allow == ("gpt-4o",)
+    # The previous snapshot is untouched
+    assert before.model.allow == ("gpt-4.1",)
+
+
+def test_base_change_reloads_dependents(files):
+    base, child = files
+    store = PolicyStore({"tenant": child}, watch=False)
+
+    write_policy(
+        base.parent,
+        "base.yaml",
+        {"version": "0.1", "model": {"allow": ["gpt-4.2"]}},
+    )
+
+    assert store.refresh() == ["tenant"]
+    assert store.get("tenant").model.allow == ("gpt-4.2",)
+
+
+def test_failed_reload_keeps_previous_version(files):
+    _, child = files
+    errors = []
+    store = PolicyStore(
+        {"tenant": child},
+        watch=False,
+        on_error=lambda name, e: errors.append(name),
+    )
+
+    child.write_text("version: [unclosed\n")
+    st = os.stat(child)
+    os.utime(child, ns=(st.st_atime_ns, st.st_mtime_ns + 2_000_000_000))
+
+    assert store.refresh() == []
+    assert store.get("tenant").model.allow == ("gpt-4.1",)
+    assert "tenant" in store.errors
+    assert errors == ["tenant"]
+
+    # Not retried until the file changes again
+    assert store.refresh() == []
+    assert errors == ["tenant"]
+
+    write_policy(child.parent, "child.yaml", {"version": "0.1", "extends": "base.yaml"})
+
+    store.refresh()
+    assert store.errors == {}
+
+
+def test_remove_stops_serving(files):
+    _, child = files
+    store = PolicyStore({"tenant": child}, watch=False)
+
+    store.remove("tenant")
+
+    with pytest.raises(KeyError):
+        store.get("tenant")
+
+
+def test_background_watcher_picks_up_changes(files):
+    _, child = files
+
+    with PolicyStore({"tenant": child}, poll_interval=0.05) as store:
+        write_policy(
+            child.parent,
+            "child.yaml",
+            {"version": "0.1", "extends": "base.yaml", "model": {"allow": ["gpt-4o"]}},
+        )
+
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if store.get("tenant").model.allow == ("gpt-4o",):
+                break
+            time.sleep(0.01)
+
+        assert store.get("tenant").model.allow == ("gpt-4o",)
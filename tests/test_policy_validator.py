@@ -33,3 +33,17 @@ def test_invalid_pii_action():
     assert result.valid is False
     assert "data.pii.action" in result.errors[0]
 
+
+
+def test_invalid_region_denied():
+    policy = {
+        "version": "0.1",
+        "data": {
+            "regions": {"allowed": ["EU"], "denied": "EU-FR"},
+        },
+    }
+
+    result = PolicyValidator().validate(policy)
+
+    assert result.valid is False
+    assert result.errors == ["data.regions.denied must be a list"]
@@ -29,3 +29,57 @@ def test_no_pii():
     assert result.text == "Hello world"
     assert result.redacted_entities == []
 
+
+
+def test_redaction_reuses_supplied_spans():
+    from core.pii.scanner import scan_pii
+
+    engine = RedactionEngine()
+    text = "Card 4111111111111111, mail a@b.com"
+
+    spans = scan_pii(text)
+    result = engine.redact(text, spans)
+
+    assert result.text == "Card [REDACTED_CREDIT_CARD], mail [REDACTED_EMAIL]"
+    assert result.redacted_entities == ["credit_card", "email"]
+
+
+def test_redaction_reports_offsets_in_both_texts():
+    engine = RedactionEngine()
+    text = "Mail a@b.com or call 9876543210."
+
+    result = engine.redact(text)
+
+    assert [span.entity for span in result.spans] == ["email", "phone"]
+    for span in result.spans:
+        assert text[span.start:span.end] in ("a@b.com", "9876543210")
+        assert result.text[span.redacted_start:span.redacted_end] == (
+            f"[REDACTED_{span.entity.upper()}]"
+        )
+    assert result.text[result.spans[0].redacted_end:result.spans[1].redacted_start] == (
+        text[result.spans[0].end:result.spans[1].start]
+    )
+
+
+def test_overlapping_spans_resolve_deterministically():
+    from core.pii.scanner import PiiSpan
+
+    engine = RedactionEngine()
+    text = "acme 9876543210 tail"
+    spans = [
+        PiiSpan("keyword", 5, 15),
+        PiiSpan("keyword", 0, 4),
+        PiiSpan("phone", 5, 15),
+        PiiSpan("keyword", 10, 20),
+    ]
+
+    result = engine.redact(text, spans)
+
+    # The keyword overlapping the phone is coalesced with it
+    assert result.text == "[REDACTED_KEYWORD] [REDACTED_PHONE]"
+    assert [(span.entity, span.start, span.end) for span in result.spans] == [
+        ("keyword", 0, 4),
+        ("phone", 5, 20),
+    ]
+    assert result.redacted_entities == ["keyword", "phone"]
+    assert engine.redact(text, list(reversed(spans))) == result
@@ -44,3 +44,48 @@ def test_region_allowed():
     )
     assert decision.decision == DecisionType.ALLOW
 
+
+
+HIERARCHY_POLICY = {
+    "version": "0.1",
+    "data": {
+        "regions": {
+            "allowed": ["IN", "EU", "EU-FR-75"],
+            "denied": ["EU-FR", "IN"],
+        }
+    }
+}
+
+
+def test_parent_allow_covers_child_regions():
+    decision = enforce_region_policy(
+        policy=HIERARCHY_POLICY,
+        region="EU-DE-BY",
+    )
+    assert decision.decision == DecisionType.ALLOW
+    assert decision.metadata == {"region": "EU-DE-BY", "matched_region": "EU"}
+
+
+def test_most_specific_region_rule_wins():
+    decisions = {
+        region: enforce_region_policy(policy=HIERARCHY_POLICY, region=region)
+        for region in ("EU-FR", "EU-FR-13", "EU-FR-75", "IN", "EUROPE")
+    }
+
+    assert decisions["EU-FR"].decision == DecisionType.BLOCK
+    assert decisions["EU-FR-13"].decision == DecisionType.BLOCK
+    assert decisions["EU-FR-13"].reason == "Region 'EU-FR-13' is denied by policy"
+    assert decisions["EU-FR-75"].decision == DecisionType.ALLOW
+    # Deny wins over an allow of the same code
+    assert decisions["IN"].decision == DecisionType.BLOCK
+    # Prefixes match whole levels only
+    assert decisions["EUROPE"].decision == DecisionType.BLOCK
+
+
+def test_block_metadata_does_not_copy_allowed_regions():
+    decision = enforce_region_policy(
+        policy=BASE_POLICY,
+        region="US-CA",
+    )
+    assert decision.decision == DecisionType.BLOCK
+    assert decision.metadata == {"region": "US-CA"}
@@ -0,0 +1,85 @@
+import asyncio
+import random
+
+from core.redaction.engine import RedactionEngine
+from core.redaction.streaming import StreamingRedactor
+
+
+TEXT = (
+    "Hi, reach me at jane.doe@example.com or 9876543210. "
+    "Card: 4111111111111111, ref 12345. Thanks!"
+)
+
+
+def _random_chunks(text, rng):
+    chunks = []
+    position = 0
+    while position < len(text):
+        size = rng.randint(1, 7)
+        chunks.append(text[position:position + size])
+        position += size
+    return chunks
+
+
+def test_stream_matches_batch_redaction_for_any_chunking():
+    expected = RedactionEngine().redact(TEXT)
+    rng = random.Random(11)
+
+    for _ in range(200):
+        redactor = StreamingRedactor()
+        output = "".join(redactor.redact_iter(_random_chunks(TEXT, rng)))
+
+        assert output == expected.text
+        assert redactor.redacted_entities == expected.redacted_entities
+
+
+def test_entity_split_across_chunks_is_held_back():
+    redactor = StreamingRedactor()
+
+    first = redactor.feed("mail jane.doe@exa")
+    second = redactor.feed("mple.com now")
+
+    assert first == "mail "
+    assert second == "[REDACTED_EMAIL] "
+    assert redactor.flush() == "now"
+
+
+def test_clean_text_is_released_early():
+    redactor = StreamingRedactor()
+
+    assert redactor.feed("Hello there, ") == "Hello there, "
+
+
+def test_window_bounds_held_back_text():
+    redactor = StreamingRedactor(max_window=16)
+
+    output = redactor.feed("x" * 40)
+
+    assert output == "x" * 24
+    assert redactor.flush() == "x" * 16
+
+
+def test_email_longer_than_window_is_still_redacted():
+    local = "a" * 2048
+    text = f"mail {local}@example.com now"
+    redactor = StreamingRedactor()
+
+    output = "".join(redactor.redact_iter(_random_chunks(text, random.Random(5))))
+
+    # The local part beyond the window was released before the "@"
+    # arrived; the rest of the email is redacted
+    assert output.startswith("mail " + "a" * 1024)
+    assert output.endswith("[REDACTED_EMAIL] now")
+    assert "example.com" not in output
+    assert redactor.redacted_entities == ["email"]
+
+
+def test_async_iterator_interface():
+    async def chunks():
+        for chunk in ["call 98765", "43210 now"]:
+            yield chunk
+
+    async def collect():
+        return [part async for part in StreamingRedactor().aredact_iter(chunks())]
+
+    assert "".join(asyncio.run(collect())) == "call [REDACTED_PHONE] now"
@@ -0,0 +1,150 @@
+import copy
+import json
+import os
+import pickle
+from pathlib import Path
+
+import pytest
+import yaml
+
+from core.audit.emitter import AuditEventEmitter
+from core.audit.sinks import AuditSink
+from core.decision import DecisionType
+from core.enforcement.orchestrator import EnforcementOrchestrator
+from core.policy.frozen import FrozenDict, FrozenList, freeze
+from core.policy.loader import load_policy
+from core.policy.registry import TenantPolicyRegistry
+
+
+BASE = {
+    "version": "0.1",
+    "metadata": {"owner": "platform-security"},
+    "model": {"allow": ["gpt-4.1", "llama-3.1-70b"], "deny": ["*-preview"]},
+    "data": {"pii": {"action": "redact"}, "regions": {"allowed": ["IN", "EU"]}},
+    "tools": {"allow": ["search"], "deny": ["shell"]},
+}
+
+
+class NullSink(AuditSink):
+    def write(self, event):
+        pass
+
+
+def write_policy(tmp: Path, name: str, content: dict):
+    path = tmp / name
+    with open(path, "w") as f:
+        yaml.dump(content, f)
+    return path
+
+
+@pytest.fixture
+def tenants(tmp_path):
+    write_policy(tmp_path, "base.yaml", BASE)
+    return {
+        "plain": write_policy(
+            tmp_path, "plain.yaml", {"version": "0.1", "extends": "base.yaml"}
+        ),
+        "us": write_policy(
+            tmp_path,
+            "us.yaml",
+            {
+                "version": "0.1",
+                "extends": "base.yaml",
+                "data": {"regions": {"allowed": ["US"]}},
+                "tools": None,
+            },
+        ),
+    }
+
+
+def test_resolution_matches_load_policy(tenants):
+    registry = TenantPolicyRegistry()
+
+    for tenant_id, path in tenants.items():
+        registry.add(tenant_id, path)
+        assert registry.get(tenant_id) == load_policy(path)
+
+
+def test_untouched_base_subtrees_are_shared(tenants):
+    registry = TenantPolicyRegistry()
+    for tenant_id, path in tenants.items():
+        registry.add(tenant_id, path)
+
+    plain, us = registry.get("plain"), registry.get("us")
+
+    assert plain["model"] is us["model"]
+    assert plain["data"]["pii"] is us["data"]["pii"]
+    assert plain["data"] is not us["data"]
+    assert "tools" not in us
+
+
+def test_policies_are_immutable(tenants):
+    registry = TenantPolicyRegistry()
+    policy = registry.add("plain", tenants["plain"])
+
+    with pytest.raises(TypeError):
+        policy["model"]["allow"].append("gpt-5")
+    with pytest.raises(TypeError):
+        policy["version"] = "0.2"
+    with pytest.raises(TypeError):
+        policy["data"].pop("pii")
+
+
+def test_frozen_nodes_copy_pickle_and_serialise():
+    frozen = freeze(BASE)
+
+    assert isinstance(frozen["model"]["allow"], FrozenList)
+    assert copy.deepcopy(frozen) is frozen
+    assert pickle.loads(pickle.dumps(frozen)) == BASE
+    assert isinstance(pickle.loads(pickle.dumps(frozen)), FrozenDict)
+    assert json.dumps(frozen, sort_keys=True) == json.dumps(BASE, sort_keys=True)
+
+
+def test_compiled_policy_enforces(tenants):
+    registry = TenantPolicyRegistry()
+    registry.add("us", tenants["us"])
+    orchestrator = EnforcementOrchestrator(audit_emitter=AuditEventEmitter([NullSink()]))
+
+    result = orchestrator.enforce(
+        registry.compiled("us"),
+        requested_model="gpt-4.1",
+        region="EU",
+    )
+
+    assert result["final_decision"].decision == DecisionType.BLOCK
+
+
+def test_invalid_policy_is_rejected(tmp_path):
+    path = write_policy(tmp_path, "bad.yaml", {"version": "0.1", "model": ["x"]})
+
+    with pytest.raises(ValueError, match="Invalid policy"):
+        TenantPolicyRegistry().add("bad", path)
+
+
+def test_base_change_applies_to_later_registrations(tmp_path, tenants):
+    registry = TenantPolicyRegistry()
+    registry.add("plain", tenants["plain"])
+
+    write_policy(tmp_path, "base.yaml", {**BASE, "model": {"allow": ["gpt-4o"]}})
+    st = os.stat(tmp_path / "base.yaml")
+    os.utime(tmp_path / "base.yaml", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    registry.add("plain", tenants["plain"])
+    assert registry.get("plain")["model"]["allow"] == ["gpt-4o"]
+
+
+def test_memory_footprint_reports_sharing(tmp_path, tenants):
+    registry = TenantPolicyRegistry()
+    for i in range(50):
+        path = write_policy(
+            tmp_path,
+            f"t{i}.yaml",
+            {"version": "0.1", "extends": "base.yaml", "metadata": {"tenant": f"t{i}"}},
+        )
+        registry.add(f"t{i}", path)
+
+    footprint = registry.memory_footprint()
+
+    assert footprint.tenants == 50
+    assert footprint.bytes < footprint.unshared_bytes
+    assert footprint.sharing_ratio > 2